@@ -15,7 +15,7 @@ from pvforecast.confidence import (
     compute_confidence,
     get_forecast_cloud_cover,
 )
-from pvforecast.config import Config, get_config_path
+from pvforecast.config import Config, _model_meta_path, get_config_path
 from pvforecast.data_loader import import_csv_files
 from pvforecast.db import Database
 from pvforecast.doctor import Doctor
@@ -24,6 +24,7 @@ from pvforecast.forecast_accuracy import (
     format_accuracy_report,
 )
 from pvforecast.model import (
+    MODEL_NAMES,
     ModelNotFoundError,
     evaluate,
     load_model,
@@ -118,13 +119,13 @@ def cmd_fetch_forecast(args: argparse.Namespace, config: Config) -> int:
         print(f"{'Zeit':18} {'GHI':>8} {'Wolken':>8} {'Temp':>8} {'DHI':>8}")
         print("-" * 70)
 
-        for _, row in weather_df.head(24).iterrows():
-            dt = datetime.fromtimestamp(row["timestamp"], tz)
+        table = weather_df.head(24).reindex(
+            columns=["timestamp", "ghi_wm2", "cloud_cover_pct", "temperature_c", "dhi_wm2"],
+            fill_value=0,
+        )
+        for ts, ghi, cloud, temp, dhi in table.itertuples(index=False, name=None):
+            dt = datetime.fromtimestamp(ts, tz)
             time_str = dt.strftime("%d.%m. %H:%M")
-            ghi = row.get("ghi_wm2", 0)
-            cloud = row.get("cloud_cover_pct", 0)
-            temp = row.get("temperature_c", 0)
-            dhi = row.get("dhi_wm2", 0)
             emoji = get_weather_emoji(int(cloud))
 
             print(f"{time_str:18} {ghi:>7.0f}W {cloud:>6}% {emoji} {temp:>6.1f}°C {dhi:>7.1f}W")
@@ -279,22 +280,25 @@ def cmd_fetch_historical(args: argparse.Namespace, config: Config) -> int:
     # Save to database
     db = Database(config.db_path)
 
-    # Convert DataFrame to records for DB insert
-    records = []
-    for idx, row in weather_df.iterrows():
-        ts = idx.timestamp() if hasattr(idx, "timestamp") else idx
-        records.append(
-            (
-                int(ts),
-                float(row.get("ghi_wm2", 0)),
-                float(row.get("cloud_cover_pct", 0)),
-                float(row.get("temperature_c", 0)),
-                float(row.get("wind_speed_ms", 0)),
-                float(row.get("humidity_pct", 0)),
-                float(row.get("dhi_wm2", 0)),
-                float(row.get("dni_wm2", 0)),
-            )
+    # Convert DataFrame to records for DB insert (missing columns → 0)
+    columns = [
+        "ghi_wm2",
+        "cloud_cover_pct",
+        "temperature_c",
+        "wind_speed_ms",
+        "humidity_pct",
+        "dhi_wm2",
+        "dni_wm2",
+    ]
+    records = [
+        (
+            int(idx.timestamp() if hasattr(idx, "timestamp") else idx),
+            *(float(v) for v in values),
+        )
+        for idx, *values in weather_df.reindex(columns=columns, fill_value=0).itertuples(
+            name=None
         )
+    ]
 
     if records:
         with db.connect() as conn:
@@ -597,7 +601,7 @@ def cmd_train(args: argparse.Namespace, config: Config) -> int:
     model_type = getattr(args, "model", "rf")
     since_year = getattr(args, "since", None)
     until_year = getattr(args, "until", None)
-    model_name = "XGBoost" if model_type == "xgb" else "RandomForest"
+    model_name = MODEL_NAMES[model_type]
 
     if since_year and until_year:
         qprint(f"🧠 Trainiere {model_name} Modell (Daten {since_year}-{until_year})...")
@@ -687,7 +691,7 @@ def cmd_tune(args: argparse.Namespace, config: Config) -> int:
     timeout = getattr(args, "timeout", None)
     since_year = getattr(args, "since", None)
     until_year = getattr(args, "until", None)
-    model_name = "XGBoost" if model_type == "xgb" else "RandomForest"
+    model_name = MODEL_NAMES[model_type]
     method_name = "Optuna" if method == "optuna" else "RandomizedSearchCV"
 
     qprint()
@@ -804,8 +808,7 @@ def cmd_status(args: argparse.Namespace, config: Config) -> int:
     print(f"💾 Datenbank: {config.db_path}")
     if config.db_path.exists():
         db = Database(config.db_path)
-        pv_count = db.get_pv_count()
-        weather_count = db.get_weather_count()
+        pv_count, weather_count = db.get_counts()
 
         print(f"   PV-Datensätze: {pv_count}")
         print(f"   Wetter-Datensätze: {weather_count}")
@@ -1027,6 +1030,9 @@ def cmd_reset(args: argparse.Namespace, config: Config) -> int:
     for file_path in files_to_delete:
         try:
             file_path.unlink()
+            if file_path == model_path:
+                # Metadaten-Datei von save_model mit entfernen
+                _model_meta_path(model_path).unlink(missing_ok=True)
             print(f"✅ Gelöscht: {file_path}")
         except PermissionError:
             print(f"❌ Keine Berechtigung: {file_path}")
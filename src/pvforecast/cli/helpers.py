@@ -120,19 +120,21 @@ def _archive_forecast(config: Config, weather_df: pd.DataFrame, source: str) ->
     db = Database(config.db_path)
     issued_at = int(datetime.now(UTC_TZ).timestamp())
 
-    # Convert DataFrame to list of dicts for storage
-    forecasts = []
-    for _, row in weather_df.iterrows():
-        forecasts.append({
-            "target_time": int(row["timestamp"]),
-            "ghi_wm2": row.get("ghi_wm2"),
-            "cloud_cover_pct": row.get("cloud_cover_pct"),
-            "temperature_c": row.get("temperature_c"),
-            "wind_speed_ms": row.get("wind_speed_ms"),
-            "humidity_pct": row.get("humidity_pct"),
-            "dhi_wm2": row.get("dhi_wm2"),
-            "dni_wm2": row.get("dni_wm2"),
-        })
+    # Convert DataFrame to list of dicts for storage (missing columns → None)
+    fields = [
+        "ghi_wm2",
+        "cloud_cover_pct",
+        "temperature_c",
+        "wind_speed_ms",
+        "humidity_pct",
+        "dhi_wm2",
+        "dni_wm2",
+    ]
+    present = [f for f in fields if f in weather_df.columns]
+    forecasts = [
+        {"target_time": int(ts), **dict(zip(present, values))}
+        for ts, *values in weather_df[["timestamp", *present]].itertuples(index=False, name=None)
+    ]
 
     count = db.store_forecast(issued_at, source, forecasts)
     if count > 0:
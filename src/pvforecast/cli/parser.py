@@ -176,9 +176,9 @@ def create_parser() -> argparse.ArgumentParser:
     p_train = subparsers.add_parser("train", help="Trainiert das ML-Modell")
     p_train.add_argument(
         "--model",
-        choices=["rf", "xgb"],
+        choices=["rf", "xgb", "hgb"],
         default="rf",
-        help="Modell-Typ: rf=RandomForest (default), xgb=XGBoost",
+        help="Modell-Typ: rf=RandomForest (default), xgb=XGBoost, hgb=HistGradientBoosting",
     )
     p_train.add_argument(
         "--since",
@@ -206,9 +206,9 @@ def create_parser() -> argparse.ArgumentParser:
     p_tune = subparsers.add_parser("tune", help="Hyperparameter-Tuning")
     p_tune.add_argument(
         "--model",
-        choices=["rf", "xgb"],
+        choices=["rf", "xgb", "hgb"],
         default="xgb",
-        help="Modell-Typ: rf=RandomForest, xgb=XGBoost (default)",
+        help="Modell-Typ: rf=RandomForest, xgb=XGBoost (default), hgb=HistGradientBoosting",
     )
     p_tune.add_argument(
         "--method",
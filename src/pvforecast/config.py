@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -11,14 +12,24 @@ import yaml
 logger = logging.getLogger(__name__)
 
 
+# Standard-Pfade hängen nur von HOME ab und werden pro Prozess einmal
+# berechnet (Path ist unveränderlich, die Instanzen können geteilt werden)
+@lru_cache(maxsize=1)
 def _default_db_path() -> Path:
     return Path.home() / ".local" / "share" / "pvforecast" / "data.db"
 
 
+@lru_cache(maxsize=1)
 def _default_model_path() -> Path:
     return Path.home() / ".local" / "share" / "pvforecast" / "model.pkl"
 
 
+def _model_meta_path(model_path: Path) -> Path:
+    """Metadaten-Datei neben dem Modell (model_type, mape; ohne Pickle lesbar)."""
+    return model_path.with_suffix(".meta.json")
+
+
+@lru_cache(maxsize=1)
 def _default_config_path() -> Path:
     return Path.home() / ".config" / "pvforecast" / "config.yaml"
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import sqlite3
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -129,13 +130,13 @@ def load_e3dc_csv(csv_path: Path) -> pd.DataFrame:
     return df
 
 
-def import_to_db(df: pd.DataFrame, db: Database) -> int:
+def _insert_readings(conn: sqlite3.Connection, df: pd.DataFrame) -> int:
     """
-    Importiert DataFrame in SQLite-Datenbank.
+    Fügt Datensätze über eine bestehende Verbindung ein (ohne Commit).
 
     Args:
+        conn: Offene SQLite-Verbindung
         df: DataFrame von load_e3dc_csv()
-        db: Database-Instanz
 
     Returns:
         Anzahl neu eingefügter Zeilen
@@ -165,20 +166,35 @@ def import_to_db(df: pd.DataFrame, db: Database) -> int:
         return val
 
     # Alle Zeilen in Liste von Tupeln konvertieren (für executemany)
-    # itertuples() ist ~100x schneller als iterrows()
+    # itertuples(name=None) liefert rohe Tupel ohne namedtuple-Overhead
     all_values = [
-        tuple(to_python(getattr(row, c, None)) for c in columns)
-        for row in df[columns].itertuples(index=False)
+        tuple(to_python(val) for val in row)
+        for row in df[columns].itertuples(index=False, name=None)
     ]
 
     # SQL-Statement bauen (Spalten sind aus interner Konstante, nicht User-Input)
     sql = "INSERT OR IGNORE INTO pv_readings (" + column_names + ") VALUES (" + placeholders + ")"
 
+    # total_changes zählt nur tatsächlich eingefügte Zeilen (IGNORE zählt nicht),
+    # spart zwei COUNT(*)-Scans über die ganze Tabelle
+    before = conn.total_changes
+    conn.executemany(sql, all_values)
+    return conn.total_changes - before
+
+
+def import_to_db(df: pd.DataFrame, db: Database) -> int:
+    """
+    Importiert DataFrame in SQLite-Datenbank.
+
+    Args:
+        df: DataFrame von load_e3dc_csv()
+        db: Database-Instanz
+
+    Returns:
+        Anzahl neu eingefügter Zeilen
+    """
     with db.connect() as conn:
-        before = conn.execute("SELECT COUNT(*) FROM pv_readings").fetchone()[0]
-        conn.executemany(sql, all_values)
-        after = conn.execute("SELECT COUNT(*) FROM pv_readings").fetchone()[0]
-        inserted = after - before
+        inserted = _insert_readings(conn, df)
 
     logger.debug(f"Importiert: {inserted} neue Datensätze")
     return inserted
@@ -188,6 +204,8 @@ def import_csv_files(csv_paths: list[Path], db: Database) -> int:
     """
     Importiert mehrere CSV-Dateien.
 
+    Wie ``import_csv_files_with_errors``, liefert aber nur die Anzahl.
+
     Args:
         csv_paths: Liste von CSV-Pfaden
         db: Database-Instanz
@@ -195,14 +213,63 @@ def import_csv_files(csv_paths: list[Path], db: Database) -> int:
     Returns:
         Gesamtzahl neu eingefügter Zeilen
     """
+    total, _ = import_csv_files_with_errors(csv_paths, db)
+    return total
+
+
+def import_csv_files_with_errors(
+    csv_paths: list[Path], db: Database
+) -> tuple[int, list[tuple[Path, Exception]]]:
+    """
+    Importiert mehrere CSV-Dateien und meldet übersprungene Dateien.
+
+    Alle Dateien werden in einer Transaktion geschrieben, der Commit
+    (fsync) fällt so nur einmal statt pro Datei an. Jede Datei läuft in
+    einem eigenen SAVEPOINT: ungültige Dateien (DataImportError) bzw.
+    Konflikte beim Einfügen (IntegrityError) werden nur für diese Datei
+    zurückgerollt und übersprungen. Andere Datenbankfehler (z.B.
+    "database is locked") brechen den gesamten Import ab.
+
+    Args:
+        csv_paths: Liste von CSV-Pfaden
+        db: Database-Instanz
+
+    Returns:
+        (Gesamtzahl neu eingefügter Zeilen, Liste (Pfad, Fehler) übersprungener Dateien)
+
+    Raises:
+        sqlite3.Error: Bei Datenbankfehlern außer IntegrityError (nichts importiert)
+    """
     total = 0
     n_files = len(csv_paths)
-    for i, path in enumerate(csv_paths, 1):
-        try:
-            df = load_e3dc_csv(path)
-            count = import_to_db(df, db)
+    imported: list[tuple[int, str, int]] = []
+    failures: list[tuple[Path, Exception]] = []
+    with db.connect() as conn:
+        # Explizite äußere Transaktion: sonst würde RELEASE des ersten
+        # SAVEPOINTs bereits committen
+        conn.execute("BEGIN")
+        for i, path in enumerate(csv_paths, 1):
+            try:
+                df = load_e3dc_csv(path)
+            except DataImportError as e:
+                logger.error(f"[{i}/{n_files}] Fehler bei {path}: {e}")
+                failures.append((path, e))
+                continue
+
+            conn.execute("SAVEPOINT import_file")
+            try:
+                count = _insert_readings(conn, df)
+            except sqlite3.IntegrityError as e:
+                conn.execute("ROLLBACK TO import_file")
+                conn.execute("RELEASE import_file")
+                logger.error(f"[{i}/{n_files}] Fehler bei {path}: {e}")
+                failures.append((path, e))
+                continue
+            conn.execute("RELEASE import_file")
             total += count
-            logger.info(f"[{i}/{n_files}] {path.name}: {count} neue Datensätze")
-        except DataImportError as e:
-            logger.error(f"[{i}/{n_files}] Fehler bei {path}: {e}")
-    return total
+            imported.append((i, path.name, count))
+
+    # Erst nach dem Commit melden, was tatsächlich in der DB gelandet ist
+    for i, name, count in imported:
+        logger.info(f"[{i}/{n_files}] {name}: {count} neue Datensätze")
+    return total, failures
@@ -102,6 +102,30 @@ CREATE INDEX IF NOT EXISTS idx_forecast_issued ON forecast_history(issued_at);
 """
 
 
+def _db_fingerprint(db_path: Path) -> tuple[int, ...]:
+    """Liefert (mtime_ns, size) von DB- und WAL-Datei für Cache-Invalidierung.
+
+    Jeder Schreibzugriff auf die SQLite-Datenbank ändert mindestens eine der
+    beiden Dateien, ein gecachter Datensatz wird damit automatisch ungültig.
+    """
+    fingerprint: list[int] = []
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        try:
+            stat = path.stat()
+            fingerprint.extend((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprint.extend((0, 0))
+    return tuple(fingerprint)
+
+
+def _counts(conn: sqlite3.Connection) -> tuple[int, int]:
+    """(PV-Anzahl, Wetter-Anzahl) exakt in einer Abfrage."""
+    pv_count, weather_count = conn.execute(
+        "SELECT (SELECT COUNT(*) FROM pv_readings), (SELECT COUNT(*) FROM weather_history)"
+    ).fetchone()
+    return pv_count, weather_count
+
+
 class Database:
     """SQLite Datenbank-Wrapper für pvforecast."""
 
@@ -187,6 +211,8 @@ class Database:
         """Context manager für Datenbankverbindung."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # Im WAL-Mode sicher: kein fsync pro Commit, nur bei Checkpoints
+        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
             conn.commit()
@@ -202,12 +228,28 @@ class Database:
             result = conn.execute("SELECT COUNT(*) FROM pv_readings").fetchone()
             return result[0] if result else 0
 
+    def get_counts(self) -> tuple[int, int]:
+        """Anzahl PV- und Wetter-Datensätze in einer Abfrage."""
+        with self.connect() as conn:
+            return _counts(conn)
+
     def get_weather_count(self) -> int:
         """Anzahl Wetter-Datensätze."""
         with self.connect() as conn:
             result = conn.execute("SELECT COUNT(*) FROM weather_history").fetchone()
             return result[0] if result else 0
 
+    def has_weather_records(self, n: int = 1) -> bool:
+        """Prüft ob mindestens ``n`` Wetter-Datensätze vorhanden sind.
+
+        Bricht nach ``n`` Zeilen ab statt wie COUNT(*) die ganze Tabelle zu lesen.
+        """
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM weather_history LIMIT 1 OFFSET ?", (n - 1,)
+            ).fetchone()
+            return row is not None
+
     def get_pv_date_range(self) -> tuple[int | None, int | None]:
         """Gibt (min_timestamp, max_timestamp) der PV-Daten zurück."""
         with self.connect() as conn:
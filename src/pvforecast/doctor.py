@@ -163,8 +163,7 @@ class Doctor:
 
             db = Database(db_path)
 
-            pv_count = db.get_pv_count()
-            weather_count = db.get_weather_count()
+            pv_count, weather_count = db.get_counts()
 
             if pv_count == 0:
                 self._add_result(
@@ -8,9 +8,15 @@ Dokumentation: https://nominatim.org/release-docs/latest/api/Search/
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
+import socket
+import threading
 import time
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
 
 import httpx
 
@@ -19,7 +25,8 @@ from pvforecast import __version__
 logger = logging.getLogger(__name__)
 
 # Nominatim API Konfiguration
-NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+NOMINATIM_HOST = "nominatim.openstreetmap.org"
+NOMINATIM_URL = f"https://{NOMINATIM_HOST}/search"
 USER_AGENT = f"pvforecast/{__version__} (https://github.com/jarvis-schlappa/pv-forecast)"
 
 # Rate-Limiting: Zeitpunkt des letzten Requests
@@ -31,6 +38,15 @@ DEFAULT_TIMEOUT = 10.0  # Sekunden
 MAX_RETRIES = 3
 RETRY_DELAY = 2.0  # Sekunden zwischen Retries
 
+# Persistenter Cache für erfolgreiche Abfragen (spart Requests bei Wiederholung)
+GEOCODE_CACHE_PATH = Path.home() / ".cache" / "pvforecast" / "geocode.json"
+GEOCODE_CACHE_MAX_ENTRIES = 500
+
+# Gemeinsamer HTTP-Client: Retries und Folgeabfragen nutzen dieselbe
+# Keep-Alive-Verbindung statt jeweils neuem TLS-Handshake
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
 
 class GeocodingError(Exception):
     """Fehler bei der Geocoding-Abfrage."""
@@ -86,6 +102,32 @@ def _enforce_rate_limit() -> None:
     _last_request_time = time.monotonic()
 
 
+def _get_client() -> httpx.Client:
+    """Liefert den modulweiten HTTP-Client (wird beim ersten Aufruf erstellt)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                limits=httpx.Limits(max_connections=2, max_keepalive_connections=1),
+            )
+    return _client
+
+
+def prewarm() -> None:
+    """Bereitet die erste Abfrage vor, ohne einen Request an Nominatim zu senden.
+
+    Erstellt den HTTP-Client (SSL-Kontext inkl. CA-Bundle) und löst den
+    Nominatim-Host auf (nützt bei cachendem Resolver, z.B. macOS oder
+    systemd-resolved). Gedacht für einen Hintergrund-Thread, während der
+    Benutzer noch tippt; Fehler werden ignoriert.
+    """
+    try:
+        _get_client()
+        socket.getaddrinfo(NOMINATIM_HOST, 443, type=socket.SOCK_STREAM)
+    except OSError as e:
+        logger.debug(f"Geocoding-Vorbereitung fehlgeschlagen: {e}")
+
+
 def _parse_address(address: dict) -> tuple[str | None, str | None, str | None, str | None]:
     """Extrahiert Stadt, Bundesland, Land und Ländercode aus Nominatim-Adresse.
 
@@ -110,19 +152,97 @@ def _parse_address(address: dict) -> tuple[str | None, str | None, str | None, s
     return city, state, country, country_code
 
 
+@functools.lru_cache(maxsize=1)
+def _load_cache(path: Path) -> dict[str, dict]:
+    """Lädt den Geocoding-Cache einmal pro Prozess (leer wenn fehlt/defekt)."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_cache(path: Path, cache: dict[str, dict]) -> None:
+    """Schreibt den Cache atomar (temporäre Datei + replace)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.debug(f"Geocoding-Cache nicht geschrieben: {e}")
+
+
+def _cached_geocode(
+    func: Callable[..., GeoResult | None],
+) -> Callable[..., GeoResult | None]:
+    """Decorator: beantwortet wiederholte Abfragen aus ``GEOCODE_CACHE_PATH``.
+
+    Schlüssel ist die normalisierte Anfrage (klein, Leerzeichen zusammengefasst)
+    plus Länder-Einschränkung. Nur Treffer werden gespeichert; bei mehr als
+    ``GEOCODE_CACHE_MAX_ENTRIES`` Einträgen fliegt der am längsten nicht
+    genutzte Eintrag raus.
+    """
+
+    @functools.wraps(func)
+    def wrapper(
+        query: str,
+        country_codes: str | None = "de,at,ch",
+        timeout: float = DEFAULT_TIMEOUT,
+        client: httpx.Client | None = None,
+    ) -> GeoResult | None:
+        if not query or not query.strip():
+            return None
+
+        # Normalisiert: Groß-/Kleinschreibung und Leerzeichen ("44787  Bochum") egal
+        key = f"{' '.join(query.lower().split())}|{country_codes or ''}"
+        cache = _load_cache(GEOCODE_CACHE_PATH)
+
+        cached = cache.pop(key, None)
+        stale = False
+        if cached is not None:
+            try:
+                result = GeoResult(**cached)
+            except (TypeError, ValueError):
+                # Veralteter oder defekter Eintrag: wie Cache-Miss behandeln,
+                # Eintrag bleibt entfernt (bzw. wird durch neues Ergebnis ersetzt)
+                logger.debug(f"Ungültiger Geocoding-Cache-Eintrag verworfen: '{key}'")
+                stale = True
+            else:
+                cache[key] = cached  # ans Ende: zuletzt genutzt
+                logger.debug(f"Geocoding aus Cache: '{query.strip()}'")
+                return result
+
+        result = func(query, country_codes=country_codes, timeout=timeout, client=client)
+        if result is not None:
+            cache[key] = asdict(result)
+            while len(cache) > GEOCODE_CACHE_MAX_ENTRIES:
+                cache.pop(next(iter(cache)))
+        if result is not None or stale:
+            _save_cache(GEOCODE_CACHE_PATH, cache)
+        return result
+
+    return wrapper
+
+
+@_cached_geocode
 def geocode(
     query: str,
     country_codes: str | None = "de,at,ch",
     timeout: float = DEFAULT_TIMEOUT,
+    client: httpx.Client | None = None,
 ) -> GeoResult | None:
     """Sucht Koordinaten für eine PLZ oder einen Ortsnamen.
 
+    Erfolgreiche Ergebnisse werden lokal gecacht (siehe ``_cached_geocode``).
+
     Args:
         query: Suchbegriff (PLZ, Ortsname, oder Kombination wie "44787 Bochum")
         country_codes: Komma-getrennte ISO 3166-1 alpha-2 Ländercodes zur Einschränkung.
                       Default: "de,at,ch" (Deutschland, Österreich, Schweiz).
                       None für weltweite Suche.
         timeout: Timeout in Sekunden
+        client: Optionaler HTTP-Client (Default: modulweiter Client mit Keep-Alive)
 
     Returns:
         GeoResult bei Erfolg, None wenn nichts gefunden
@@ -151,16 +271,18 @@ def geocode(
         "Accept": "application/json",
     }
 
+    if client is None:
+        client = _get_client()
+
     last_error: Exception | None = None
 
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             _enforce_rate_limit()
 
-            with httpx.Client(timeout=timeout) as client:
-                response = client.get(NOMINATIM_URL, params=params, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+            response = client.get(NOMINATIM_URL, params=params, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            data = response.json()
 
             if not data:
                 logger.debug(f"Keine Ergebnisse für '{query}'")
@@ -216,6 +338,7 @@ def geocode_postal_code(
     postal_code: str,
     country_code: str = "de",
     timeout: float = DEFAULT_TIMEOUT,
+    client: httpx.Client | None = None,
 ) -> GeoResult | None:
     """Sucht Koordinaten für eine Postleitzahl.
 
@@ -225,6 +348,7 @@ def geocode_postal_code(
         postal_code: Postleitzahl (z.B. "44787")
         country_code: ISO 3166-1 alpha-2 Ländercode (default: "de")
         timeout: Timeout in Sekunden
+        client: Optionaler HTTP-Client (Default: modulweiter Client mit Keep-Alive)
 
     Returns:
         GeoResult bei Erfolg, None wenn nichts gefunden
@@ -252,18 +376,22 @@ def geocode_postal_code(
         "Accept": "application/json",
     }
 
+    if client is None:
+        client = _get_client()
+
     try:
         _enforce_rate_limit()
 
-        with httpx.Client(timeout=timeout) as client:
-            response = client.get(NOMINATIM_URL, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        response = client.get(NOMINATIM_URL, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        data = response.json()
 
         if not data:
             # Fallback: Freie Suche mit PLZ
             logger.debug("Strukturierte PLZ-Suche ohne Ergebnis, versuche Freitext")
-            return geocode(postal_code, country_codes=country_code, timeout=timeout)
+            return geocode(
+                postal_code, country_codes=country_code, timeout=timeout, client=client
+            )
 
         result = data[0]
         address = result.get("address", {})
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
+import os
+import sqlite3
+import tempfile
+import warnings
+from contextlib import closing
+from dataclasses import astuple, dataclass
 from datetime import datetime
-from math import asin, cos, degrees, pi, radians, sin
+from functools import lru_cache
+from math import cos, pi, radians, sin
 from pathlib import Path
 from typing import Literal
 from zoneinfo import ZoneInfo
@@ -14,7 +22,7 @@ import joblib
 import numpy as np
 import pandas as pd
 from scipy.stats import randint, uniform
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
 from sklearn.metrics import (
     mean_absolute_error,
     mean_absolute_percentage_error,
@@ -25,7 +33,9 @@ from sklearn.model_selection import RandomizedSearchCV, TimeSeriesSplit
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
-from pvforecast.db import Database
+from pvforecast import __version__
+from pvforecast.config import PVArrayConfig, _model_meta_path
+from pvforecast.db import Database, _db_fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +87,9 @@ def reload_xgboost() -> bool:
         # Frischer Import-Versuch
         import importlib
 
+        # Die Finder von sys.path cachen Verzeichnisinhalte; ohne Invalidierung
+        # kann das gerade installierte Paket unsichtbar bleiben
+        importlib.invalidate_caches()
         xgb_module = importlib.import_module("xgboost")
         XGBRegressor = xgb_module.XGBRegressor
         XGBOOST_AVAILABLE = True
@@ -109,7 +122,59 @@ except ImportError:
     logger.debug("pvlib nicht installiert - CSI nicht verfügbar")
 
 # Verfügbare Modell-Typen
-ModelType = Literal["rf", "xgb"]
+ModelType = Literal["rf", "xgb", "hgb"]
+
+# Anzeigenamen der Modell-Typen (Logging/CLI)
+MODEL_NAMES: dict[str, str] = {
+    "rf": "RandomForest",
+    "xgb": "XGBoost",
+    "hgb": "HistGradientBoosting",
+}
+
+# Histogramm-basierter Baumaufbau für XGBoost (max_bin muss mit QuantileDMatrix übereinstimmen)
+XGB_TREE_PARAMS = {"tree_method": "hist", "max_bin": 256}
+
+
+@lru_cache(maxsize=1)
+def _xgb_device() -> str:
+    """
+    Ermittelt das XGBoost-Device ("cuda" wenn eine nutzbare GPU vorhanden ist).
+
+    Prüft, ob XGBoost mit CUDA gebaut wurde, und trainiert dann testweise einen
+    einzelnen Baum auf der GPU. Das Ergebnis wird pro Prozess gecacht.
+
+    Returns:
+        "cuda" oder "cpu"
+    """
+    if not XGBOOST_AVAILABLE:
+        return "cpu"
+
+    try:
+        import xgboost as xgb
+
+        if not xgb.build_info().get("USE_CUDA"):
+            return "cpu"
+
+        # Ohne GPU fällt XGBoost stillschweigend auf CPU zurück, daher das
+        # tatsächlich verwendete Device aus der Booster-Konfiguration lesen
+        probe = xgb.DMatrix(np.zeros((2, 1), dtype=np.float32), label=[0.0, 1.0])
+        with xgb.config_context(verbosity=0):
+            booster = xgb.train({"device": "cuda", "tree_method": "hist"}, probe, 1)
+        device = json.loads(booster.save_config())["learner"]["generic_param"]["device"]
+    except Exception as e:
+        logger.debug(f"XGBoost GPU-Prüfung fehlgeschlagen, verwende CPU: {e}")
+        return "cpu"
+
+    if not device.startswith("cuda"):
+        return "cpu"
+
+    logger.info("XGBoost: GPU (CUDA) erkannt")
+    return "cuda"
+
+
+def _xgb_params() -> dict:
+    """Baumaufbau-Parameter für XGBoost inkl. automatisch gewähltem Device."""
+    return {**XGB_TREE_PARAMS, "device": _xgb_device()}
 
 
 class ModelNotFoundError(Exception):
@@ -195,11 +260,33 @@ def encode_cyclic(values: pd.Series, max_value: float) -> tuple[pd.Series, pd.Se
     return np.sin(angle), np.cos(angle)
 
 
+def _time_components(ts: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Zerlegt Unix-Timestamps (UTC) in Stunde, Monat und Tag des Jahres.
+
+    Arbeitet direkt auf dem int64-Array statt über ``Series.dt``-Accessoren.
+
+    Args:
+        ts: Unix timestamps in Sekunden (int64)
+
+    Returns:
+        Tuple aus (Stunde 0-23, Monat 1-12, Tag des Jahres 1-366)
+    """
+    seconds = ts.astype("datetime64[s]")
+    years = seconds.astype("datetime64[Y]")
+
+    hours = (ts // 3600) % 24
+    months = (seconds.astype("datetime64[M]") - years).astype(np.int64) + 1
+    day_of_year = (seconds.astype("datetime64[D]") - years).astype(np.int64) + 1
+
+    return hours, months, day_of_year
+
+
 def calculate_sun_elevation(timestamp: int, lat: float, lon: float) -> float:
     """
     Berechnet die Sonnenhöhe (Elevation) für einen Zeitpunkt.
 
-    Vereinfachte Formel, ausreichend für ML-Features.
+    Skalar-Wrapper um ``_solar_elevation_j2000``.
 
     Args:
         timestamp: Unix timestamp (UTC)
@@ -209,32 +296,53 @@ def calculate_sun_elevation(timestamp: int, lat: float, lon: float) -> float:
     Returns:
         Sonnenhöhe in Grad (-90 bis 90, negativ = unter Horizont)
     """
-    dt = datetime.fromtimestamp(timestamp, UTC_TZ)
+    return float(_solar_elevation_j2000(np.array([timestamp], dtype=np.int64), lat, lon)[0])
 
-    # Tag des Jahres
-    day_of_year = dt.timetuple().tm_yday
 
-    # Deklination der Sonne (vereinfacht)
-    declination = -23.45 * cos(radians(360 / 365 * (day_of_year + 10)))
+def _solar_elevation_j2000(ts_arr_s: np.ndarray, lat: float, lon: float) -> np.ndarray:
+    """
+    Vektorisierte Sonnenhöhe nach der J2000-Näherung (Astronomical Almanac).
 
-    # Stundenwinkel
-    hour = dt.hour + dt.minute / 60
-    solar_time = hour + lon / 15  # Grobe Annäherung
-    hour_angle = 15 * (solar_time - 12)
+    Berücksichtigt Mittelpunktsgleichung und Zeitgleichung über die
+    Rektaszension, Genauigkeit im Bereich von Bogenminuten.
 
-    # Sonnenhöhe
-    lat_rad = radians(lat)
-    dec_rad = radians(declination)
-    ha_rad = radians(hour_angle)
+    Args:
+        ts_arr_s: Unix timestamps (UTC, Sekunden)
+        lat: Breitengrad
+        lon: Längengrad
 
-    sin_elevation = sin(lat_rad) * sin(dec_rad) + cos(lat_rad) * cos(dec_rad) * cos(ha_rad)
+    Returns:
+        Sonnenhöhe in Grad als float64-Array
+    """
+    ts = np.asarray(ts_arr_s, dtype=np.float64)
 
-    # Clamp to [-1, 1] to avoid math domain errors
-    sin_elevation = max(-1, min(1, sin_elevation))
+    # Tage seit J2000.0 (2000-01-01 12:00 UTC)
+    n = ts / 86400 - 10957.5
 
-    elevation = degrees(asin(sin_elevation))
+    # Mittlere Länge und mittlere Anomalie der Sonne (Tagesbewegung wird für
+    # die Sternzeit wiederverwendet)
+    daily_motion = 0.9856474 * n
+    L = (280.460 + daily_motion) % 360
+    g = np.radians((357.528 + 0.9856003 * n) % 360)
 
-    return elevation
+    # Ekliptikale Länge und Schiefe der Ekliptik
+    lam = np.radians(L + 1.915 * np.sin(g) + 0.020 * np.sin(2 * g))
+    eps = np.radians(23.439 - 4e-7 * n)
+
+    # Deklination und Rektaszension
+    sin_lam = np.sin(lam)
+    dec = np.arcsin(np.sin(eps) * sin_lam)
+    ra = np.degrees(np.arctan2(np.cos(eps) * sin_lam, np.cos(lam)))
+
+    # Lokale Sternzeit → Stundenwinkel
+    local_sidereal = (100.46 + daily_motion + lon + 15 * (ts / 3600 % 24)) % 360
+    hour_angle = np.radians(local_sidereal - ra)
+
+    # Breitengrad ist konstant: einmal skalar berechnen statt pro Element
+    lat_rad = radians(lat)
+    sin_elevation = sin(lat_rad) * np.sin(dec) + cos(lat_rad) * np.cos(dec) * np.cos(hour_angle)
+
+    return np.degrees(np.arcsin(np.clip(sin_elevation, -1, 1)))
 
 
 def calculate_poa_features(
@@ -336,147 +444,138 @@ def prepare_features(
             - "predict": Prognose für Zukunft (keine Produktions-Lags)
 
     Returns:
-        DataFrame mit Features inkl. Wetter-Lags und Produktions-Lags
+        DataFrame (float32) mit Features inkl. Wetter-Lags und Produktions-Lags
     """
-    features = pd.DataFrame()
-
-    # Zeitbasierte Features (zyklisch kodiert)
-    timestamps = pd.to_datetime(df["timestamp"], unit="s", utc=True)
-    hours = timestamps.dt.hour
-    months = timestamps.dt.month
-    day_of_year = timestamps.dt.dayofyear
+    n = len(df)
+    # Alle Spalten zuerst als NumPy-Arrays sammeln, DataFrame am Ende in einem Schritt
+    # bauen (Reihenfolge der Keys = Spaltenreihenfolge, muss stabil bleiben)
+    cols: dict[str, np.ndarray] = {}
+
+    def column(name: str, default: float) -> np.ndarray:
+        """Optionale Spalte als float64-Array, fehlende Werte/Spalte -> default."""
+        if name not in df.columns:
+            return np.full(n, default, dtype=np.float64)
+        values = df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        return np.nan_to_num(values, nan=default)
+
+    # Zeitbasierte Features (zyklisch kodiert), direkt aus den int64-Timestamps
+    ts = df["timestamp"].to_numpy(dtype=np.int64)
+    hours, months, day_of_year = _time_components(ts)
 
     # Zyklische Kodierung: sin/cos statt linearer Werte
     # So lernt das Modell, dass Stunde 23 und 0 benachbart sind
-    features["hour_sin"], features["hour_cos"] = encode_cyclic(hours, 24)
-    features["month_sin"], features["month_cos"] = encode_cyclic(months, 12)
-    features["doy_sin"], features["doy_cos"] = encode_cyclic(day_of_year, 365)
+    cols["hour_sin"], cols["hour_cos"] = encode_cyclic(hours, 24)
+    cols["month_sin"], cols["month_cos"] = encode_cyclic(months, 12)
+    cols["doy_sin"], cols["doy_cos"] = encode_cyclic(day_of_year, 365)
 
     # Wetter-Features (Basis) - negative Werte auf 0 setzen (Datenqualität)
-    features["ghi"] = df["ghi_wm2"].clip(lower=0)
+    ghi = np.clip(df["ghi_wm2"].to_numpy(dtype=np.float64, na_value=np.nan), 0, None)
+    cols["ghi"] = ghi
     # cloud_cover wird NICHT als Feature verwendet (#168):
     # - Inkonsistent mit Strahlungsdaten (100% cloud bei hoher GHI)
     # - Modell performt besser ohne (MAPE 28.9% vs 29.7%)
     # - Strahlungsfeatures (GHI, DNI, CSI) sind bessere Indikatoren
-    features["temperature"] = df["temperature_c"]
+    temperature = df["temperature_c"].to_numpy(dtype=np.float64, na_value=np.nan)
+    cols["temperature"] = temperature
 
     # Erweiterte Wetter-Features (optional, Defaults wenn nicht vorhanden)
-    features["wind_speed"] = df.get("wind_speed_ms", pd.Series([0.0] * len(df)))
-    features["humidity"] = df.get("humidity_pct", pd.Series([50] * len(df)))
-    features["dhi"] = df.get("dhi_wm2", pd.Series([0.0] * len(df)))
-
-    # NaN-Handling und Wertebereichs-Korrektur
-    features["wind_speed"] = features["wind_speed"].fillna(0.0).clip(lower=0)
-    features["humidity"] = features["humidity"].fillna(50).clip(lower=0, upper=100)
-    features["dhi"] = features["dhi"].fillna(0.0).clip(lower=0)
+    # inkl. NaN-Handling und Wertebereichs-Korrektur
+    wind_speed = np.clip(column("wind_speed_ms", 0.0), 0, None)
+    dhi = np.clip(column("dhi_wm2", 0.0), 0, None)
+    cols["wind_speed"] = wind_speed
+    cols["humidity"] = np.clip(column("humidity_pct", 50), 0, 100)
+    cols["dhi"] = dhi
 
     # Sonnenhöhe berechnen
-    features["sun_elevation"] = df["timestamp"].apply(
-        lambda ts: calculate_sun_elevation(int(ts), lat, lon)
-    )
+    sun_elevation = _solar_elevation_j2000(ts, lat, lon)
+    cols["sun_elevation"] = sun_elevation
 
     # Anlagenleistung als Feature (für Normalisierung/Transfer-Learning)
     if peak_kwp is not None:
-        features["peak_kwp"] = peak_kwp
+        cols["peak_kwp"] = np.full(n, peak_kwp, dtype=np.float64)
 
     # === Physikalische Features ===
 
     # Diffuse Fraction: Verhältnis diffuse/globale Strahlung
     # Hoher Wert = bewölkt, niedriger = klarer Himmel
     # +1 im Nenner verhindert Division durch 0, clip begrenzt auf sinnvollen Bereich
-    features["diffuse_fraction"] = (features["dhi"] / (features["ghi"] + 1)).clip(0, 1)
+    cols["diffuse_fraction"] = np.clip(dhi / (ghi + 1), 0, 1)
 
     # DNI (Direct Normal Irradiance) wenn verfügbar
-    if "dni_wm2" in df.columns:
-        features["dni"] = df["dni_wm2"].fillna(0)
-    else:
-        features["dni"] = 0.0
+    dni = column("dni_wm2", 0.0)
+    cols["dni"] = dni
 
     # Modultemperatur (NOCT-basiert)
     # NOCT = 45°C (Nominal Operating Cell Temperature)
     NOCT = 45
-    features["t_module"] = (
-        features["temperature"] + (features["ghi"] / 800) * (NOCT - 20) - features["wind_speed"] * 2
-    )
+    t_module = temperature + (ghi / 800) * (NOCT - 20) - wind_speed * 2
+    cols["t_module"] = t_module
 
     # Temperatur-Derating: Module verlieren ~0.4%/°C über 25°C
     TEMP_COEFFICIENT = -0.004
-    features["efficiency_factor"] = 1 + TEMP_COEFFICIENT * (features["t_module"] - 25)
+    cols["efficiency_factor"] = 1 + TEMP_COEFFICIENT * (t_module - 25)
 
     # Clear-Sky-Index (CSI): Verhältnis GHI zu theoretischem Maximum
     # Normalisiert Strahlung über Jahreszeiten hinweg
-    if PVLIB_AVAILABLE and len(df) > 0:
+    cols["csi"] = np.zeros(n)
+    if PVLIB_AVAILABLE and n > 0:
         try:
             location = Location(lat, lon)
             # Timestamps für pvlib vorbereiten
-            times = pd.DatetimeIndex(timestamps)
+            times = pd.to_datetime(ts, unit="s", utc=True)
             # Clear-Sky GHI berechnen (Ineichen-Modell)
             clear_sky = location.get_clearsky(times, model="ineichen")
             clear_sky_ghi = clear_sky["ghi"].values
             # CSI = GHI / Clear-Sky GHI (mit Schutz vor Division durch 0)
-            ghi_values = features["ghi"].values
-            csi = np.zeros(len(ghi_values))
+            csi = np.zeros(n)
             mask = clear_sky_ghi > 10  # Nur berechnen wenn Clear-Sky > 10 W/m²
-            csi[mask] = ghi_values[mask] / clear_sky_ghi[mask]
+            csi[mask] = ghi[mask] / clear_sky_ghi[mask]
             # CSI auf sinnvollen Bereich begrenzen (kann >1 sein bei Reflexionen)
-            features["csi"] = np.clip(csi, 0, 1.5)
+            cols["csi"] = np.clip(csi, 0, 1.5)
         except Exception as e:
             logger.warning(f"CSI-Berechnung fehlgeschlagen: {e}")
-            features["csi"] = 0.0
-    else:
-        # Fallback wenn pvlib nicht verfügbar
-        features["csi"] = 0.0
 
     # === POA-Features (Multi-Array) ===
-    if pv_arrays and PVLIB_AVAILABLE and len(df) > 0:
+    cols["poa_total"] = np.zeros(n)
+    cols["poa_ratio"] = np.zeros(n)
+    if pv_arrays and PVLIB_AVAILABLE and n > 0:
         try:
             # DNI: use column if available, else estimate from GHI/DHI
-            has_dni = "dni" in features.columns and features["dni"].sum() > 0
-            dni_for_poa = (
-                features["dni"]
-                if has_dni
-                else (features["ghi"] - features["dhi"]).clip(lower=0)
-            )
+            dni_for_poa = dni if dni.sum() > 0 else np.clip(ghi - dhi, 0, None)
 
             poa_feats = calculate_poa_features(
-                timestamps=pd.DatetimeIndex(timestamps),
-                ghi=features["ghi"].reset_index(drop=True),
-                dhi=features["dhi"].reset_index(drop=True),
-                dni=dni_for_poa.reset_index(drop=True),
-                sun_elevation=features["sun_elevation"].reset_index(drop=True),
+                timestamps=pd.to_datetime(ts, unit="s", utc=True),
+                ghi=pd.Series(ghi),
+                dhi=pd.Series(dhi),
+                dni=pd.Series(dni_for_poa),
+                sun_elevation=pd.Series(sun_elevation),
                 lat=lat,
                 lon=lon,
                 arrays=pv_arrays,
             )
-            features["poa_total"] = poa_feats["poa_total"].values
-            features["poa_ratio"] = poa_feats["poa_ratio"].values
+            cols["poa_total"] = poa_feats["poa_total"].to_numpy()
+            cols["poa_ratio"] = poa_feats["poa_ratio"].to_numpy()
         except Exception as e:
             logger.warning(f"POA-Feature-Berechnung fehlgeschlagen: {e}")
-            features["poa_total"] = 0.0
-            features["poa_ratio"] = 0.0
-    else:
-        features["poa_total"] = 0.0
-        features["poa_ratio"] = 0.0
 
     # === Degradations-Feature ===
     # Kontinuierliches Feature für Anlagenalter, damit XGBoost die
     # Degradation selbst lernen kann (#187)
     if install_date is not None:
         try:
-            install_dt = pd.Timestamp(install_date, tz="UTC")
+            install_ts = pd.Timestamp(install_date, tz="UTC").timestamp()
             # Kontinuierliches Alter in Jahren (z.B. 6.45)
-            features["years_since_install"] = (
-                (timestamps - install_dt).dt.total_seconds() / (365.25 * 24 * 3600)
-            )
+            cols["years_since_install"] = (ts - install_ts) / (365.25 * 24 * 3600)
         except Exception as e:
             logger.warning(f"install_date '{install_date}' ungültig: {e}")
 
     # === Lag-Features ===
 
     # Wetter-Lags (immer verfügbar, da Wetterdaten sequentiell)
-    features["ghi_lag_1h"] = features["ghi"].shift(1).fillna(0)
-    features["ghi_lag_3h"] = features["ghi"].shift(3).fillna(0)
-    features["ghi_rolling_3h"] = features["ghi"].rolling(3, min_periods=1).mean()
+    ghi_series = pd.Series(ghi)
+    cols["ghi_lag_1h"] = ghi_series.shift(1).fillna(0).to_numpy()
+    cols["ghi_lag_3h"] = ghi_series.shift(3).fillna(0).to_numpy()
+    cols["ghi_rolling_3h"] = ghi_series.rolling(3, min_periods=1).mean().to_numpy()
 
     # production_lag Features entfernt (#170):
     # - Im Predict-Modus immer 0, da keine Produktionsdaten verfügbar
@@ -484,7 +583,13 @@ def prepare_features(
     # - Backtests zeigten gute Werte, weil dort echte Daten verfügbar waren
     # - Modell muss ohne diese Features trainiert werden für konsistente Forecasts
 
-    return features
+    # float32 reicht für alle Features und halbiert den Speicherdurchsatz für
+    # Scaler und Modell (RandomForest/XGBoost rechnen intern ohnehin in float32)
+    return pd.DataFrame(
+        {name: values.astype(np.float32, copy=False) for name, values in cols.items()},
+        index=df.index,
+        copy=False,
+    )
 
 
 def _check_xgboost_available() -> None:
@@ -523,12 +628,14 @@ def _check_xgboost_available() -> None:
         )
 
 
-def _create_pipeline(model_type: ModelType) -> Pipeline:
+def _create_pipeline(model_type: ModelType, memory: str | joblib.Memory | None = None) -> Pipeline:
     """
     Erstellt ML-Pipeline für den angegebenen Modelltyp.
 
     Args:
-        model_type: 'rf' für RandomForest, 'xgb' für XGBoost
+        model_type: 'rf' für RandomForest, 'xgb' für XGBoost,
+            'hgb' für HistGradientBoosting
+        memory: Cache für gefittete Transformer (siehe sklearn Pipeline, optional)
 
     Returns:
         sklearn Pipeline mit Scaler und Modell
@@ -551,9 +658,31 @@ def _create_pipeline(model_type: ModelType) -> Pipeline:
                         random_state=42,
                         n_jobs=-1,
                         verbosity=0,
+                        **_xgb_params(),
                     ),
                 ),
-            ]
+            ],
+            memory=memory,
+        )
+    elif model_type == "hgb":
+        # Histogramm-basiertes Boosting aus sklearn: keine Zusatz-Dependency,
+        # deutlich schneller als RandomForest bei Training und Vorhersage
+        return Pipeline(
+            [
+                ("scaler", StandardScaler()),
+                (
+                    "model",
+                    HistGradientBoostingRegressor(
+                        max_iter=300,
+                        max_depth=8,
+                        learning_rate=0.08,
+                        l2_regularization=1.0,
+                        early_stopping=True,
+                        random_state=42,
+                    ),
+                ),
+            ],
+            memory=memory,
         )
     else:  # rf (default)
         return Pipeline(
@@ -569,10 +698,175 @@ def _create_pipeline(model_type: ModelType) -> Pipeline:
                         n_jobs=-1,
                     ),
                 ),
-            ]
+            ],
+            memory=memory,
         )
 
 
+# Spalten-Dtypes für das Laden der Trainingsdaten (NULL-fähige Spalten als float32)
+TRAINING_DTYPES = {
+    "timestamp": "int64",
+    "production_w": "float32",
+    "ghi_wm2": "float32",
+    "cloud_cover_pct": "float32",
+    "temperature_c": "float32",
+    "wind_speed_ms": "float32",
+    "humidity_pct": "float32",
+    "dhi_wm2": "float32",
+    "dni_wm2": "float32",
+}
+TRAINING_CHUNKSIZE = 100_000
+
+# Persistenter Feature-Cache: fertige (X, y)-Arrays für train/tune über
+# Prozessgrenzen hinweg. Bei Änderungen an prepare_features die
+# Schema-Version erhöhen, damit alte Cache-Dateien nicht mehr passen.
+# Gespeicherte Modelle tragen die Version ebenfalls (siehe save_model/load_model).
+# v2: sun_elevation nach J2000-Sonnenstandsformel statt Näherung.
+FEATURE_CACHE_DIR = Path.home() / ".cache" / "pvforecast" / "features"
+FEATURE_SCHEMA_VERSION = 2
+
+
+def _feature_cache_path(db_path: Path, key: tuple) -> Path:
+    """Cache-Datei für einen Trainingsdatensatz: Präfix pro DB, Hash über alle Eingaben."""
+    db_id = hashlib.sha256(str(Path(db_path).resolve()).encode()).hexdigest()[:16]
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+    return FEATURE_CACHE_DIR / f"{db_id}-{digest}.npz"
+
+
+def _read_feature_cache(path: Path) -> tuple[pd.DataFrame, pd.Series] | None:
+    """Lädt (X, y) aus dem Feature-Cache, None wenn nicht vorhanden oder defekt."""
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            X = pd.DataFrame(data["X"], columns=data["cols"].tolist(), copy=False)
+            y = pd.Series(data["y"], name="production_w")
+    except Exception as e:
+        logger.debug(f"Feature-Cache unlesbar ({path.name}): {e}")
+        return None
+
+    logger.debug(f"Trainingsdaten aus Feature-Cache: {path.name}")
+    return X, y
+
+
+def _write_feature_cache(
+    path: Path, X: pd.DataFrame, y: pd.Series, stale_before_ns: int
+) -> None:
+    """Schreibt (X, y) in den Feature-Cache und entfernt veraltete Einträge der DB.
+
+    Veraltet sind Cache-Dateien derselben Datenbank, die vor deren letzter
+    Änderung geschrieben wurden. Fehler werden nur geloggt (Cache ist optional).
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp_path,
+            X=X.to_numpy(dtype=np.float32),
+            y=y.to_numpy(dtype=np.float32),
+            cols=np.array(X.columns, dtype=str),
+        )
+        os.replace(tmp_path, path)
+
+        db_id = path.name.split("-", 1)[0]
+        for old in path.parent.glob(f"{db_id}-*.npz"):
+            if old != path and old.stat().st_mtime_ns < stale_before_ns:
+                old.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Feature-Cache nicht geschrieben: {e}")
+
+
+@lru_cache(maxsize=4)
+def _load_and_prepare(
+    db_path: Path,
+    db_fingerprint: tuple[int, ...],
+    lat: float,
+    lon: float,
+    peak_kwp: float | None,
+    since_year: int | None,
+    until_year: int | None,
+    pv_arrays: tuple[tuple, ...] | None,
+    install_date: str | None,
+) -> tuple[pd.DataFrame, pd.Series]:
+    """Lädt Trainingsdaten aus der DB und erstellt Features (gecacht).
+
+    Alle Argumente sind hashbar, damit ``lru_cache`` nach Wert cachen kann.
+    ``db_fingerprint`` sorgt dafür, dass nach Schreibzugriffen neu geladen wird.
+    Ein Tuning-Lauf (Suche + Refit) bzw. train/tune in derselben Session
+    führen SQL-Query und Feature-Engineering so nur einmal aus. Zusätzlich
+    wird das Ergebnis in ``FEATURE_CACHE_DIR`` abgelegt, sodass auch
+    wiederholte CLI-Aufrufe auf unveränderter DB direkt die Arrays laden.
+
+    Returns:
+        Tuple (X, y) mit zusammenhängenden float32-Daten. Nicht verändern,
+        die Objekte werden zwischen Aufrufen geteilt.
+    """
+    cache_key = (
+        FEATURE_SCHEMA_VERSION, __version__, PVLIB_AVAILABLE, db_fingerprint,
+        lat, lon, peak_kwp, since_year, until_year, pv_arrays, install_date,
+    )
+    cache_path = _feature_cache_path(db_path, cache_key)
+    cached = _read_feature_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    query = """
+        SELECT
+            p.timestamp,
+            p.production_w,
+            w.ghi_wm2,
+            w.cloud_cover_pct,
+            w.temperature_c,
+            w.wind_speed_ms,
+            w.humidity_pct,
+            w.dhi_wm2,
+            w.dni_wm2
+        FROM pv_readings p
+        INNER JOIN weather_history w ON p.timestamp = w.timestamp
+        WHERE p.curtailed = 0
+          AND p.production_w >= 0
+          AND w.ghi_wm2 IS NOT NULL
+    """
+    params: list[str] = []
+    if since_year:
+        query += " AND p.timestamp >= strftime('%s', ?)"
+        params.append(f"{since_year}-01-01")
+    if until_year:
+        query += " AND p.timestamp < strftime('%s', ?)"
+        params.append(f"{until_year + 1}-01-01")
+
+    # Rein lesender Zugriff: Database() würde beim Öffnen das Schema schreiben
+    # und damit den Fingerprint verändern. Gelesen wird in Chunks mit schmalen
+    # Dtypes, damit nie das komplette Ergebnis als Python-Tupel im Speicher liegt.
+    with closing(sqlite3.connect(db_path)) as conn:
+        chunks = pd.read_sql_query(
+            query,
+            conn,
+            params=params if params else None,
+            chunksize=TRAINING_CHUNKSIZE,
+            dtype=TRAINING_DTYPES,
+        )
+        df = pd.concat(chunks, ignore_index=True)
+
+    arrays = [PVArrayConfig(*a) for a in pv_arrays] if pv_arrays else None
+
+    # Features erstellen (mode="train" für historische Daten)
+    features = prepare_features(
+        df, lat, lon, peak_kwp=peak_kwp, mode="train",
+        pv_arrays=arrays, install_date=install_date,
+    )
+    X = pd.DataFrame(
+        np.ascontiguousarray(features.to_numpy(dtype=np.float32)),
+        columns=features.columns,
+    )
+    y = df["production_w"].astype(np.float32)
+
+    # DB-Fingerprint: (mtime_ns, size) für DB und WAL
+    _write_feature_cache(cache_path, X, y, max(db_fingerprint[0], db_fingerprint[2]))
+
+    return X, y
+
+
 def load_training_data(
     db: Database,
     lat: float,
@@ -587,7 +881,8 @@ def load_training_data(
     """Lädt und bereitet Trainingsdaten vor.
 
     Lädt PV-Produktionsdaten mit zugehörigen Wetterdaten aus der Datenbank
-    und erstellt Features für das ML-Training.
+    und erstellt Features für das ML-Training. Das Ergebnis wird pro
+    Datenbankstand gecacht (siehe ``_load_and_prepare``).
 
     Args:
         db: Datenbankverbindung
@@ -599,51 +894,23 @@ def load_training_data(
         min_samples: Mindestanzahl benötigter Datensätze (default: 100)
 
     Returns:
-        Tuple von (X, y) - Features DataFrame und Zielvariable Series
+        Tuple von (X, y) - Features DataFrame und Zielvariable Series (float32)
 
     Raises:
         ValueError: Wenn zu wenig Trainingsdaten vorhanden sind
     """
-    with db.connect() as conn:
-        query = """
-            SELECT
-                p.timestamp,
-                p.production_w,
-                w.ghi_wm2,
-                w.cloud_cover_pct,
-                w.temperature_c,
-                w.wind_speed_ms,
-                w.humidity_pct,
-                w.dhi_wm2,
-                w.dni_wm2
-            FROM pv_readings p
-            INNER JOIN weather_history w ON p.timestamp = w.timestamp
-            WHERE p.curtailed = 0
-              AND p.production_w >= 0
-              AND w.ghi_wm2 IS NOT NULL
-        """
-        params: list[str] = []
-        if since_year:
-            query += " AND p.timestamp >= strftime('%s', ?)"
-            params.append(f"{since_year}-01-01")
-        if until_year:
-            query += " AND p.timestamp < strftime('%s', ?)"
-            params.append(f"{until_year + 1}-01-01")
-        df = pd.read_sql_query(query, conn, params=params if params else None)
-
-    if len(df) < min_samples:
+    arrays_key = tuple(astuple(a) for a in pv_arrays) if pv_arrays else None
+    X, y = _load_and_prepare(
+        db.db_path, _db_fingerprint(db.db_path), lat, lon, peak_kwp,
+        since_year, until_year, arrays_key, install_date,
+    )
+
+    if len(X) < min_samples:
         raise ValueError(
-            f"Zu wenig Trainingsdaten: {len(df)} (mindestens {min_samples} benötigt)"
+            f"Zu wenig Trainingsdaten: {len(X)} (mindestens {min_samples} benötigt)"
         )
 
-    logger.info(f"Trainingsdaten: {len(df)} Datensätze")
-
-    # Features erstellen (mode="train" für historische Daten)
-    X = prepare_features(
-        df, lat, lon, peak_kwp=peak_kwp, mode="train",
-        pv_arrays=pv_arrays, install_date=install_date,
-    )
-    y = df["production_w"]
+    logger.info(f"Trainingsdaten: {len(X)} Datensätze")
 
     return X, y
 
@@ -666,7 +933,8 @@ def train(
         db: Database-Instanz
         lat: Breitengrad
         lon: Längengrad
-        model_type: 'rf' für RandomForest (default), 'xgb' für XGBoost
+        model_type: 'rf' für RandomForest (default), 'xgb' für XGBoost,
+            'hgb' für HistGradientBoosting
         since_year: Nur Daten ab diesem Jahr verwenden (optional)
         until_year: Nur Daten bis zu diesem Jahr verwenden (optional, inklusive)
 
@@ -696,7 +964,7 @@ def train(
     logger.info(f"Training: {len(X_train)}, Test: {len(X_test)}")
 
     # Pipeline erstellen
-    model_name = "XGBoost" if model_type == "xgb" else "RandomForest"
+    model_name = MODEL_NAMES[model_type]
     logger.info(f"Erstelle {model_name} Pipeline...")
     pipeline = _create_pipeline(model_type)
 
@@ -759,7 +1027,8 @@ def tune(
         db: Database-Instanz
         lat: Breitengrad
         lon: Längengrad
-        model_type: 'rf' für RandomForest, 'xgb' für XGBoost
+        model_type: 'rf' für RandomForest, 'xgb' für XGBoost,
+            'hgb' für HistGradientBoosting
         n_iter: Anzahl der Kombinationen (default: 50)
         cv_splits: Anzahl der CV-Splits (default: 5)
         since_year: Nur Daten ab diesem Jahr verwenden (optional)
@@ -791,6 +1060,15 @@ def tune(
             "model__colsample_bytree": uniform(0.6, 0.4),  # 0.6-1.0
         }
         model_name = "XGBoost"
+    elif model_type == "hgb":
+        param_dist = {
+            "model__max_iter": randint(100, 500),
+            "model__max_depth": randint(3, 13),  # 3-12
+            "model__learning_rate": uniform(0.01, 0.29),  # 0.01-0.3
+            "model__min_samples_leaf": randint(5, 60),
+            "model__l2_regularization": uniform(0.0, 2.0),  # 0-2
+        }
+        model_name = "HistGradientBoosting"
     else:
         param_dist = {
             "model__n_estimators": randint(100, 500),
@@ -800,26 +1078,29 @@ def tune(
         }
         model_name = "RandomForest"
 
-    # Pipeline erstellen
-    pipeline = _create_pipeline(model_type)
-
     # TimeSeriesSplit für zeitliche Daten
     cv = TimeSeriesSplit(n_splits=cv_splits)
 
-    # RandomizedSearchCV
-    logger.info(f"Starte RandomizedSearchCV für {model_name}...")
-    search = RandomizedSearchCV(
-        pipeline,
-        param_distributions=param_dist,
-        n_iter=n_iter,
-        cv=cv,
-        scoring="neg_mean_absolute_error",
-        n_jobs=-1,
-        verbose=1,
-        random_state=42,
-    )
+    # Pipeline mit Transformer-Cache: Der Scaler hängt nicht von den gesuchten
+    # Parametern ab und wird so nur einmal pro CV-Fold gefittet statt n_iter-mal
+    with tempfile.TemporaryDirectory(prefix="pvforecast-tune-") as cache_dir:
+        pipeline = _create_pipeline(model_type, memory=joblib.Memory(cache_dir, verbose=0))
+
+        # RandomizedSearchCV
+        logger.info(f"Starte RandomizedSearchCV für {model_name}...")
+        search = RandomizedSearchCV(
+            pipeline,
+            param_distributions=param_dist,
+            n_iter=n_iter,
+            cv=cv,
+            scoring="neg_mean_absolute_error",
+            n_jobs=-1,
+            verbose=1,
+            random_state=42,
+            refit=False,
+        )
 
-    search.fit(X, y)
+        search.fit(X, y)
 
     # Beste Parameter extrahieren (ohne "model__" Prefix)
     best_params = {k.replace("model__", ""): v for k, v in search.best_params_.items()}
@@ -832,7 +1113,24 @@ def tune(
         best_pipeline = Pipeline(
             [
                 ("scaler", StandardScaler()),
-                ("model", XGBRegressor(**best_params, random_state=42, n_jobs=-1, verbosity=0)),
+                (
+                    "model",
+                    XGBRegressor(
+                        **best_params, random_state=42, n_jobs=-1, verbosity=0, **_xgb_params()
+                    ),
+                ),
+            ]
+        )
+    elif model_type == "hgb":
+        best_pipeline = Pipeline(
+            [
+                ("scaler", StandardScaler()),
+                (
+                    "model",
+                    HistGradientBoostingRegressor(
+                        **best_params, early_stopping=True, random_state=42
+                    ),
+                ),
             ]
         )
     else:
@@ -946,7 +1244,8 @@ def tune_optuna(
         db: Database-Instanz
         lat: Breitengrad
         lon: Längengrad
-        model_type: 'rf' für RandomForest, 'xgb' für XGBoost
+        model_type: 'rf' für RandomForest, 'xgb' für XGBoost,
+            'hgb' für HistGradientBoosting
         n_trials: Anzahl der Trials (default: 50)
         cv_splits: Anzahl der CV-Splits (default: 5)
         timeout: Maximale Laufzeit in Sekunden (optional)
@@ -975,6 +1274,24 @@ def tune_optuna(
     # TimeSeriesSplit für CV
     cv = TimeSeriesSplit(n_splits=cv_splits)
 
+    # Folds einmalig vorbereiten: Scaler und (bei XGBoost) QuantileDMatrix hängen
+    # nicht von den Hyperparametern ab und werden über alle Trials wiederverwendet
+    if model_type == "xgb":
+        import xgboost as xgb
+
+    folds = []
+    for train_idx, val_idx in cv.split(X):
+        scaler = StandardScaler()
+        X_train_scaled = scaler.fit_transform(X.iloc[train_idx])
+        X_val_scaled = scaler.transform(X.iloc[val_idx])
+        y_train, y_val = y[train_idx], y[val_idx]
+        dtrain = (
+            xgb.QuantileDMatrix(X_train_scaled, y_train, max_bin=XGB_TREE_PARAMS["max_bin"])
+            if model_type == "xgb"
+            else None
+        )
+        folds.append((X_train_scaled, y_train, X_val_scaled, y_val, dtrain))
+
     # Objective-Funktion definieren
     def objective(trial: optuna.Trial) -> float:
         # Parameter-Sampling je nach Modell-Typ
@@ -987,6 +1304,14 @@ def tune_optuna(
                 "subsample": trial.suggest_float("subsample", 0.6, 1.0),
                 "colsample_bytree": trial.suggest_float("colsample_bytree", 0.6, 1.0),
             }
+        elif model_type == "hgb":
+            params = {
+                "max_iter": trial.suggest_int("max_iter", 100, 500),
+                "max_depth": trial.suggest_int("max_depth", 3, 12),
+                "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
+                "min_samples_leaf": trial.suggest_int("min_samples_leaf", 5, 60),
+                "l2_regularization": trial.suggest_float("l2_regularization", 0.0, 2.0),
+            }
         else:  # rf
             params = {
                 "n_estimators": trial.suggest_int("n_estimators", 100, 500),
@@ -997,34 +1322,34 @@ def tune_optuna(
 
         # Cross-Validation mit Pruning
         fold_scores = []
-        for step, (train_idx, val_idx) in enumerate(cv.split(X)):
-            X_train, X_val = X.iloc[train_idx], X.iloc[val_idx]
-            y_train, y_val = y[train_idx], y[val_idx]
-
-            # Scaler fitten
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_val_scaled = scaler.transform(X_val)
-
-            # Modell erstellen und trainieren
+        for step, (X_train_scaled, y_train, X_val_scaled, y_val, dtrain) in enumerate(folds):
+            # Modell trainieren und evaluieren
             if model_type == "xgb":
-                model = XGBRegressor(
+                # Natives API: nutzt die vorab gebaute QuantileDMatrix des Folds
+                booster_params = {k: v for k, v in params.items() if k != "n_estimators"}
+                booster = xgb.train(
+                    {**booster_params, **_xgb_params(), "seed": 42, "verbosity": 0},
+                    dtrain,
+                    num_boost_round=params["n_estimators"],
+                )
+                y_pred = booster.inplace_predict(X_val_scaled)
+            elif model_type == "hgb":
+                model = HistGradientBoostingRegressor(
                     **params,
+                    early_stopping=True,
                     random_state=42,
-                    n_jobs=-1,
-                    verbosity=0,
                 )
+                model.fit(X_train_scaled, y_train)
+                y_pred = model.predict(X_val_scaled)
             else:
                 model = RandomForestRegressor(
                     **params,
                     random_state=42,
                     n_jobs=-1,
                 )
+                model.fit(X_train_scaled, y_train)
+                y_pred = model.predict(X_val_scaled)
 
-            model.fit(X_train_scaled, y_train)
-
-            # Evaluieren
-            y_pred = model.predict(X_val_scaled)
             mae = mean_absolute_error(y_val, y_pred)
             fold_scores.append(mae)
 
@@ -1067,15 +1392,21 @@ def tune_optuna(
     # Finale Pipeline mit besten Parametern trainieren
     logger.info("Trainiere finales Modell mit besten Parametern...")
 
+    if model_type == "xgb":
+        final_model = XGBRegressor(
+            **best_params, random_state=42, n_jobs=-1, verbosity=0, **_xgb_params()
+        )
+    elif model_type == "hgb":
+        final_model = HistGradientBoostingRegressor(
+            **best_params, early_stopping=True, random_state=42
+        )
+    else:
+        final_model = RandomForestRegressor(**best_params, random_state=42, n_jobs=-1)
+
     pipeline = Pipeline(
         [
             ("scaler", StandardScaler()),
-            (
-                "model",
-                XGBRegressor(**best_params, random_state=42, n_jobs=-1, verbosity=0)
-                if model_type == "xgb"
-                else RandomForestRegressor(**best_params, random_state=42, n_jobs=-1),
-            ),
+            ("model", final_model),
         ]
     )
 
@@ -1135,16 +1466,48 @@ def save_model(model: Pipeline, path: Path, metrics: dict | None = None) -> None
     # Version basierend auf Modell-Typ
     model_type = metrics.get("model_type", "rf") if metrics else "rf"
     version = f"{model_type}-v1"
+    if metrics is not None:
+        metrics = {**metrics, "feature_schema": FEATURE_SCHEMA_VERSION}
 
     data = {
         "model": model,
         "metrics": metrics,
         "version": version,
+        "feature_schema": FEATURE_SCHEMA_VERSION,
         "created_at": datetime.now(UTC_TZ).isoformat(),
     }
 
-    # joblib ist sklearn-Standard und bietet bessere Kompression
-    joblib.dump(data, path, compress=3)
+    # Unkomprimiert speichern: load_model kann die Datei dann per mmap laden
+    # (deutlich schnellerer Kaltstart, Datei dafür größer).
+    # Nie in place überschreiben: ein noch geladenes Modell kann die Datei
+    # gemappt haben (Truncate → SIGBUS). Daher temporäre Datei im selben
+    # Verzeichnis schreiben und atomar ersetzen.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        joblib.dump(data, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    # Metadaten zusätzlich als JSON: Setup/Status können Typ und MAPE lesen, ohne
+    # das Modell zu deserialisieren. mtime/Größe binden sie an genau diese Datei.
+    stat = path.stat()
+    mape = metrics.get("mape") if metrics else None
+    meta = {
+        "model_type": model_type,
+        "mape": float(mape) if mape is not None else None,
+        "version": version,
+        "feature_schema": FEATURE_SCHEMA_VERSION,
+        "created_at": data["created_at"],
+        "model_mtime_ns": stat.st_mtime_ns,
+        "model_size": stat.st_size,
+    }
+    try:
+        _model_meta_path(path).write_text(json.dumps(meta), encoding="utf-8")
+    except OSError as e:
+        logger.debug(f"Modell-Metadaten nicht geschrieben: {e}")
 
     logger.info(f"Modell gespeichert: {path} (Version: {version})")
 
@@ -1153,6 +1516,11 @@ def load_model(path: Path) -> tuple[Pipeline, dict | None]:
     """
     Lädt gespeichertes Modell.
 
+    Passt die gespeicherte Feature-Schema-Version nicht zu
+    ``FEATURE_SCHEMA_VERSION`` (Modelle ohne Angabe gelten als v1), wird eine
+    Warnung geloggt: gleichnamige Features können andere Werte tragen, was der
+    Spaltenabgleich in der Vorhersage nicht erkennt.
+
     Returns:
         (Pipeline, metrics dict oder None)
 
@@ -1162,13 +1530,63 @@ def load_model(path: Path) -> tuple[Pipeline, dict | None]:
     if not path.exists():
         raise ModelNotFoundError(f"Kein Modell gefunden: {path}")
 
-    data = joblib.load(path)
+    # mmap nur für unkomprimierte Pickles (Protokoll-Header 0x80); ältere,
+    # komprimiert gespeicherte Modelle werden normal geladen
+    with open(path, "rb") as f:
+        is_raw_pickle = f.read(1) == b"\x80"
+
+    data = joblib.load(path, mmap_mode="r" if is_raw_pickle else None)
 
     if isinstance(data, dict):
-        return data["model"], data.get("metrics")
+        model, metrics = data["model"], data.get("metrics")
+        schema = data.get("feature_schema", 1)
     else:
         # Altes Format (nur Pipeline)
-        return data, None
+        model, metrics, schema = data, None, 1
+
+    if schema != FEATURE_SCHEMA_VERSION:
+        logger.warning(
+            f"Modell wurde mit Feature-Schema v{schema} trainiert, aktuell ist "
+            f"v{FEATURE_SCHEMA_VERSION}: Prognosen können verfälscht sein, "
+            f"bitte neu trainieren (pvforecast train)"
+        )
+    return model, metrics
+
+
+def _predict_daylight(model: Pipeline, X: pd.DataFrame) -> np.ndarray:
+    """
+    Sagt nur Stunden mit Sonnenhöhe >= 0 vorher, Nacht-Stunden bleiben 0.
+
+    Spart den Baum-Durchlauf für etwa die Hälfte der Zeilen; negative
+    Vorhersagen werden auf 0 gesetzt. Das Modell bekommt ein zusammenhängendes
+    float32-Array statt eines DataFrames (keine Konvertierung/Validierung pro
+    Aufruf), die Spaltenreihenfolge wird vorher einmal geprüft.
+
+    Args:
+        model: Trainierte sklearn Pipeline
+        X: Features aus prepare_features
+
+    Returns:
+        Vorhersagen in Watt (float64, >= 0)
+
+    Raises:
+        ValueError: Wenn die Features nicht zu den Trainings-Features passen
+    """
+    y_pred = np.zeros(len(X))
+    day_mask = X["sun_elevation"].to_numpy() >= 0
+    if day_mask.any():
+        expected = getattr(model, "feature_names_in_", None)
+        if expected is not None and list(expected) != list(X.columns):
+            raise ValueError(
+                f"Features passen nicht zum Modell: erwartet {list(expected)}, "
+                f"erhalten {list(X.columns)}"
+            )
+        X_day = np.ascontiguousarray(X.to_numpy(dtype=np.float32)[day_mask])
+        with warnings.catch_warnings():
+            # Namen wurden oben geprüft, sklearn-Warnung für ndarray-Input unterdrücken
+            warnings.filterwarnings("ignore", message="X does not have valid feature names")
+            y_pred[day_mask] = np.maximum(model.predict(X_day), 0)
+    return y_pred
 
 
 def predict(
@@ -1211,30 +1629,26 @@ def predict(
         pv_arrays=pv_arrays, install_date=install_date,
     )
 
-    # Vorhersage
-    predictions = model.predict(X)
-
-    # Negative Werte auf 0 setzen
-    predictions = [max(0, int(p)) for p in predictions]
+    # Vorhersage (nur Tagstunden, Nacht = 0)
+    predictions = _predict_daylight(model, X).astype(np.int32, copy=False)
 
-    # Nacht-Stunden auf 0 setzen (Sonnenhöhe < 0)
-    for i, row in enumerate(X.itertuples()):
-        if row.sun_elevation < 0:
-            predictions[i] = 0
-
-    # Hourly Forecasts erstellen (itertuples ist schneller als iterrows)
+    # Hourly Forecasts erstellen: Spalten per tolist() in einem Schritt zu
+    # Python-Skalaren wandeln, statt int()/float() auf jedem NumPy-Element
+    ts_list = weather_df["timestamp"].to_numpy(dtype=np.int64).tolist()
+    ghi_list = weather_df["ghi_wm2"].to_numpy(dtype=np.float64).tolist()
+    cc_list = weather_df["cloud_cover_pct"].to_numpy(dtype=np.int64).tolist()
     hourly = [
         HourlyForecast(
-            timestamp=datetime.fromtimestamp(int(row.timestamp), UTC_TZ),
-            production_w=predictions[i],
-            ghi_wm2=float(row.ghi_wm2),
-            cloud_cover_pct=int(row.cloud_cover_pct),
+            timestamp=datetime.fromtimestamp(ts, UTC_TZ),
+            production_w=p,
+            ghi_wm2=g,
+            cloud_cover_pct=c,
         )
-        for i, row in enumerate(weather_df.itertuples(index=False))
+        for ts, p, g, c in zip(ts_list, predictions.tolist(), ghi_list, cc_list)
     ]
 
     # Summe berechnen (Wh → kWh)
-    total_wh = sum(predictions)
+    total_wh = int(predictions.sum(dtype=np.int64))
     total_kwh = total_wh / 1000
 
     return Forecast(
@@ -1311,12 +1725,9 @@ def evaluate(
     y_true = df["production_w"].values
     y_pred = model.predict(X)
 
-    # Negative Vorhersagen auf 0 setzen
-    y_pred = np.maximum(0, y_pred)
-
-    # Nacht-Stunden auf 0 setzen
-    night_mask = X["sun_elevation"] < 0
-    y_pred = np.where(night_mask, 0, y_pred)
+    # Negative Vorhersagen und Nacht-Stunden auf 0 setzen
+    day_mask = X["sun_elevation"].to_numpy() >= 0
+    y_pred = np.where(day_mask, np.maximum(y_pred, 0), 0)
 
     # Gesamtmetriken
     mae = mean_absolute_error(y_true, y_pred)
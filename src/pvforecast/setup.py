@@ -10,14 +10,214 @@ Führt den Benutzer durch die Konfiguration:
 
 from __future__ import annotations
 
+import glob
+import importlib.util
+import json
+import os
+import re
+import sqlite3
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+from zoneinfo import ZoneInfo
+
+from pvforecast.config import (
+    Config,
+    HOSTRADAConfig,
+    WeatherConfig,
+    _model_meta_path,
+    get_config_path,
+    load_config,
+)
+from pvforecast.db import _counts, _db_fingerprint
+from pvforecast.geocoding import GeocodingError, geocode, prewarm
+
+if TYPE_CHECKING:
+    from pvforecast.db import Database
+
+_T = TypeVar("_T")
+
+_WEATHER_FETCH_WORKERS = 4  # parallele Open-Meteo-Abrufe (Jahres-Chunks)
+_PROGRESS_REDRAW_INTERVAL = 0.1  # Sekunden (max. ~10 Fortschritts-Updates/s)
+
+# HOSTRADA-Dateinamen: *_gn_YYYYMMDDHH-YYYYMMDDHH.nc (Start- und Endmonat);
+# MULTILINE, damit finditer über zeilenweise verbundene Namen pro Name matcht
+_HOSTRADA_FILENAME_RE = re.compile(
+    r"_gn_(\d{4})(\d{2})\d{2}\d{2}-(\d{4})(\d{2})\d{2}\d{2}\.nc$", re.MULTILINE
+)
+
+# Ausgabezeilen von brew/pip, die während einer Installation live angezeigt werden
+_BREW_PROGRESS_MARKERS = ("Downloading", "Pouring", "Installing")
+_PIP_PROGRESS_MARKERS = ("Collecting", "Downloading", "Installing")
+
+# Trennlinie für Header und Abschlussmeldung
+_SEPARATOR = "═" * 50
+
+# Antworten auf Ja/Nein-Fragen (Eingabe wird vorher lower() normalisiert)
+_YES = frozenset({"j", "ja", "y", "yes"})
+_YES_OR_EMPTY = _YES | {""}
+_NO = frozenset({"n", "nein", "no"})
+
+# pvforecast.model (numpy/pandas/sklearn/xgboost) wird erst bei Bedarf
+# importiert, damit der Wizard-Start nicht den ML-Stack laden muss
+
+
+def _module_available(name: str) -> bool:
+    """Prüft ob ein Modul installiert ist, ohne es zu importieren (find_spec)."""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _distribution_installed(name: str) -> bool:
+    """Prüft über die Paket-Metadaten, ob eine Distribution installiert ist."""
+    # Erst hier importieren: importlib.metadata (inkl. email-Parser) kostet
+    # beim Wizard-Start sonst ~15 ms und wird nur für XGBoost gebraucht
+    import importlib.metadata
+
+    try:
+        importlib.metadata.distribution(name)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return True
+
+
+def _pip_install_cmd(requirement: str) -> list[str]:
+    """pip-Aufruf für Nachinstallationen aus dem Wizard.
+
+    Nur fertige Wheels (kein Kompilieren aus dem sdist), ohne Rückfragen,
+    ohne pip-Versionscheck und ohne .pyc-Vorkompilierung (entsteht beim
+    ersten Import ohnehin). Ohne Fortschrittsbalken: die Ausgabe wird
+    zeilenweise gelesen, die "Downloading …"-Zeilen reichen als Fortschritt.
+    """
+    return [
+        sys.executable, "-m", "pip", "install",
+        "--no-input", "--disable-pip-version-check", "--no-compile", "--progress-bar=off",
+        "--prefer-binary", "--only-binary=:all:",
+        requirement,
+    ]
+
+
+def _parse_decimal(value: str) -> float:
+    """Parst eine Zahl mit Komma oder Punkt als Dezimaltrennzeichen."""
+    return float(value.strip().replace(",", "."))
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    """(mtime_ns, size) einer Datei als Cache-Schlüssel für deren Inhalt."""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=8)
+def _cached_config_load(path: Path, mtime_ns: int, size: int) -> Config:
+    """load_config, gecacht pro Dateistand (mtime/Größe im Schlüssel)."""
+    return load_config(path)
+
+
+@lru_cache(maxsize=8)
+def _cached_db_counts(path: Path, fingerprint: tuple[int, ...]) -> tuple[int, int]:
+    """Anzahl PV- und Wetter-Datensätze, gecacht pro DB-Stand (inkl. WAL-Datei).
+
+    Rein lesend über sqlite3: Database() würde beim Öffnen das Schema
+    schreiben und damit den Schlüssel (mtime) selbst invalidieren. Beide
+    Anzahlen sind exakt: sie werden angezeigt und entscheiden über das
+    Tuning-Angebot.
+    """
+    # as_uri() maskiert ?, # und % im Pfad (sonst öffnet SQLite eine andere Datei)
+    uri = path.resolve().as_uri() + "?mode=ro"
+    with closing(sqlite3.connect(uri, uri=True)) as conn:
+        return _counts(conn)
+
+
+@lru_cache(maxsize=8)
+def _cached_model_summary(path: Path, mtime_ns: int, size: int) -> tuple[str, float]:
+    """(model_type, mape) eines gespeicherten Modells, gecacht pro Dateistand.
+
+    Liest zuerst die Metadaten-Datei von save_model; nur wenn sie fehlt oder
+    zu einem anderen Dateistand gehört, wird das Modell selbst geladen.
+    """
+    try:
+        meta = json.loads(_model_meta_path(path).read_text(encoding="utf-8"))
+        if (meta["model_mtime_ns"], meta["model_size"]) == (mtime_ns, size):
+            return meta["model_type"], meta["mape"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    from pvforecast.model import load_model
+
+    _, metrics = load_model(path)
+    return metrics["model_type"], metrics["mape"]
+
+
+# libomp-Pfade für XGBoost auf macOS (Apple Silicon und Intel)
+_LIBOMP_PATHS = (
+    Path("/opt/homebrew/lib/libomp.dylib"),
+    Path("/usr/local/lib/libomp.dylib"),
+)
+
+
+@lru_cache(maxsize=1)
+def _libomp_available() -> bool:
+    """Prüft einmal pro Prozess, ob libomp vorhanden ist (nach Installation cache_clear)."""
+    return any(p.exists() for p in _LIBOMP_PATHS)
+
+
+@lru_cache(maxsize=1)
+def _homebrew_available() -> bool:
+    """Prüft einmal pro Prozess, ob Homebrew aufrufbar ist (``brew --version``)."""
+    try:
+        subprocess.run(["brew", "--version"], check=True, capture_output=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+    return True
+
+
+def _nc_file_names(directory: str | Path) -> list[str]:
+    """Namen der NetCDF-Dateien eines Verzeichnisses (wie glob("*.nc")).
+
+    scandir statt Path.glob: es werden nur Namen gebraucht, keine Path-Objekte.
+    """
+    with os.scandir(directory) as entries:
+        return [e.name for e in entries if e.name.endswith(".nc") and not e.name.startswith(".")]
+
 
-from pvforecast.config import Config, WeatherConfig, get_config_path
-from pvforecast.geocoding import GeocodingError, geocode
-from pvforecast.model import reload_xgboost
+def _csv_files(directory: str | Path) -> list[Path]:
+    """CSV-Dateien eines Verzeichnisses (.csv/.CSV), nach Namen sortiert.
+
+    Ein scandir-Durchlauf: DirEntry.is_file() nutzt den Dateityp aus dem
+    Verzeichniseintrag und braucht (außer bei Symlinks) kein eigenes stat().
+    """
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(e.path) for e in entries if e.name.lower().endswith(".csv") and e.is_file()
+        )
+
+
+def _probe_file(loader: Callable[..., _T], path: Path) -> _T:
+    """Ruft einen der gecachten Loader mit dem aktuellen Dateistand auf.
+
+    Ein stat() statt exists() + stat(): eine fehlende Datei fällt als
+    FileNotFoundError aus _stat_key heraus. Leere Dateien (z.B. abgebrochenes
+    Schreiben) gelten ebenfalls als fehlend, ohne YAML/Pickle anzufassen.
+    """
+    mtime_ns, size = _stat_key(path)
+    if size == 0:
+        raise FileNotFoundError(path)
+    return loader(path, mtime_ns, size)
 
 
 @dataclass
@@ -66,12 +266,32 @@ class SetupWizard:
         self.output = output_func
         self.input = input_func
         self._existing_db_records = 0
+        self._fmt_db_records = "0"
         self._existing_config = None
         self._run_training_after_import = False
         self._training_completed = False
+        self._trained_model: tuple | None = None  # (Pipeline, metrics) aus dem Training
         self._latitude: float | None = None
         self._longitude: float | None = None
         self._existing_weather_records = 0
+        self._db: Database | None = None
+
+    def _get_db(self, db_path: Path) -> Database:
+        """Database-Instanz für db_path, einmal pro Wizard-Lauf erstellt.
+
+        Database() prüft beim Erstellen Schema und WAL-Mode; HOSTRADA-Laden,
+        Import, Wetterabruf und Training teilen sich deshalb eine Instanz.
+        """
+        if self._db is None or self._db.db_path != db_path:
+            from pvforecast.db import Database
+
+            self._db = Database(db_path)
+        return self._db
+
+    def _set_db_records(self, count: int) -> None:
+        """Setzt die Anzahl PV-Datensätze samt einmal formatierter Anzeige."""
+        self._existing_db_records = count
+        self._fmt_db_records = f"{count:,}"
 
     def run_interactive(self) -> SetupResult:
         """Führt den interaktiven Setup-Wizard aus.
@@ -79,6 +299,10 @@ class SetupWizard:
         Returns:
             SetupResult mit Config und Status
         """
+        # HTTP-Client/DNS für die Standortsuche vorbereiten, während der
+        # Benutzer Header und Standort-Hinweise liest
+        threading.Thread(target=prewarm, name="geocoding-prewarm", daemon=True).start()
+
         self._print_header()
 
         # 0. Existierende Installation prüfen
@@ -100,8 +324,6 @@ class SetupWizard:
         run_tuning = self._prompt_tuning(model_type)
 
         # Config erstellen
-        from pvforecast.config import HOSTRADAConfig
-
         hostrada_config = HOSTRADAConfig(local_dir=hostrada_local_dir)
         weather_config = WeatherConfig(
             forecast_provider=forecast_source,
@@ -140,72 +362,98 @@ class SetupWizard:
             existing_db_records=self._existing_db_records,
         )
 
+    def _emit(self, *lines: str) -> None:
+        """Gibt mehrere Zeilen mit einem einzigen output-Aufruf aus."""
+        text = "\n".join(lines)
+        if self.output is print:
+            # print() schreibt Text und Zeilenende getrennt → ein write() genügt
+            sys.stdout.write(text + "\n")
+        else:
+            self.output(text)
+
     def _print_header(self) -> None:
         """Gibt den Header aus."""
-        self.output("")
-        self.output("🔆 PV-Forecast Ersteinrichtung")
-        self.output("═" * 50)
-        self.output("")
+        self._emit(
+            "",
+            "🔆 PV-Forecast Ersteinrichtung",
+            _SEPARATOR,
+            "",
+        )
 
     def _check_existing_installation(self) -> None:
-        """Prüft auf existierende Installation und informiert den Benutzer."""
+        """Prüft auf existierende Installation und informiert den Benutzer.
+
+        Config, DB-Zählungen und Modell-Metriken werden pro Dateistand gecacht,
+        ein erneuter Durchlauf des Wizards parst unveränderte Dateien nicht neu.
+        """
         from pvforecast.config import _default_db_path, _default_model_path
 
         config_path = get_config_path()
         db_path = _default_db_path()
         model_path = _default_model_path()
 
+        # Die drei Prüfungen sind unabhängig (YAML, SQLite, Modell-Pickle inkl.
+        # sklearn-Import) und laufen parallel; Wartezeit = langsamste statt Summe
+        db_fingerprint = _db_fingerprint(db_path)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            config_future = pool.submit(_probe_file, _cached_config_load, config_path)
+            model_future = pool.submit(_probe_file, _cached_model_summary, model_path)
+            # Fingerprint enthält bereits das stat() der DB-Datei, Größe 0 = nicht vorhanden
+            db_future = (
+                pool.submit(_cached_db_counts, db_path, db_fingerprint)
+                if db_fingerprint[1] > 0
+                else None
+            )
+
         found_items = []
 
-        # Config prüfen
-        if config_path.exists():
-            try:
-                self._existing_config = Config.load(config_path)
-                found_items.append(f"Config: {self._existing_config.system_name}")
-            except Exception:
-                found_items.append("Config: vorhanden (nicht lesbar)")
+        # Config prüfen (fehlende Datei fällt als FileNotFoundError heraus)
+        try:
+            self._existing_config = config_future.result()
+            found_items.append(f"Config: {self._existing_config.system_name}")
+        except FileNotFoundError:
+            pass
+        except Exception:
+            found_items.append("Config: vorhanden (nicht lesbar)")
 
         # DB prüfen
-        if db_path.exists():
+        if db_future is not None:
             try:
-                from pvforecast.db import Database
-
-                db = Database(db_path)
-                self._existing_db_records = db.get_pv_count()
-                self._existing_weather_records = db.get_weather_count()
-                db_info = (
-                    f"{self._existing_db_records:,} PV + {self._existing_weather_records:,} Wetter"
-                )
+                pv_count, self._existing_weather_records = db_future.result()
+                self._set_db_records(pv_count)
+                db_info = f"{self._fmt_db_records} PV + {self._existing_weather_records:,} Wetter"
                 found_items.append(f"Datenbank: {db_info}")
             except Exception:
                 found_items.append("Datenbank: vorhanden")
 
         # Modell prüfen
-        if model_path.exists():
-            try:
-                from pvforecast.model import load_model
-
-                model_data = load_model(model_path)
-                mtype, mape = model_data.model_type, model_data.mape
-                found_items.append(f"Modell: {mtype}, ~{mape:.0f}% Abweichung")
-            except Exception:
-                found_items.append("Modell: vorhanden")
+        try:
+            mtype, mape = model_future.result()
+            found_items.append(f"Modell: {mtype}, ~{mape:.0f}% Abweichung")
+        except FileNotFoundError:
+            pass
+        except Exception:
+            found_items.append("Modell: vorhanden")
 
         if found_items:
             self.output("ℹ️  Existierende Installation gefunden:")
             for item in found_items:
                 self.output(f"   • {item}")
-            self.output("")
-            self.output("   Die Daten bleiben erhalten. Nur die Config wird aktualisiert.")
-            self.output("")
+            self._emit(
+                "",
+                "   Die Daten bleiben erhalten. Nur die Config wird aktualisiert.",
+                "",
+            )
 
     def _prompt_location(self) -> tuple[float, float, str]:
         """Fragt nach dem Standort."""
-        self.output("1️⃣  Standort")
-        self.output("")
-        self.output("   ℹ️  Der Standort wird für die Wettervorhersage benötigt.")
-        self.output("      Gib deine Postleitzahl oder deinen Ort ein.")
-        self.output("")
+        self._emit(
+            "1️⃣  Standort",
+            "",
+            "   ℹ️  Der Standort wird für die Wettervorhersage benötigt.",
+            "      Gib deine Postleitzahl oder deinen Ort ein.",
+            "",
+        )
 
         # Vorschlag aus existierender Config
         default_hint = ""
@@ -213,8 +461,10 @@ class SetupWizard:
             lat, lon = self._existing_config.latitude, self._existing_config.longitude
             default_hint = f" [{lat:.2f}, {lon:.2f}]"
 
+        location_prompt = f"   Postleitzahl oder Ort{default_hint}: "
+
         while True:
-            query = self.input(f"   Postleitzahl oder Ort{default_hint}: ").strip()
+            query = self.input(location_prompt).strip()
 
             # Enter bei existierender Config = übernehmen
             if not query and self._existing_config:
@@ -238,9 +488,11 @@ class SetupWizard:
                 result = geocode(query)
 
                 if result is None:
-                    self.output(f"   ❌ Keine Ergebnisse für '{query}'")
-                    self.output("   Versuche eine andere Eingabe (z.B. '44787' oder 'Bochum')")
-                    self.output("")
+                    self._emit(
+                        f"   ❌ Keine Ergebnisse für '{query}'",
+                        "   Versuche eine andere Eingabe (z.B. '44787' oder 'Bochum')",
+                        "",
+                    )
                     continue
 
                 self.output(
@@ -249,7 +501,7 @@ class SetupWizard:
                 )
 
                 confirm = self.input("   Stimmt das? [J/n]: ").strip().lower()
-                if confirm in ("", "j", "ja", "y", "yes"):
+                if confirm in _YES_OR_EMPTY:
                     self.output("   ✓")
                     self.output("")
                     self._latitude = result.latitude
@@ -270,28 +522,41 @@ class SetupWizard:
     def _prompt_manual_location_fallback(self) -> bool:
         """Fragt ob manuelle Eingabe gewünscht ist."""
         response = self.input("   Koordinaten manuell eingeben? [j/N]: ").strip().lower()
-        return response in ("j", "ja", "y", "yes")
+        return response in _YES
 
     def _prompt_manual_location(self) -> tuple[float, float, str]:
         """Manuelle Koordinaten-Eingabe."""
-        self.output("")
-        self.output("   Manuelle Eingabe:")
-        self.output("   ℹ️  Koordinaten findest du z.B. auf Google Maps (Rechtsklick → Koordinaten)")
-        self.output("")
+        self._emit(
+            "",
+            "   Manuelle Eingabe:",
+            "   ℹ️  Koordinaten findest du z.B. auf Google Maps (Rechtsklick → Koordinaten)",
+            "      Komma oder Punkt als Dezimaltrennzeichen erlaubt",
+            "",
+        )
 
         while True:
             try:
-                lat_str = self.input("   Breitengrad (z.B. 51.48): ").strip()
-                latitude = float(lat_str)
-
-                if not -90 <= latitude <= 90:
+                # Beide Werte in einer Zeile erlaubt ("51.48, 7.22" wie aus Google Maps);
+                # nur ", " bzw. ";" trennen, damit "51,48" als Dezimalkomma gilt
+                coords_str = self.input("   Breitengrad (z.B. 51.48 oder 51.48, 7.22): ")
+                values = [
+                    _parse_decimal(v)
+                    for v in coords_str.replace(";", " ").replace(", ", " ").split()
+                ]
+                if not values or len(values) > 2:
+                    raise ValueError(coords_str)
+                latitude = values[0]
+
+                if abs(latitude) > 90:
                     self.output("   ⚠️  Breitengrad muss zwischen -90 und 90 liegen.")
                     continue
 
-                lon_str = self.input("   Längengrad (z.B. 7.22): ").strip()
-                longitude = float(lon_str)
+                if len(values) == 2:
+                    longitude = values[1]
+                else:
+                    longitude = _parse_decimal(self.input("   Längengrad (z.B. 7.22): "))
 
-                if not -180 <= longitude <= 180:
+                if abs(longitude) > 180:
                     self.output("   ⚠️  Längengrad muss zwischen -180 und 180 liegen.")
                     continue
 
@@ -308,28 +573,32 @@ class SetupWizard:
 
     def _prompt_system(self, default_name: str) -> tuple[float, str]:
         """Fragt nach den Anlagenparametern."""
-        self.output("2️⃣  PV-Anlage")
-        self.output("")
-        self.output("   ℹ️  Die Peakleistung (kWp) findest du:")
-        self.output("      • Auf dem Typenschild deines Wechselrichters")
-        self.output("      • Im Anlagenpass oder Kaufvertrag")
-        self.output("      • Typische Werte: 5-15 kWp für Einfamilienhäuser")
-        self.output("")
+        self._emit(
+            "2️⃣  PV-Anlage",
+            "",
+            "   ℹ️  Die Peakleistung (kWp) findest du:",
+            "      • Auf dem Typenschild deines Wechselrichters",
+            "      • Im Anlagenpass oder Kaufvertrag",
+            "      • Typische Werte: 5-15 kWp für Einfamilienhäuser",
+            "      Komma oder Punkt als Dezimaltrennzeichen erlaubt",
+            "",
+        )
 
-        # Default aus existierender Config
+        # Default aus existierender Config (Prompt einmal vor der Schleife bauen)
         default_kwp = ""
         if self._existing_config:
             default_kwp = f" [{self._existing_config.peak_kwp}]"
+        kwp_prompt = f"   Peakleistung in kWp{default_kwp}: "
 
         while True:
             try:
-                kwp_str = self.input(f"   Peakleistung in kWp{default_kwp}: ").strip()
+                kwp_str = self.input(kwp_prompt).strip()
 
                 # Enter bei existierender Config = übernehmen
                 if not kwp_str and self._existing_config:
                     peak_kwp = self._existing_config.peak_kwp
                 else:
-                    peak_kwp = float(kwp_str)
+                    peak_kwp = _parse_decimal(kwp_str)
 
                 if peak_kwp <= 0:
                     self.output("   ⚠️  Leistung muss größer als 0 sein.")
@@ -338,7 +607,7 @@ class SetupWizard:
                 if peak_kwp > 100:
                     self.output(f"   ⚠️  {peak_kwp} kWp ist ungewöhnlich hoch für eine Hausanlage.")
                     confirm = self.input("   Stimmt der Wert? [j/N]: ").strip().lower()
-                    if confirm not in ("j", "ja", "y", "yes"):
+                    if confirm not in _YES:
                         continue
 
                 break
@@ -365,18 +634,19 @@ class SetupWizard:
         Returns:
             Tuple (forecast_source, historical_source)
         """
-        self.output("3️⃣  Wetterdaten-Quellen")
-        self.output("")
-
         # Forecast-Quelle
-        self.output("   A) Vorhersagen (für Prognosen)")
-        self.output("")
-        self.output("   [1] Open-Meteo (Standard)")
-        self.output("       ✓ Kostenlos, weltweit verfügbar")
-        self.output("")
-        self.output("   [2] DWD MOSMIX (Deutschland)")
-        self.output("       ✓ Offizielle DWD-Daten, oft genauer")
-        self.output("")
+        self._emit(
+            "3️⃣  Wetterdaten-Quellen",
+            "",
+            "   A) Vorhersagen (für Prognosen)",
+            "",
+            "   [1] Open-Meteo (Standard)",
+            "       ✓ Kostenlos, weltweit verfügbar",
+            "",
+            "   [2] DWD MOSMIX (Deutschland)",
+            "       ✓ Offizielle DWD-Daten, oft genauer",
+            "",
+        )
 
         while True:
             choice = self.input("   Auswahl [1]: ").strip()
@@ -391,22 +661,23 @@ class SetupWizard:
             else:
                 self.output("   ⚠️  Bitte 1 oder 2 eingeben.")
 
-        self.output("")
-
         # Historical-Quelle
-        self.output("   B) Historische Daten (für Training)")
-        self.output("")
-        self.output("   [1] Open-Meteo (Standard)")
-        self.output("       ✓ Schnell, keine großen Downloads")
-        self.output("       ○ Typische Abweichung: ~30%")
-        self.output("")
-        self.output("   [2] DWD HOSTRADA (Deutschland, empfohlen)")
-        self.output("       ✓ Typische Abweichung: nur ~22%")
-        self.output("       ⚠ Download: ~750 MB/Monat (5 Jahre ≈ 45 GB)")
-        self.output("       ✓ Speicher: nur wenige MB (Stream-Processing)")
-        self.output("       ⏱ Dauer: ~30 Min bei 50 Mbit/s (5 Jahre)")
-        self.output("       → Einmalig, lohnt sich für bessere Prognosen!")
-        self.output("")
+        self._emit(
+            "",
+            "   B) Historische Daten (für Training)",
+            "",
+            "   [1] Open-Meteo (Standard)",
+            "       ✓ Schnell, keine großen Downloads",
+            "       ○ Typische Abweichung: ~30%",
+            "",
+            "   [2] DWD HOSTRADA (Deutschland, empfohlen)",
+            "       ✓ Typische Abweichung: nur ~22%",
+            "       ⚠ Download: ~750 MB/Monat (5 Jahre ≈ 45 GB)",
+            "       ✓ Speicher: nur wenige MB (Stream-Processing)",
+            "       ⏱ Dauer: ~30 Min bei 50 Mbit/s (5 Jahre)",
+            "       → Einmalig, lohnt sich für bessere Prognosen!",
+            "",
+        )
 
         while True:
             choice = self.input("   Auswahl [1]: ").strip()
@@ -432,20 +703,24 @@ class SetupWizard:
 
     def _prompt_hostrada_path(self) -> str | None:
         """Fragt nach lokalem HOSTRADA-Verzeichnis."""
-        self.output("   Hast du bereits HOSTRADA-Dateien heruntergeladen?")
-        self.output("   (NetCDF-Dateien von einem früheren Download)")
-        self.output("")
+        self._emit(
+            "   Hast du bereits HOSTRADA-Dateien heruntergeladen?",
+            "   (NetCDF-Dateien von einem früheren Download)",
+            "",
+        )
 
         response = self.input("   Lokales Verzeichnis angeben? [j/N]: ").strip().lower()
 
-        if response not in ("j", "ja", "y", "yes"):
+        if response not in _YES:
             self.output("   → Dateien werden bei Bedarf heruntergeladen")
             self.output("")
             return None
 
-        self.output("")
-        self.output("   💡 Standard auf diesem Mac: /Users/Shared/hostrada")
-        self.output("")
+        self._emit(
+            "",
+            "   💡 Standard auf diesem Mac: /Users/Shared/hostrada",
+            "",
+        )
 
         while True:
             path_str = self.input("   Pfad [/Users/Shared/hostrada]: ").strip()
@@ -460,7 +735,7 @@ class SetupWizard:
             if not local_path.exists():
                 self.output(f"   ⚠️  Verzeichnis existiert nicht: {local_path}")
                 create = self.input("   Erstellen? [j/N]: ").strip().lower()
-                if create in ("j", "ja", "y", "yes"):
+                if create in _YES:
                     try:
                         local_path.mkdir(parents=True, exist_ok=True)
                         self.output(f"   ✓ Erstellt: {local_path}")
@@ -470,8 +745,16 @@ class SetupWizard:
                 else:
                     continue
 
+            if not local_path.is_dir():
+                self.output(f"   ⚠️  Kein Verzeichnis: {local_path}")
+                continue
+
             # Prüfe ob NetCDF-Dateien vorhanden
-            nc_files = list(local_path.glob("*.nc"))
+            try:
+                nc_files = _nc_file_names(local_path)
+            except OSError as e:
+                self.output(f"   ⚠️  Ordner nicht lesbar: {e}")
+                continue
             if nc_files:
                 self.output(f"   ✓ {len(nc_files)} NetCDF-Dateien gefunden")
 
@@ -481,7 +764,7 @@ class SetupWizard:
                     response = self.input(
                         "   Wetterdaten jetzt in Datenbank laden? [J/n]: "
                     ).strip().lower()
-                    if response not in ("n", "nein", "no"):
+                    if response not in _NO:
                         loaded = self._load_hostrada_to_db(str(local_path))
                         if loaded > 0:
                             self._existing_weather_records = loaded
@@ -500,20 +783,27 @@ class SetupWizard:
         Returns:
             Anzahl geladener Datensätze
         """
-        from datetime import date, timedelta
-
         from pvforecast.config import _default_db_path
-        from pvforecast.db import Database
         from pvforecast.sources.hostrada import HOSTRADASource
 
         self.output("")
         self.output("   Lade Wetterdaten...")
 
-        # Fortschrittsanzeige als Closure
-        last_month_shown = [0, 0]  # [year, month] - mutable für Closure
+        # Fortschrittsanzeige als Closure (zuletzt angezeigter Monat und
+        # Zeitpunkt des letzten Zeichnens als nonlocal)
+        shown_year = shown_month = 0
+        last_draw = float("-inf")
+        write = sys.stdout.write
+        flush = sys.stdout.flush
 
         def progress_callback(current: int, total: int, year: int, month: int):
-            """Callback für Fortschrittsanzeige."""
+            """Callback für Fortschrittsanzeige (gedrosselt, 100% immer sichtbar)."""
+            nonlocal shown_year, shown_month, last_draw
+            now = time.monotonic()
+            if now - last_draw < _PROGRESS_REDRAW_INTERVAL and current != total:
+                return
+            last_draw = now
+
             pct = (current * 100) // total
             bar_len = 20
             filled = (current * bar_len) // total
@@ -521,15 +811,13 @@ class SetupWizard:
 
             # Zeige Monat nur wenn er sich ändert
             month_str = ""
-            if (year, month) != tuple(last_month_shown):
+            if year != shown_year or month != shown_month:
                 month_str = f" → {year}-{month:02d}"
-                last_month_shown[0], last_month_shown[1] = year, month
+                shown_year, shown_month = year, month
 
             # \r für Überschreiben der Zeile
-            import sys
-
-            sys.stdout.write(f"\r   [{bar}] {pct:3d}% ({current}/{total}){month_str}    ")
-            sys.stdout.flush()
+            write(f"\r   [{bar}] {pct:3d}% ({current}/{total}){month_str}    ")
+            flush()
 
         try:
             # HOSTRADA Source initialisieren mit Progress-Callback
@@ -541,39 +829,33 @@ class SetupWizard:
                 progress_callback=progress_callback,
             )
 
-            # Verfügbaren Datumsbereich ermitteln
-            local_path = Path(local_dir)
-            nc_files = sorted(local_path.glob("*.nc"))
+            # Verfügbaren Datumsbereich ermitteln (Reihenfolge egal: Set von (Jahr, Monat))
+            nc_files = _nc_file_names(local_dir)
 
             if not nc_files:
                 self.output("   ⚠️  Keine NetCDF-Dateien gefunden")
                 return 0
 
-            # Extrahiere Jahreszahlen aus Dateinamen
-            # Format: *_gn_YYYYMMDDHH-YYYYMMDDHH.nc
-            import re
-
-            years_months = set()
-            # HOSTRADA-Pattern: *_gn_YYYYMMDDHH-YYYYMMDDHH.nc
-            hostrada_pattern = r"_gn_(\d{4})(\d{2})\d{2}\d{2}-(\d{4})(\d{2})\d{2}\d{2}\.nc$"
-            for f in nc_files:
-                match = re.search(hostrada_pattern, f.name)
-                if match:
-                    start_year, start_month = int(match.group(1)), int(match.group(2))
-                    end_year, end_month = int(match.group(3)), int(match.group(4))
-                    # Validierung
-                    if 1 <= start_month <= 12 and 1995 <= start_year <= 2100:
-                        years_months.add((start_year, start_month))
-                    if 1 <= end_month <= 12 and 1995 <= end_year <= 2100:
-                        years_months.add((end_year, end_month))
-
-            if not years_months:
+            # Extrahiere Jahreszahlen aus Dateinamen: ein finditer über alle Namen
+            # (zeilenweise verbunden) statt eines search()-Aufrufs pro Datei
+            # Nur frühester und spätester (Jahr, Monat) werden gebraucht
+            first_ym = last_ym = None
+            for match in _HOSTRADA_FILENAME_RE.finditer("\n".join(nc_files)):
+                start_year, start_month, end_year, end_month = map(int, match.groups())
+                # Validierung
+                for ym in ((start_year, start_month), (end_year, end_month)):
+                    if 1 <= ym[1] <= 12 and 1995 <= ym[0] <= 2100:
+                        if first_ym is None or ym < first_ym:
+                            first_ym = ym
+                        if last_ym is None or ym > last_ym:
+                            last_ym = ym
+
+            if first_ym is None or last_ym is None:
                 self.output("   ⚠️  Konnte Datumsbereich nicht ermitteln")
                 return 0
 
-            sorted_ym = sorted(years_months)
-            first_year, first_month = sorted_ym[0]
-            last_year, last_month = sorted_ym[-1]
+            first_year, first_month = first_ym
+            last_year, last_month = last_ym
 
             start_date = date(first_year, first_month, 1)
             # Letzter Tag des letzten Monats
@@ -588,10 +870,8 @@ class SetupWizard:
             weather_df = source.fetch_historical(start_date, end_date)
 
             # Neue Zeile nach Fortschrittsbalken
-            import sys
-
-            sys.stdout.write("\n")
-            sys.stdout.flush()
+            write("\n")
+            flush()
 
             if len(weather_df) == 0:
                 self.output("   ⚠️  Keine Wetterdaten geladen")
@@ -600,8 +880,7 @@ class SetupWizard:
             # In DB speichern (nutze bestehende Funktion)
             from pvforecast.weather import save_weather_to_db
 
-            db_path = _default_db_path()
-            db = Database(db_path)
+            db = self._get_db(_default_db_path())
             loaded = save_weather_to_db(weather_df, db)
 
             self.output(f"   ✓ {loaded:,} Wetterdatensätze geladen")
@@ -622,20 +901,17 @@ class SetupWizard:
         Returns:
             Anzahl geladener Datensätze
         """
-        from datetime import date, timedelta
-
-        from pvforecast.db import Database
-        from pvforecast.weather import fetch_historical, save_weather_to_db
+        from pvforecast.weather import _insert_weather, fetch_historical
 
         response = self.input("   Wetterdaten jetzt laden? [J/n]: ").strip().lower()
-        if response in ("n", "nein", "no"):
+        if response in _NO:
             return 0
 
         self.output("")
         self.output("   Lade Wetterdaten von Open-Meteo...")
 
         try:
-            db = Database(config.db_path)
+            db = self._get_db(config.db_path)
 
             # Lade PV-Daten Zeitraum um passende Wetterdaten zu ermitteln
             pv_range = db.get_pv_date_range()
@@ -644,33 +920,42 @@ class SetupWizard:
                 return 0
 
             start_ts, end_ts = pv_range
-            start_date = date.fromtimestamp(start_ts)
-            end_date = date.fromtimestamp(end_ts)
+            # UTC-Datum wie in weather.find_weather_gaps (kein localtime()-Lookup)
+            start_date = datetime.fromtimestamp(start_ts, timezone.utc).date()
+            end_date = datetime.fromtimestamp(end_ts, timezone.utc).date()
 
             self.output(f"   Zeitraum: {start_date} bis {end_date}")
 
-            # Wetterdaten laden (in Chunks von max 1 Jahr)
-            total_loaded = 0
+            # Wetterdaten in Chunks von max 1 Jahr
+            chunks = []
             current = start_date
             max_chunk_days = 365
-
             while current <= end_date:
                 chunk_end = min(current + timedelta(days=max_chunk_days), end_date)
+                chunks.append((current, chunk_end))
                 self.output(f"   → Lade {current} bis {chunk_end}...")
+                current = chunk_end + timedelta(days=1)
 
-                try:
-                    weather_df = fetch_historical(
+            # Chunks parallel abrufen (netzwerkgebunden, unabhängig); gespeichert
+            # wird im Haupt-Thread in einer Transaktion (ein Commit für alle Chunks)
+            total_loaded = 0
+            with ThreadPoolExecutor(max_workers=_WEATHER_FETCH_WORKERS) as pool:
+                futures = [
+                    pool.submit(
+                        fetch_historical,
                         lat=config.latitude,
                         lon=config.longitude,
-                        start=current,
+                        start=chunk_start,
                         end=chunk_end,
                     )
-                    loaded = save_weather_to_db(weather_df, db)
-                    total_loaded += loaded
-                except Exception as e:
-                    self.output(f"   ⚠️  Fehler: {e}")
-
-                current = chunk_end + timedelta(days=1)
+                    for chunk_start, chunk_end in chunks
+                ]
+                with db.connect() as conn:
+                    for future in as_completed(futures):
+                        try:
+                            total_loaded += _insert_weather(conn, future.result())
+                        except Exception as e:
+                            self.output(f"   ⚠️  Fehler: {e}")
 
             if total_loaded > 0:
                 self.output(f"   ✓ {total_loaded:,} Wetterdatensätze geladen")
@@ -688,31 +973,28 @@ class SetupWizard:
         Returns:
             Tuple (model_type, xgboost_installed)
         """
-        self.output("4️⃣  Prognose-Modell")
-        self.output("")
-        self.output("   Welches ML-Modell soll verwendet werden?")
-        self.output("")
-        self.output("   [1] RandomForest (Standard)")
-        self.output("       ✓ Keine zusätzliche Installation nötig")
-        self.output("       ✓ Schnelles Training")
-        self.output("       ○ Typische Abweichung: ~30%")
-        self.output("")
-        self.output("   [2] XGBoost (Empfohlen)")
-        self.output("       ✓ Typische Abweichung: nur ~22%")
-        self.output("       ✓ State-of-the-Art für Zeitreihen")
-        self.output("       ○ Benötigt zusätzliche Installation (~50 MB)")
-        self.output("")
-
-        # Prüfe ob XGBoost bereits installiert
-        xgboost_available = False
-        try:
-            import xgboost  # noqa: F401
+        self._emit(
+            "4️⃣  Prognose-Modell",
+            "",
+            "   Welches ML-Modell soll verwendet werden?",
+            "",
+            "   [1] RandomForest (Standard)",
+            "       ✓ Keine zusätzliche Installation nötig",
+            "       ✓ Schnelles Training",
+            "       ○ Typische Abweichung: ~30%",
+            "",
+            "   [2] XGBoost (Empfohlen)",
+            "       ✓ Typische Abweichung: nur ~22%",
+            "       ✓ State-of-the-Art für Zeitreihen",
+            "       ○ Benötigt zusätzliche Installation (~50 MB)",
+            "",
+        )
 
-            xgboost_available = True
+        # Prüfe ob XGBoost bereits installiert (ohne xgboost/OpenMP zu laden)
+        xgboost_available = _module_available("xgboost")
+        if xgboost_available:
             self.output("   ℹ️  XGBoost ist bereits installiert")
             self.output("")
-        except ImportError:
-            pass
 
         while True:
             default = "2" if xgboost_available else "1"
@@ -741,6 +1023,36 @@ class SetupWizard:
             else:
                 self.output("   ⚠️  Bitte 1 oder 2 eingeben.")
 
+    def _run_streaming(self, cmd: list[str], markers: tuple[str, ...]) -> None:
+        """Führt einen Installationsbefehl aus und zeigt Fortschrittszeilen live an.
+
+        Statt die Ausgabe bis zum Prozessende zu puffern (brew/pip können
+        minutenlang laufen), werden Zeilen mit einem der Marker sofort
+        ausgegeben, damit Hänger erkennbar sind.
+
+        Args:
+            cmd: Befehl als Argumentliste
+            markers: Teilstrings, deren Zeilen angezeigt werden
+
+        Raises:
+            subprocess.CalledProcessError: Bei Exit-Code != 0
+                (stderr enthält die letzten Ausgabezeilen)
+        """
+        tail: deque[str] = deque(maxlen=5)
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                tail.append(line)
+                if any(marker in line for marker in markers):
+                    self.output(f"      {line}")
+
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr="\n".join(tail))
+
     def _check_libomp_macos(self) -> bool:
         """Prüft ob libomp auf macOS installiert ist und bietet Installation an.
 
@@ -750,46 +1062,35 @@ class SetupWizard:
         if sys.platform != "darwin":
             return True
 
-        # Prüfe beide möglichen Pfade (Apple Silicon und Intel)
-        libomp_paths = [
-            Path("/opt/homebrew/lib/libomp.dylib"),  # Apple Silicon
-            Path("/usr/local/lib/libomp.dylib"),  # Intel
-        ]
-
-        if any(p.exists() for p in libomp_paths):
+        if _libomp_available():
             return True
 
-        self.output("")
-        self.output("   ⚠️  XGBoost benötigt libomp (OpenMP)")
-        self.output("")
+        self._emit(
+            "",
+            "   ⚠️  XGBoost benötigt libomp (OpenMP)",
+            "",
+        )
 
         # Prüfe ob Homebrew verfügbar
-        try:
-            subprocess.run(
-                ["brew", "--version"],
-                check=True,
-                capture_output=True,
+        if not _homebrew_available():
+            self._emit(
+                "   ❌ Homebrew nicht gefunden.",
+                "   💡 Installiere libomp manuell:",
+                "      brew install libomp",
+                "",
             )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            self.output("   ❌ Homebrew nicht gefunden.")
-            self.output("   💡 Installiere libomp manuell:")
-            self.output("      brew install libomp")
-            self.output("")
             return False
 
         response = self.input("   Mit Homebrew installieren? [J/n]: ").strip().lower()
-        if response in ("n", "nein", "no"):
+        if response in _NO:
             self.output("   → libomp nicht installiert")
             self.output("")
             return False
 
         self.output("   Installiere libomp...")
         try:
-            subprocess.run(
-                ["brew", "install", "libomp"],
-                check=True,
-                capture_output=True,
-            )
+            self._run_streaming(["brew", "install", "libomp"], _BREW_PROGRESS_MARKERS)
+            _libomp_available.cache_clear()
             self.output("   ✓ libomp installiert")
             return True
         except subprocess.CalledProcessError as e:
@@ -806,25 +1107,28 @@ class SetupWizard:
             return False
 
         self.output("")
-        self.output("   Installiere XGBoost...")
 
         try:
-            # Use version constraint from pyproject.toml
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "xgboost>=2.0"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            self.output("   ✓ XGBoost installiert")
+            # Paket schon vorhanden (z.B. nur Import fehlgeschlagen): pip überspringen
+            if _distribution_installed("xgboost"):
+                self.output("   ℹ️  XGBoost-Paket ist bereits installiert")
+            else:
+                self.output("   Installiere XGBoost...")
+                # Use version constraint from pyproject.toml
+                self._run_streaming(_pip_install_cmd("xgboost>=2.0"), _PIP_PROGRESS_MARKERS)
+                self.output("   ✓ XGBoost installiert")
 
             # Wichtig: XGBoost im laufenden Prozess verfügbar machen
             # Der normale Import-Cache verhindert sonst, dass das neu
             # installierte Paket erkannt wird
+            from pvforecast.model import reload_xgboost
+
             if not reload_xgboost():
-                self.output("   ⚠️  XGBoost installiert, aber Import fehlgeschlagen")
-                self.output("   💡 Starte pvforecast neu für Training")
-                self.output("")
+                self._emit(
+                    "   ⚠️  XGBoost installiert, aber Import fehlgeschlagen",
+                    "   💡 Starte pvforecast neu für Training",
+                    "",
+                )
                 return False
 
             self.output("")
@@ -836,9 +1140,11 @@ class SetupWizard:
             self.output("")
 
             if sys.platform == "darwin":
-                self.output("   💡 Auf macOS benötigt XGBoost eventuell libomp:")
-                self.output("      brew install libomp")
-                self.output("")
+                self._emit(
+                    "   💡 Auf macOS benötigt XGBoost eventuell libomp:",
+                    "      brew install libomp",
+                    "",
+                )
 
             return False
 
@@ -852,12 +1158,7 @@ class SetupWizard:
         self.output("   Installiere Optuna...")
 
         try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "optuna>=3.0"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            self._run_streaming(_pip_install_cmd("optuna>=3.0"), _PIP_PROGRESS_MARKERS)
             self.output("   ✓ Optuna installiert")
             return True
         except subprocess.CalledProcessError as e:
@@ -871,27 +1172,23 @@ class SetupWizard:
         if self._existing_db_records < 1000:
             return False
 
-        self.output("5️⃣  Hyperparameter-Tuning")
-        self.output("")
-        self.output("   ℹ️  Tuning optimiert das Modell für deine Anlage.")
-        self.output("      Das verbessert die Genauigkeit um ~5-10%.")
-        self.output("")
-        self.output(f"      Du hast {self._existing_db_records:,} Datensätze - genug für Tuning!")
-        self.output("")
-        self.output("   Optionen:")
-        self.output("   [1] Kein Tuning (schnell, Standard-Parameter)")
-        self.output("   [2] Schnelles Tuning (~2 Min, 20 Versuche)")
-        self.output("   [3] Gründliches Tuning (~10 Min, 100 Versuche)")
-        self.output("")
+        self._emit(
+            "5️⃣  Hyperparameter-Tuning",
+            "",
+            "   ℹ️  Tuning optimiert das Modell für deine Anlage.",
+            "      Das verbessert die Genauigkeit um ~5-10%.",
+            "",
+            f"      Du hast {self._fmt_db_records} Datensätze - genug für Tuning!",
+            "",
+            "   Optionen:",
+            "   [1] Kein Tuning (schnell, Standard-Parameter)",
+            "   [2] Schnelles Tuning (~2 Min, 20 Versuche)",
+            "   [3] Gründliches Tuning (~10 Min, 100 Versuche)",
+            "",
+        )
 
         # Prüfe ob Optuna verfügbar
-        optuna_available = False
-        try:
-            import optuna  # noqa: F401
-
-            optuna_available = True
-        except ImportError:
-            pass
+        optuna_available = _module_available("optuna")
 
         if optuna_available:
             self.output("   ℹ️  Optuna ist installiert - Bayesian Optimization verfügbar")
@@ -912,7 +1209,7 @@ class SetupWizard:
                     self.output("")
                     self.output("   ℹ️  Optuna ermöglicht besseres Tuning (Bayesian Optimization)")
                     response = self.input("   Optuna installieren? [J/n]: ").strip().lower()
-                    if response not in ("n", "nein", "no"):
+                    if response not in _NO:
                         if self._install_optuna():
                             optuna_available = True
                     self.output("")
@@ -935,24 +1232,28 @@ class SetupWizard:
         if self._existing_db_records > 0:
             return 0
 
-        self.output("6️⃣  Daten importieren")
-        self.output("")
-        self.output("   ℹ️  Unterstützte Formate:")
-        self.output("      • E3DC Portal Export (CSV)")
-        self.output("      • CSV mit Spalten: Zeitstempel, PV-Leistung")
-        self.output("")
+        self._emit(
+            "6️⃣  Daten importieren",
+            "",
+            "   ℹ️  Unterstützte Formate:",
+            "      • E3DC Portal Export (CSV)",
+            "      • CSV mit Spalten: Zeitstempel, PV-Leistung",
+            "",
+        )
 
         response = self.input("   Hast du CSV-Dateien zum Importieren? [j/N]: ").strip().lower()
 
-        if response not in ("j", "ja", "y", "yes"):
+        if response not in _YES:
             self.output("   → Übersprungen")
             self.output("")
             return 0
 
-        self.output("")
-        self.output("   Gib den Pfad ein (Ordner oder Datei):")
-        self.output("   💡 Tipp: Ziehe den Ordner ins Terminal für den Pfad")
-        self.output("")
+        self._emit(
+            "",
+            "   Gib den Pfad ein (Ordner oder Datei):",
+            "   💡 Tipp: Ziehe den Ordner ins Terminal für den Pfad",
+            "",
+        )
 
         while True:
             path_str = self.input("   Pfad: ").strip()
@@ -965,62 +1266,60 @@ class SetupWizard:
             # Entferne Anführungszeichen (von Drag&Drop)
             path_str = path_str.strip("'\"")
 
-            # Expandiere ~ und Wildcards
-            import glob as glob_module
-
-            expanded_path = str(Path(path_str).expanduser())
+            # Expandiere ~ (auf dem String, ohne Umweg über Path)
+            expanded_path = os.path.expanduser(path_str)
 
             # Prüfe ob Wildcards vorhanden
             if "*" in expanded_path or "?" in expanded_path:
-                # Glob-Expansion für Wildcards
-                matched_paths = glob_module.glob(expanded_path)
+                # glob löst Wildcards auch im Verzeichnisteil auf; Path-Objekte
+                # nur für die tatsächlich importierten Dateien
+                matched_paths = sorted(glob.glob(expanded_path))
                 if not matched_paths:
                     self.output(f"   ⚠️  Keine Dateien gefunden für: {path_str}")
                     continue
-                files = [Path(p) for p in matched_paths if p.endswith((".csv", ".CSV"))]
+                files = [Path(p) for p in matched_paths if p.lower().endswith(".csv")]
                 if not files:
                     self.output(f"   ⚠️  Keine CSV-Dateien gefunden für: {path_str}")
                     continue
-            else:
-                import_path = Path(expanded_path)
-                if not import_path.exists():
-                    self.output(f"   ⚠️  Pfad existiert nicht: {import_path}")
+            elif os.path.isfile(expanded_path):
+                files = [Path(expanded_path)]
+            elif os.path.isdir(expanded_path):
+                # Ein Verzeichnisdurchlauf statt zwei glob()-Pässen (.csv/.CSV)
+                try:
+                    files = _csv_files(expanded_path)
+                except OSError as e:
+                    self.output(f"   ⚠️  Ordner nicht lesbar: {e}")
                     continue
-
-                if import_path.is_file():
-                    files = [import_path]
-                else:
-                    files = list(import_path.glob("*.csv")) + list(import_path.glob("*.CSV"))
+            else:
+                self.output(f"   ⚠️  Pfad existiert nicht: {expanded_path}")
+                continue
 
             # Import durchführen
             try:
-                from pvforecast.data_loader import import_csv_files
-                from pvforecast.db import Database
+                from pvforecast.data_loader import import_csv_files_with_errors
 
-                db = Database(config.db_path)
+                db = self._get_db(config.db_path)
 
                 if not files:
-                    self.output(f"   ⚠️  Keine CSV-Dateien gefunden in: {import_path}")
+                    self.output(f"   ⚠️  Keine CSV-Dateien gefunden in: {expanded_path}")
                     continue
 
                 self.output(f"   Importiere {len(files)} Datei(en)...")
 
-                total_imported = 0
-                for csv_file in files:
-                    try:
-                        count = import_csv_files([csv_file], db)
-                        total_imported += count
-                    except Exception as e:
-                        self.output(f"   ⚠️  {csv_file.name}: {e}")
+                # Ein Aufruf für alle Dateien: eine Transaktion statt eine pro Datei
+                # (fehlerhafte Dateien werden einzeln zurückgerollt und gemeldet)
+                total_imported, failures = import_csv_files_with_errors(files, db)
+                for failed_path, error in failures:
+                    self.output(f"   ⚠️  {failed_path.name}: {error}")
 
                 if total_imported > 0:
-                    self.output(f"   ✓ {total_imported:,} Datensätze importiert")
-                    self._existing_db_records = total_imported
+                    self._set_db_records(total_imported)
+                    self.output(f"   ✓ {self._fmt_db_records} Datensätze importiert")
 
                     # Issue #149: Training nach Import anbieten
                     self.output("")
                     response = self.input("   Jetzt Modell trainieren? [J/n]: ").strip().lower()
-                    if response not in ("n", "nein", "no"):
+                    if response not in _NO:
                         self._run_training_after_import = True
                     else:
                         self._run_training_after_import = False
@@ -1045,24 +1344,27 @@ class SetupWizard:
         Returns:
             True wenn Training erfolgreich, False sonst.
         """
-        self.output("")
-        self.output("🔄 Training wird gestartet...")
-        self.output("")
+        self._emit(
+            "",
+            "🔄 Training wird gestartet...",
+            "",
+        )
 
         try:
+            from pvforecast import model as pv_model
             from pvforecast.config import _default_model_path
-            from pvforecast.db import Database
             from pvforecast.model import save_model, train
 
-            db = Database(config.db_path)
+            db = self._get_db(config.db_path)
             model_path = _default_model_path()
 
             # Issue #156: Vor Training prüfen ob Wetterdaten vorhanden sind
-            weather_count = db.get_weather_count()
-            if weather_count == 0:
-                self.output("   ⚠️  Keine Wetterdaten vorhanden!")
-                self.output("   Training benötigt historische Wetterdaten.")
-                self.output("")
+            if not db.has_weather_records():
+                self._emit(
+                    "   ⚠️  Keine Wetterdaten vorhanden!",
+                    "   Training benötigt historische Wetterdaten.",
+                    "",
+                )
 
                 # Anbieten Wetterdaten zu laden
                 loaded = self._fetch_weather_for_training(config)
@@ -1072,25 +1374,25 @@ class SetupWizard:
                     self._training_completed = False
                     return False
 
-            # Prüfe ob gewähltes Modell verfügbar ist
-            if model_type == "xgb":
-                try:
-                    import xgboost  # noqa: F401
-                except ImportError:
-                    self.output("   ⚠️  XGBoost ist nicht installiert!")
-                    self.output("")
-                    response = self.input("   Jetzt installieren? [J/n]: ").strip().lower()
-                    if response not in ("n", "nein", "no"):
-                        if self._install_xgboost():
-                            self.output("")
-                        else:
-                            self.output("   → Fallback auf RandomForest")
-                            self.output("")
-                            model_type = "rf"
+            # Prüfe ob gewähltes Modell verfügbar ist. Echter Import-Status statt
+            # find_spec: installiertes, aber nicht ladbares xgboost (z.B. fehlendes
+            # libomp auf macOS) muss Installation/Fallback anbieten. Der Import
+            # von pvforecast.model oben hat xgboost ohnehin schon versucht.
+            if model_type == "xgb" and not pv_model.XGBOOST_AVAILABLE:
+                self.output("   ⚠️  XGBoost ist nicht installiert!")
+                self.output("")
+                response = self.input("   Jetzt installieren? [J/n]: ").strip().lower()
+                if response not in _NO:
+                    if self._install_xgboost():
+                        self.output("")
                     else:
                         self.output("   → Fallback auf RandomForest")
                         self.output("")
                         model_type = "rf"
+                else:
+                    self.output("   → Fallback auf RandomForest")
+                    self.output("")
+                    model_type = "rf"
 
             # Training durchführen
             model, metrics = train(
@@ -1101,14 +1403,17 @@ class SetupWizard:
                 peak_kwp=config.peak_kwp,
             )
 
-            # Modell speichern
+            # Modell speichern (und für die Test-Prognose im Speicher behalten)
             save_model(model, model_path, metrics)
+            self._trained_model = (model, metrics)
 
             # MAPE ist bereits in Prozent (z.B. 22.4 für 22.4%)
             mape = metrics.get("mape", 0) if metrics else 0
-            self.output(f"   ✓ Modell trainiert: {model_type}")
-            self.output(f"   ✓ Genauigkeit: ~{mape:.0f}% Abweichung (MAPE)")
-            self.output("")
+            self._emit(
+                f"   ✓ Modell trainiert: {model_type}",
+                f"   ✓ Genauigkeit: ~{mape:.0f}% Abweichung (MAPE)",
+                "",
+            )
             self._training_completed = True
             return True
 
@@ -1125,72 +1430,83 @@ class SetupWizard:
             config: Die aktuelle Konfiguration
         """
         try:
-            from datetime import datetime
-
+            from pvforecast.cli.helpers import get_forecast_source
             from pvforecast.config import _default_model_path
             from pvforecast.model import load_model, predict
-            from pvforecast.weather import fetch_forecast
 
             model_path = _default_model_path()
             if not model_path.exists():
                 return
 
-            self.output("")
-            self.output("🎉 Test-Prognose für heute:")
-            self.output("")
-
-            # Wetterdaten holen
-            weather_df = fetch_forecast(
-                latitude=config.latitude,
-                longitude=config.longitude,
-                provider=config.weather.forecast_provider,
+            self._emit(
+                "",
+                "🎉 Test-Prognose für heute:",
+                "",
             )
 
-            # Modell laden
-            model, metrics = load_model(model_path)
+            # Gerade trainiertes Modell wiederverwenden statt es neu zu laden
+            if self._trained_model is not None:
+                model, metrics = self._trained_model
+            else:
+                model, metrics = load_model(model_path)
 
-            # Prognose erstellen
-            predictions_df = predict(
-                model=model,
-                weather_df=weather_df,
-                peak_kwp=config.peak_kwp,
+            # Wetterdaten holen
+            weather_df = get_forecast_source(config).fetch_forecast(hours=24)
+
+            # Nur heute (lokale Zeit): Tagesgrenzen einmal als Unix-Sekunden,
+            # dann ganzzahliger Vergleich auf der timestamp-Spalte
+            tz = ZoneInfo(config.timezone)
+            today = datetime.now(tz).date()
+            day_start = int(datetime(today.year, today.month, today.day, tzinfo=tz).timestamp())
+            tomorrow = today + timedelta(days=1)
+            day_end = int(
+                datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=tz).timestamp()
+            )
+            ts = weather_df["timestamp"].to_numpy()
+            today_df = weather_df[(ts >= day_start) & (ts < day_end)]
+
+            # Prognose erstellen (nur für heute)
+            forecast = predict(
+                model,
+                today_df,
+                config.latitude,
+                config.longitude,
+                config.peak_kwp,
+                mode="predict",
+                model_version=metrics.get("model_version") if metrics else None,
+                pv_arrays=config.pv_arrays or None,
+                install_date=config.install_date,
             )
 
             # Nur Tageslicht-Stunden zeigen (9-17 Uhr, max 5 Zeilen)
-            now = datetime.now()
-            today_mask = predictions_df.index.date == now.date()
-            hour_mask = (predictions_df.index.hour >= 9) & (predictions_df.index.hour <= 17)
-            day_predictions = predictions_df[today_mask & hour_mask]
+            day_hours = [
+                (local, h)
+                for h in forecast.hourly
+                if 9 <= (local := h.timestamp.astimezone(tz)).hour <= 17
+            ][:5]
 
-            if day_predictions.empty:
+            if not day_hours:
                 self.output("   (Keine Prognose für heute verfügbar)")
                 return
 
             self.output("    Zeit    Ertrag  Wetter")
             self.output("   ─────────────────────────")
 
-            # Zeige max 5 Stunden
-            for idx, row in day_predictions.head(5).iterrows():
-                hour = idx.strftime("%H:%M")
-                power_kw = row["predicted_power"] / 1000
-
-                # Wetter-Emoji basierend auf cloud_cover
-                emoji = "  "
-                if "cloud_cover" in row:
-                    cc = row["cloud_cover"]
-                    if cc < 20:
-                        emoji = "☀️"
-                    elif cc < 50:
-                        emoji = "⛅"
-                    else:
-                        emoji = "☁️"
+            for local, h in day_hours:
+                # Wetter-Emoji basierend auf Bewölkung
+                cc = h.cloud_cover_pct
+                if cc < 20:
+                    emoji = "☀️"
+                elif cc < 50:
+                    emoji = "⛅"
+                else:
+                    emoji = "☁️"
 
-                self.output(f"   {hour}   {power_kw:5.1f} kW  {emoji}")
+                self.output(f"   {local:%H:%M}   {h.production_w / 1000:5.1f} kW  {emoji}")
 
-            # Tagesertrag berechnen
-            today_total = predictions_df[today_mask]["predicted_power"].sum() / 1000
+            # Tagesertrag (Summe aller heutigen Stunden)
             self.output("")
-            self.output(f"   Tagesertrag: ~{today_total:.1f} kWh")
+            self.output(f"   Tagesertrag: ~{forecast.total_kwh:.1f} kWh")
 
         except Exception as e:
             # Bei Fehlern still ignorieren - Test-Prognose ist optional
@@ -1200,37 +1516,43 @@ class SetupWizard:
         self, config_path: Path, model_type: str, run_tuning: bool, imported_count: int = 0
     ) -> None:
         """Gibt die Erfolgsmeldung und nächste Schritte aus."""
-        self.output("")
-        self.output("═" * 50)
-        self.output("✅ Einrichtung abgeschlossen!")
-        self.output("═" * 50)
-        self.output("")
-        self.output(f"   Config gespeichert: {config_path}")
+        self._emit(
+            "",
+            _SEPARATOR,
+            "✅ Einrichtung abgeschlossen!",
+            _SEPARATOR,
+            "",
+            f"   Config gespeichert: {config_path}",
+        )
 
         # Issue #150: Test-Prognose zeigen wenn Training abgeschlossen
         if self._training_completed:
             # Config wird benötigt für Test-Prognose, holen wir aus dem Pfad
             try:
-                config = Config.load(config_path)
+                config = load_config(config_path)
                 self._show_test_forecast(config)
             except Exception:
                 pass  # Still ignorieren wenn es nicht klappt
 
-        self.output("")
-        self.output("   Nächste Schritte:")
-        self.output("")
+        self._emit(
+            "",
+            "   Nächste Schritte:",
+            "",
+        )
 
         step = 1
 
         # Datenimport nur wenn keine Daten vorhanden und nicht gerade importiert
         if self._existing_db_records == 0 and imported_count == 0:
-            self.output(f"   {step}. Daten importieren:")
-            self.output("      pvforecast import ~/Downloads/*.csv")
-            self.output("")
+            self._emit(
+                f"   {step}. Daten importieren:",
+                "      pvforecast import ~/Downloads/*.csv",
+                "",
+            )
             step += 1
         elif self._existing_db_records > 0 or imported_count > 0:
-            total = self._existing_db_records or imported_count
-            self.output(f"   ✓ {total:,} Datensätze vorhanden")
+            total = self._fmt_db_records if self._existing_db_records else f"{imported_count:,}"
+            self.output(f"   ✓ {total} Datensätze vorhanden")
             self.output("")
 
         # Training - nur anzeigen wenn noch nicht durchgeführt
@@ -1246,16 +1568,20 @@ class SetupWizard:
         # Tuning
         if run_tuning:
             trials = getattr(self, "_tuning_trials", 20)
-            self.output("")
-            self.output(f"   {step}. Tuning durchführen:")
-            self.output(f"      pvforecast tune --trials {trials}")
+            self._emit(
+                "",
+                f"   {step}. Tuning durchführen:",
+                f"      pvforecast tune --trials {trials}",
+            )
             step += 1
 
         # Prognose
-        self.output("")
-        self.output(f"   {step}. Prognose erstellen:")
-        self.output("      pvforecast today")
-        self.output("")
+        self._emit(
+            "",
+            f"   {step}. Prognose erstellen:",
+            "      pvforecast today",
+            "",
+        )
 
 
 def run_setup() -> SetupResult:
@@ -9,9 +9,11 @@ URL: https://opendata.dwd.de/climate_environment/CDC/grids_germany/hourly/hostra
 
 from __future__ import annotations
 
+import json
 import logging
 import sys
 import tempfile
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
@@ -28,6 +30,26 @@ logger = logging.getLogger(__name__)
 # Base URL for HOSTRADA data
 HOSTRADA_BASE_URL = "https://opendata.dwd.de/climate_environment/CDC/grids_germany/hourly/hostrada"
 
+# Unit spellings of the NetCDF "units" attribute (lower case). Files without
+# a recognised unit fall back to guessing from the value range.
+_KELVIN_UNITS = {"k", "kelvin"}
+_CELSIUS_UNITS = {"degc", "deg_c", "°c", "c", "celsius", "degree_celsius"}
+_OKTA_UNITS = {"okta", "oktas", "octa", "octas", "1/8"}
+_PERCENT_UNITS = {"%", "percent"}
+
+# Grid coverage (Germany); points outside have no data in any file
+HOSTRADA_LAT_RANGE = (46.68, 55.53)
+HOSTRADA_LON_RANGE = (4.63, 16.35)
+
+# Concurrent downloads per fetch (files are ~150 MB each; kept small out of
+# fairness to the DWD server and to bound temporary disk usage)
+HOSTRADA_DOWNLOAD_WORKERS = 4
+
+# Downloads submitted but not yet extracted. The next file is only requested
+# after a finished one has been parsed and deleted, so at most this many
+# temporary files exist at once even when parsing is slower than downloading.
+HOSTRADA_MAX_PENDING_FILES = 2 * HOSTRADA_DOWNLOAD_WORKERS
+
 # Parameter mapping: our name -> HOSTRADA directory and variable
 HOSTRADA_PARAMS = {
     "ghi": ("radiation_downwelling", "rsds"),
@@ -49,15 +71,27 @@ class GridPoint:
     distance_km: float
 
 
+@dataclass
+class _MonthlyData:
+    """Grid-point time series of one monthly HOSTRADA file."""
+
+    values: np.ndarray
+    times: np.ndarray  # datetime64
+    units: str  # NetCDF "units" attribute, lower case
+
+
 class HOSTRADASource(HistoricalSource):
     """HOSTRADA historical weather data source.
 
     Provides hourly gridded weather data for any location in Germany.
     Data is available from 1995 to approximately 1-2 months before present.
 
-    Downloads are processed in-memory (no disk cache) to minimize storage.
-    Each NetCDF file (~150 MB) is downloaded, the nearest grid point extracted,
-    and the data discarded immediately.
+    Downloads are not cached to minimize storage. Each NetCDF file (~150 MB)
+    is streamed to a temporary file, the nearest grid point extracted, and the
+    file deleted immediately. Up to HOSTRADA_DOWNLOAD_WORKERS files are
+    downloaded concurrently over one shared HTTP connection pool; parsing
+    stays in the calling thread (HDF5 is not thread-safe). At most
+    HOSTRADA_MAX_PENDING_FILES temporary files exist at any time.
 
     Args:
         latitude: Location latitude (46.68 - 55.53)
@@ -165,102 +199,184 @@ class HOSTRADASource(HistoricalSource):
 
         return local_months
 
-    def _extract_from_file(self, file_path: Path, var_name: str) -> pd.Series:
+    def _extract_from_file(self, file_path: Path, var_name: str) -> _MonthlyData:
         """Extract time series from a local NetCDF file."""
-        ds = xr.open_dataset(file_path)
+        # cache=False: only the single grid-point column is read, nothing is
+        # kept in memory after the file is closed
+        ds = xr.open_dataset(file_path, cache=False)
         try:
             grid_point = self._find_grid_point(ds)
-            data = ds[var_name][:, grid_point.y_idx, grid_point.x_idx]
-
-            series = pd.Series(
-                data.values,
-                index=pd.DatetimeIndex(data.time.values),
-                name=var_name,
+            var = ds[var_name]
+            y_dim, x_dim = var.dims[-2:]
+            data = var.isel({y_dim: grid_point.y_idx, x_dim: grid_point.x_idx})
+
+            # Plain arrays: fetch_historical concatenates them and builds the
+            # DatetimeIndex once. The unit picks conversions there.
+            return _MonthlyData(
+                values=data.values,
+                times=data.time.values,
+                units=str(var.attrs.get("units", "")).strip().lower(),
             )
-            return series
         finally:
             ds.close()
 
-    def _download_and_extract(self, url: str, var_name: str) -> pd.Series:
-        """Download NetCDF, extract grid point, delete file immediately.
-
-        Uses a temporary file to minimize memory usage and support lazy loading.
-        The file is automatically deleted after extraction.
+    def _make_client(self) -> httpx.Client:
+        """HTTP client whose pool matches the number of download workers."""
+        return httpx.Client(
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=HOSTRADA_DOWNLOAD_WORKERS),
+        )
 
-        If local_dir is set and file exists there, uses local file instead.
+    def _download(self, url: str, client: httpx.Client) -> Path:
+        """Stream a NetCDF file into a temporary file.
 
         Args:
             url: URL of the NetCDF file
-            var_name: Variable name to extract
+            client: Shared HTTP client
 
         Returns:
-            Time series for the nearest grid point
+            Path of the temporary file (the caller deletes it)
 
         Raises:
-            WeatherSourceError: On download or parse failure
+            WeatherSourceError: On download failure
         """
-        # Check for local file first
-        local_path = self._get_local_path(url)
-        if local_path:
-            # Use DEBUG level when progress_callback is set (to avoid spamming)
-            if self.progress_callback:
-                logger.debug(f"Using local file: {local_path.name}")
-            else:
-                logger.info(f"Using local file: {local_path.name}")
-            return self._extract_from_file(local_path, var_name)
-
         logger.debug(f"Downloading: {url}")
 
-        # Download to temporary file
+        tmp = tempfile.NamedTemporaryFile(suffix=".nc", delete=False)
+        tmp_path = Path(tmp.name)
         try:
-            with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
-                response = client.get(url)
+            with tmp, client.stream("GET", url) as response:
                 response.raise_for_status()
+                for chunk in response.iter_bytes(1 << 20):
+                    tmp.write(chunk)
         except httpx.HTTPStatusError as e:
+            tmp_path.unlink(missing_ok=True)
             if e.response.status_code == 404:
                 raise WeatherSourceError(f"HOSTRADA file not found: {url}") from e
             raise WeatherSourceError(f"HTTP error downloading {url}: {e}") from e
         except httpx.RequestError as e:
+            tmp_path.unlink(missing_ok=True)
             raise WeatherSourceError(f"Request error downloading {url}: {e}") from e
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
-        # Write to temp file, extract, delete
-        with tempfile.NamedTemporaryFile(suffix=".nc", delete=True) as tmp:
-            tmp.write(response.content)
-            tmp.flush()
+        return tmp_path
 
-            return self._extract_from_file(Path(tmp.name), var_name)
-        # Temp file is automatically deleted when context exits
+    def _resolve_file(self, url: str, client: httpx.Client) -> tuple[Path, bool]:
+        """Return a local copy of the file, downloading it if necessary.
 
-    def _find_grid_point(self, ds: xr.Dataset) -> GridPoint:
-        """Find nearest grid point to target coordinates."""
-        if self._grid_point is not None:
-            return self._grid_point
+        If local_dir is set and the file exists there, it is used directly.
 
-        lat_diff = np.abs(ds.lat.values - self.latitude)
-        lon_diff = np.abs(ds.lon.values - self.longitude)
-        distance = np.sqrt(lat_diff**2 + lon_diff**2)
+        Returns:
+            Tuple (path, is_temporary)
 
-        min_idx = np.unravel_index(np.argmin(distance), distance.shape)
-        y_idx, x_idx = min_idx
+        Raises:
+            WeatherSourceError: On download failure
+        """
+        local_path = self._get_local_path(url)
+        if local_path:
+            # Use DEBUG level when progress_callback is set (to avoid spamming)
+            if self.progress_callback:
+                logger.debug(f"Using local file: {local_path.name}")
+            else:
+                logger.info(f"Using local file: {local_path.name}")
+            return local_path, False
 
-        grid_lat = float(ds.lat[y_idx, x_idx])
-        grid_lon = float(ds.lon[y_idx, x_idx])
-        distance_deg = float(distance[y_idx, x_idx])
-        distance_km = distance_deg * 111  # Approximate conversion
+        return self._download(url, client), True
 
-        self._grid_point = GridPoint(
+    def _grid_cache_path(self) -> Path | None:
+        """JSON file caching the grid point next to the local NetCDF files."""
+        if not self.local_dir:
+            return None
+        return self.local_dir / f".grid_{self.latitude:.4f}_{self.longitude:.4f}.json"
+
+    def _load_cached_grid_point(self, ds: xr.Dataset) -> GridPoint | None:
+        """Load the cached grid point if it matches the grid of ``ds``.
+
+        Only the grid shape (metadata) and the two coordinates at the cached
+        index are read, not the full lat/lon arrays.
+        """
+        cache_path = self._grid_cache_path()
+        if cache_path is None:
+            return None
+        try:
+            cached = json.loads(cache_path.read_text())
+            y_idx, x_idx = cached["y"], cached["x"]
+            if (
+                list(ds.lat.shape) != cached["shape"]
+                or float(ds.lat[y_idx, x_idx]) != cached["lat"]
+                or float(ds.lon[y_idx, x_idx]) != cached["lon"]
+            ):
+                return None
+            return GridPoint(
+                y_idx=y_idx,
+                x_idx=x_idx,
+                lat=cached["lat"],
+                lon=cached["lon"],
+                distance_km=cached["distance_km"],
+            )
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            return None
+
+    def _save_cached_grid_point(self, grid_point: GridPoint, shape: tuple[int, ...]) -> None:
+        """Persist the grid point so later runs can skip the grid scan."""
+        cache_path = self._grid_cache_path()
+        if cache_path is None:
+            return
+        data = {
+            "y": grid_point.y_idx,
+            "x": grid_point.x_idx,
+            "shape": list(shape),
+            "lat": grid_point.lat,
+            "lon": grid_point.lon,
+            "distance_km": grid_point.distance_km,
+        }
+        try:
+            cache_path.write_text(json.dumps(data))
+        except OSError as e:
+            logger.debug(f"Could not write grid cache {cache_path}: {e}")
+
+    def _scan_grid(self, ds: xr.Dataset) -> GridPoint:
+        """Search the full lat/lon grid for the nearest point."""
+        lat = ds.lat.values
+        lon = ds.lon.values
+
+        # argmin on the squared distance (sqrt is monotonic, only needed once)
+        dist_sq = (lat - self.latitude) ** 2
+        dist_sq += (lon - self.longitude) ** 2
+        flat_idx = int(dist_sq.argmin())
+        y_idx, x_idx = divmod(flat_idx, dist_sq.shape[1])
+
+        distance_deg = float(np.sqrt(dist_sq.flat[flat_idx]))
+        grid_point = GridPoint(
             y_idx=y_idx,
             x_idx=x_idx,
-            lat=grid_lat,
-            lon=grid_lon,
-            distance_km=distance_km,
+            lat=float(lat[y_idx, x_idx]),
+            lon=float(lon[y_idx, x_idx]),
+            distance_km=distance_deg * 111,  # Approximate conversion
         )
+        self._save_cached_grid_point(grid_point, lat.shape)
+        return grid_point
+
+    def _find_grid_point(self, ds: xr.Dataset) -> GridPoint:
+        """Find nearest grid point to target coordinates.
+
+        Resolved once per instance; with local_dir the result is also cached
+        on disk (validated against the grid on reuse).
+        """
+        if self._grid_point is not None:
+            return self._grid_point
+
+        self._grid_point = self._load_cached_grid_point(ds) or self._scan_grid(ds)
 
         # Use DEBUG level when progress_callback is set
         log_fn = logger.debug if self.progress_callback else logger.info
         log_fn(
             f"Grid point for ({self.latitude:.4f}, {self.longitude:.4f}): "
-            f"({grid_lat:.4f}, {grid_lon:.4f}), distance: {distance_km:.1f} km"
+            f"({self._grid_point.lat:.4f}, {self._grid_point.lon:.4f}), "
+            f"distance: {self._grid_point.distance_km:.1f} km"
         )
 
         return self._grid_point
@@ -282,7 +398,20 @@ class HOSTRADASource(HistoricalSource):
                 - humidity_pct: Humidity [%]
                 - dhi_wm2: Diffuse irradiance [W/m²] (estimated)
                 - dni_wm2: Direct normal irradiance [W/m²] (0)
+
+        Raises:
+            WeatherSourceError: If the location is outside the HOSTRADA grid
+            DownloadError: If no data could be fetched
         """
+        # Reject locations outside Germany before any download or grid scan
+        lat_min, lat_max = HOSTRADA_LAT_RANGE
+        lon_min, lon_max = HOSTRADA_LON_RANGE
+        if not (lat_min <= self.latitude <= lat_max and lon_min <= self.longitude <= lon_max):
+            raise WeatherSourceError(
+                f"Location ({self.latitude}, {self.longitude}) outside HOSTRADA coverage "
+                f"(lat {lat_min}-{lat_max}, lon {lon_min}-{lon_max})"
+            )
+
         parameters = ["ghi", "temperature", "cloud_cover", "humidity", "wind_speed"]
 
         # Convert dates to datetime for internal processing
@@ -290,14 +419,7 @@ class HOSTRADASource(HistoricalSource):
         end_dt = datetime.combine(end, datetime.max.time().replace(microsecond=0))
 
         # Generate list of months to download
-        months = []
-        current = datetime(start.year, start.month, 1)
-        while current <= end_dt:
-            months.append((current.year, current.month))
-            if current.month == 12:
-                current = datetime(current.year + 1, 1, 1)
-            else:
-                current = datetime(current.year, current.month + 1, 1)
+        months = [(p.year, p.month) for p in pd.period_range(start, end, freq="M")]
 
         total_files = len(months) * len(parameters)
         # Use DEBUG level when progress_callback is set
@@ -306,57 +428,86 @@ class HOSTRADASource(HistoricalSource):
             f"Fetching {len(months)} months × {len(parameters)} params = {total_files} files"
         )
 
-        # Fetch each parameter
-        all_series = {}
+        # Build list of all downloads (parameter-major, months in order)
+        downloads = [(param, year, month) for param in parameters for year, month in months]
+
+        results: dict[tuple[str, int, int], _MonthlyData] = {}
         success_count = 0
         error_count = 0
 
-        # Build list of all downloads for progress bar
-        downloads = [(param, year, month) for param in parameters for year, month in months]
+        def fetch_file(param: str, year: int, month: int) -> tuple[Path, bool]:
+            param_dir, var_name = HOSTRADA_PARAMS[param]
+            url = self._get_file_url(param_dir, var_name, year, month)
+            return self._resolve_file(url, client)
 
-        def process_downloads(items):
-            """Process downloads, yielding results."""
-            nonlocal success_count, error_count
-
-            for param, year, month in items:
-                param_dir, var_name = HOSTRADA_PARAMS[param]
-                try:
-                    url = self._get_file_url(param_dir, var_name, year, month)
-                    series = self._download_and_extract(url, var_name)
-                    yield param, series
-                    success_count += 1
-                except WeatherSourceError as e:
-                    logger.debug(f"Failed to fetch {param} for {year}-{month:02d}: {e}")
-                    error_count += 1
-                    yield param, None
-
-        # Process with or without progress indicator
+        # Downloads run concurrently in a bounded window; extraction and progress
+        # stay in this thread
+        queued = iter(downloads)
+        pending: dict[Future, tuple[str, int, int]] = {}
         current = 0
-        current_year, current_month = 0, 0
-        for param, series in process_downloads(downloads):
-            current += 1
-            # Track current month being processed
-            idx = (current - 1) // len(parameters)
-            if idx < len(months):
-                current_year, current_month = months[idx]
-
-            # Custom progress callback
-            if self.progress_callback:
-                self.progress_callback(current, total_files, current_year, current_month)
-            elif self.show_progress:
-                pct = (current * 100) // total_files
-                bar_len = 30
-                filled = (current * bar_len) // total_files
-                bar = "█" * filled + "░" * (bar_len - filled)
-                sys.stdout.write(
-                    f"\rFetching HOSTRADA [{bar}] {pct:3d}% ({current}/{total_files})"
-                )
-                sys.stdout.flush()
-
-            if series is not None:
-                if param not in all_series:
-                    all_series[param] = []
-                all_series[param].append(series)
+
+        def submit_next() -> None:
+            item = next(queued, None)
+            if item is not None:
+                pending[pool.submit(fetch_file, *item)] = item
+
+        with self._make_client() as client:
+            pool = ThreadPoolExecutor(max_workers=HOSTRADA_DOWNLOAD_WORKERS)
+            try:
+                for _ in range(HOSTRADA_MAX_PENDING_FILES):
+                    submit_next()
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        param, year, month = pending.pop(future)
+                        current += 1
+                        try:
+                            path, is_temporary = future.result()
+                        except WeatherSourceError as e:
+                            logger.debug(f"Failed to fetch {param} for {year}-{month:02d}: {e}")
+                            error_count += 1
+                        else:
+                            try:
+                                results[(param, year, month)] = self._extract_from_file(
+                                    path, HOSTRADA_PARAMS[param][1]
+                                )
+                                success_count += 1
+                            finally:
+                                if is_temporary:
+                                    path.unlink(missing_ok=True)
+
+                        # Slot is free again (temp file gone): request the next file
+                        submit_next()
+
+                        # Custom progress callback
+                        if self.progress_callback:
+                            self.progress_callback(current, total_files, year, month)
+                        elif self.show_progress:
+                            pct = (current * 100) // total_files
+                            bar_len = 30
+                            filled = (current * bar_len) // total_files
+                            bar = "█" * filled + "░" * (bar_len - filled)
+                            sys.stdout.write(
+                                f"\rFetching HOSTRADA [{bar}] {pct:3d}% "
+                                f"({current}/{total_files})"
+                            )
+                            sys.stdout.flush()
+            finally:
+                # On early exit (e.g. parse error, Ctrl+C): drop queued downloads
+                # and remove temporary files that were never extracted
+                pool.shutdown(wait=True, cancel_futures=True)
+                for future in pending:
+                    if not future.cancelled() and future.exception() is None:
+                        path, is_temporary = future.result()
+                        if is_temporary:
+                            path.unlink(missing_ok=True)
+
+        # Collect monthly chunks per parameter in month order
+        all_chunks: dict[str, list[_MonthlyData]] = {}
+        for key in downloads:
+            chunk = results.get(key)
+            if chunk is not None:
+                all_chunks.setdefault(key[0], []).append(chunk)
 
         if self.show_progress:
             sys.stdout.write("\n")  # Newline after progress bar
@@ -367,77 +518,102 @@ class HOSTRADASource(HistoricalSource):
         else:
             logger.info(f"✓ {success_count}/{total_files} files loaded")
 
-        # Concatenate series for each parameter
-        for param in list(all_series.keys()):
-            if all_series[param]:
-                all_series[param] = pd.concat(all_series[param])
-            else:
-                del all_series[param]
-
-        if not all_series:
+        if not all_chunks:
             raise DownloadError("No data could be fetched for the specified range")
 
-        # Combine into DataFrame
-        df = pd.DataFrame(all_series)
-
-        # Filter to requested date range
-        df = df[(df.index >= start_dt) & (df.index <= end_dt)]
+        # Concatenate the monthly chunks of each parameter as plain arrays
+        times: dict[str, np.ndarray] = {}
+        values: dict[str, np.ndarray] = {}
+        units: dict[str, str] = {}
+        for param, chunks in all_chunks.items():
+            units[param] = chunks[0].units
+            times[param] = np.concatenate([c.times for c in chunks])
+            values[param] = np.concatenate([c.values for c in chunks])
+
+        # Usually every parameter covers the same hours: then one mask filters
+        # all of them. Otherwise (a month missing for some parameter) let
+        # pandas align the time axes.
+        first = next(iter(times.values()))
+        if all(np.array_equal(first, t) for t in times.values()):
+            mask = (first >= np.datetime64(start_dt)) & (first <= np.datetime64(end_dt))
+            df = pd.DataFrame(
+                {param: arr[mask] for param, arr in values.items()},
+                index=pd.DatetimeIndex(first[mask]),
+                copy=False,
+            )
+        else:
+            df = pd.DataFrame(
+                {param: pd.Series(values[param], index=times[param]) for param in values}
+            )
+            df = df[(df.index >= start_dt) & (df.index <= end_dt)]
 
-        # Convert to standard schema
-        result = pd.DataFrame()
-        result["timestamp"] = df.index.astype(np.int64) // 10**9  # Unix timestamp
+        # Convert to standard schema: build each column as an array first and
+        # assemble the frame in one step instead of assigning column by column
+        n = len(df)
 
-        # DWD HOSTRADA hourly data uses preceding-hour convention (interval-end).
-        # Normalize to interval-start convention (-1h), consistent with PV data.
-        result["timestamp"] = result["timestamp"] - 3600
+        # Unix timestamp. DWD HOSTRADA hourly data uses preceding-hour convention
+        # (interval-end). Normalize to interval-start convention (-1h), consistent
+        # with PV data.
+        timestamp = df.index.as_unit("s").asi8 - 3600
 
         # GHI
         if "ghi" in df.columns:
-            result["ghi_wm2"] = df["ghi"].values
+            ghi = df["ghi"].to_numpy()
         else:
-            result["ghi_wm2"] = 0.0
+            ghi = np.zeros(n)
 
         # Temperature (convert from Kelvin if needed)
         if "temperature" in df.columns:
-            temp = df["temperature"].values
-            if np.nanmean(temp) > 200:  # Likely Kelvin
+            temp = df["temperature"].to_numpy()
+            unit = units["temperature"]
+            if unit in _KELVIN_UNITS or (
+                unit not in _CELSIUS_UNITS and np.nanmean(temp) > 200  # Likely Kelvin
+            ):
                 temp = temp - 273.15
-            result["temperature_c"] = temp
         else:
-            result["temperature_c"] = 0.0
+            temp = np.zeros(n)
 
         # Cloud cover (HOSTRADA uses oktas 0-8, convert to percent 0-100)
         if "cloud_cover" in df.columns:
-            cc = df["cloud_cover"].values
-            if np.nanmax(cc) <= 8.0:  # Oktas 0-8
+            cc = df["cloud_cover"].to_numpy()
+            unit = units["cloud_cover"]
+            if unit in _OKTA_UNITS or (
+                unit not in _PERCENT_UNITS and np.nanmax(cc) <= 8.0  # Oktas 0-8
+            ):
                 cc = cc * 12.5  # Convert to percent (8 oktas = 100%)
-            result["cloud_cover_pct"] = np.clip(cc, 0, 100).astype(int)
+            cloud_cover = np.clip(cc, 0, 100).astype(np.int8)
         else:
-            result["cloud_cover_pct"] = 0
+            cloud_cover = np.zeros(n, dtype=np.int8)
 
         # Humidity
         if "humidity" in df.columns:
-            result["humidity_pct"] = df["humidity"].values.astype(int)
+            humidity = np.clip(df["humidity"].to_numpy(), 0, 100).astype(np.int8)
         else:
-            result["humidity_pct"] = 0
+            humidity = np.zeros(n, dtype=np.int8)
 
         # Wind speed
         if "wind_speed" in df.columns:
-            result["wind_speed_ms"] = df["wind_speed"].values
+            wind_speed = df["wind_speed"].to_numpy()
         else:
-            result["wind_speed_ms"] = 0.0
-
-        # DHI estimation using Erbs model (same as MOSMIX)
-        result["dhi_wm2"] = self._estimate_dhi(
-            result["ghi_wm2"].values,
-            df.index,
+            wind_speed = np.zeros(n)
+
+        result = pd.DataFrame(
+            {
+                "timestamp": timestamp,
+                "ghi_wm2": ghi,
+                "temperature_c": temp,
+                "cloud_cover_pct": cloud_cover,
+                "humidity_pct": humidity,
+                "wind_speed_ms": wind_speed,
+                # DHI estimation using Erbs model (same as MOSMIX)
+                "dhi_wm2": self._estimate_dhi(ghi, df.index),
+                # DNI not available from HOSTRADA
+                "dni_wm2": np.zeros(n),
+            },
+            index=df.index,
+            copy=False,
         )
 
-        # DNI not available from HOSTRADA
-        result["dni_wm2"] = 0.0
-
-        result = result.set_index(df.index)
-
         logger.info(f"Fetched {len(result)} hourly records from HOSTRADA")
         return result
 
@@ -447,46 +623,45 @@ class HOSTRADASource(HistoricalSource):
         day_of_year = times.dayofyear.values
         hour = times.hour.values + times.minute.values / 60.0
 
-        # Solar declination
-        declination = 23.45 * np.sin(np.radians(360 * (284 + day_of_year) / 365))
-
-        # Hour angle
-        hour_angle = 15 * (hour - 12)
-
-        # Solar altitude
+        # Day-dependent terms (declination, eccentricity) only vary over the
+        # <= 366 days of a year: evaluate them per day, then gather per hour
+        days = np.arange(367)
+        decl_rad = np.radians(23.45 * np.sin(np.radians(360 * (284 + days) / 365)))
         lat_rad = np.radians(self.latitude)
-        decl_rad = np.radians(declination)
-        ha_rad = np.radians(hour_angle)
+        sin_term = np.sin(lat_rad) * np.sin(decl_rad)
+        cos_term = np.cos(lat_rad) * np.cos(decl_rad)
 
-        sin_alt = np.sin(lat_rad) * np.sin(decl_rad) + np.cos(lat_rad) * np.cos(decl_rad) * np.cos(
-            ha_rad
-        )
-        sin_alt = np.clip(sin_alt, 0, 1)
-
-        # Extraterrestrial radiation
+        # Extraterrestrial radiation at normal incidence (per day)
         solar_constant = 1361  # W/m²
-        day_angle = 2 * np.pi * day_of_year / 365
-        eccentricity = 1 + 0.033 * np.cos(day_angle)
-        ghi_extra = solar_constant * eccentricity * sin_alt
-
-        # Clearness index
-        with np.errstate(divide="ignore", invalid="ignore"):
-            kt = np.where(ghi_extra > 0, ghi / ghi_extra, 0)
-        kt = np.clip(kt, 0, 1)
-
-        # Erbs model for diffuse fraction
-        df = np.where(
-            kt <= 0.22,
-            1.0 - 0.09 * kt,
-            np.where(
-                kt <= 0.80,
-                0.9511 - 0.1604 * kt + 4.388 * kt**2 - 16.638 * kt**3 + 12.336 * kt**4,
-                0.165,
-            ),
-        )
-
-        dhi = df * ghi
-        return np.clip(dhi, 0, ghi)
+        eccentricity = 1 + 0.033 * np.cos(2 * np.pi * days / 365)
+        extra_normal = solar_constant * eccentricity
+
+        # Solar altitude (hour angle: 15° per hour from solar noon)
+        sin_alt = np.cos(np.radians(15 * (hour - 12)))
+        sin_alt *= cos_term[day_of_year]
+        sin_alt += sin_term[day_of_year]
+        np.clip(sin_alt, 0, 1, out=sin_alt)
+
+        # Extraterrestrial radiation (in place, sin_alt is not needed afterwards)
+        ghi_extra = sin_alt
+        ghi_extra *= extra_normal[day_of_year]
+
+        # Clearness index (0 where the sun is below the horizon)
+        kt = np.zeros(len(ghi_extra))
+        np.divide(ghi, ghi_extra, out=kt, where=ghi_extra > 0)
+        np.clip(kt, 0, 1, out=kt)
+
+        # Erbs model for diffuse fraction, each branch evaluated on its slice only
+        df = np.full_like(kt, 0.165, dtype=float)
+        lo = kt <= 0.22
+        mid = ~lo & (kt <= 0.80)
+        df[lo] = 1.0 - 0.09 * kt[lo]
+        k = kt[mid]
+        # Horner form of 0.9511 - 0.1604k + 4.388k² - 16.638k³ + 12.336k⁴
+        df[mid] = (((12.336 * k - 16.638) * k + 4.388) * k - 0.1604) * k + 0.9511
+
+        df *= ghi
+        return np.clip(df, 0, ghi, out=df)
 
     def get_available_range(self) -> tuple[date, date] | None:
         """Get the available date range for HOSTRADA data.
@@ -7,7 +7,7 @@ import logging
 import zipfile
 from dataclasses import dataclass
 from datetime import datetime
-from math import asin, cos, exp, pi, radians, sin
+from math import asin, cos, degrees, exp, pi, radians, sin
 from typing import TYPE_CHECKING
 from xml.etree import ElementTree as ET
 from zoneinfo import ZoneInfo
@@ -82,7 +82,7 @@ def _calculate_sun_elevation(timestamp: int, lat: float, lon: float) -> float:
     sin_elevation = sin(lat_rad) * sin(dec_rad) + cos(lat_rad) * cos(dec_rad) * cos(ha_rad)
     sin_elevation = max(-1, min(1, sin_elevation))
 
-    return asin(sin_elevation) * 180 / pi
+    return degrees(asin(sin_elevation))
 
 
 def calculate_relative_humidity(temperature_c: float, dewpoint_c: float) -> int:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import random
+import sqlite3
 import time
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
@@ -330,6 +331,24 @@ def save_weather_to_db(df: pd.DataFrame, db: Database) -> int:
         df: DataFrame von fetch_historical/fetch_forecast
         db: Database-Instanz
 
+    Returns:
+        Anzahl eingefügter Zeilen
+    """
+    # Bulk Insert in einer Transaktion
+    with db.connect() as conn:
+        return _insert_weather(conn, df)
+
+
+def _insert_weather(conn: sqlite3.Connection, df: pd.DataFrame) -> int:
+    """
+    Fügt Wetterdaten über eine bestehende Verbindung ein (ohne Commit).
+
+    Erlaubt mehrere DataFrames (z.B. Jahres-Chunks) in einer Transaktion.
+
+    Args:
+        conn: Offene SQLite-Verbindung
+        df: DataFrame von fetch_historical/fetch_forecast
+
     Returns:
         Anzahl eingefügter Zeilen
     """
@@ -347,30 +366,40 @@ def save_weather_to_db(df: pd.DataFrame, db: Database) -> int:
     if "dni_wm2" not in df.columns:
         df = df.assign(dni_wm2=0.0)
 
-    # Daten für Bulk Insert vorbereiten (itertuples ist ~100x schneller als iterrows)
+    # Daten für Bulk Insert vorbereiten (rohe Tupel, kein namedtuple-Overhead)
+    columns = [
+        "timestamp",
+        "ghi_wm2",
+        "cloud_cover_pct",
+        "temperature_c",
+        "wind_speed_ms",
+        "humidity_pct",
+        "dhi_wm2",
+        "dni_wm2",
+    ]
     records = [
         (
-            int(row.timestamp),
-            float(row.ghi_wm2),
-            int(row.cloud_cover_pct),
-            float(row.temperature_c),
-            float(row.wind_speed_ms) if row.wind_speed_ms is not None else 0.0,
-            int(row.humidity_pct) if row.humidity_pct is not None else 50,
-            float(row.dhi_wm2) if row.dhi_wm2 is not None else 0.0,
-            float(row.dni_wm2) if row.dni_wm2 is not None else 0.0,
+            int(ts),
+            float(ghi),
+            int(cloud),
+            float(temp),
+            float(wind) if wind is not None else 0.0,
+            int(humidity) if humidity is not None else 50,
+            float(dhi) if dhi is not None else 0.0,
+            float(dni) if dni is not None else 0.0,
+        )
+        for ts, ghi, cloud, temp, wind, humidity, dhi, dni in df[columns].itertuples(
+            index=False, name=None
         )
-        for row in df.itertuples(index=False)
     ]
 
-    # Bulk Insert in einer Transaktion
-    with db.connect() as conn:
-        conn.executemany(
-            """INSERT OR REPLACE INTO weather_history
-               (timestamp, ghi_wm2, cloud_cover_pct, temperature_c,
-                wind_speed_ms, humidity_pct, dhi_wm2, dni_wm2)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            records,
-        )
+    conn.executemany(
+        """INSERT OR REPLACE INTO weather_history
+           (timestamp, ghi_wm2, cloud_cover_pct, temperature_c,
+            wind_speed_ms, humidity_pct, dhi_wm2, dni_wm2)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        records,
+    )
 
     logger.info(f"Wetterdaten gespeichert: {len(records)} Datensätze")
     return len(records)
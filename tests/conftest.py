@@ -12,6 +12,25 @@ from pvforecast.db import Database
 UTC_TZ = ZoneInfo("UTC")
 
 
+@pytest.fixture(autouse=True)
+def isolated_feature_cache(tmp_path, monkeypatch):
+    """Leitet den persistenten Feature-Cache in ein Test-Verzeichnis um."""
+    from pvforecast import model
+
+    monkeypatch.setattr(model, "FEATURE_CACHE_DIR", tmp_path / "feature-cache")
+    model._load_and_prepare.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_geocode_cache(tmp_path, monkeypatch):
+    """Leitet den Geocoding-Cache in ein Test-Verzeichnis um."""
+    from pvforecast import geocoding
+
+    monkeypatch.setattr(geocoding, "GEOCODE_CACHE_PATH", tmp_path / "geocode.json")
+    monkeypatch.setattr(geocoding, "_client", None)
+    geocoding._load_cache.cache_clear()
+
+
 @pytest.fixture
 def temp_db():
     """Erstellt eine temporäre Datenbank."""
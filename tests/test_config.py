@@ -135,6 +135,16 @@ def test_config_expanduser_paths(tmp_path):
     assert str(config.db_path).startswith(str(Path.home()))
 
 
+def test_default_paths_computed_once():
+    """Standard-Pfade werden pro Prozess nur einmal berechnet."""
+    from pvforecast.config import _default_db_path, _default_model_path, get_config_path
+
+    assert _default_db_path() is _default_db_path()
+    assert _default_model_path() is _default_model_path()
+    assert get_config_path() is get_config_path()
+    assert Config().model_path == _default_model_path()
+
+
 # === Validierungs-Tests ===
 
 
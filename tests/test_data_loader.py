@@ -1,6 +1,18 @@
 """Tests für data_loader."""
 
-from pvforecast.data_loader import import_to_db, load_e3dc_csv
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from pvforecast import data_loader
+from pvforecast.data_loader import (
+    DataImportError,
+    import_csv_files,
+    import_csv_files_with_errors,
+    import_to_db,
+    load_e3dc_csv,
+)
 
 
 def test_load_e3dc_csv(sample_csv):
@@ -55,3 +67,60 @@ def test_import_idempotent(sample_csv, temp_db):
     assert count1 == 15
     # Zweiter Import sollte keine neuen Zeilen einfügen
     assert temp_db.get_pv_count() == 15
+
+
+def test_import_csv_files_batch(sample_csv, temp_db, tmp_path):
+    """Test: Mehrere Dateien in einem Aufruf, Duplikate und kaputte Dateien zählen nicht."""
+    broken = tmp_path / "broken.csv"
+    broken.write_text("foo;bar\n1;2\n")
+
+    count, failures = import_csv_files_with_errors([sample_csv, broken, sample_csv], temp_db)
+
+    assert count == 15
+    assert temp_db.get_pv_count() == 15
+    assert [(path, type(e)) for path, e in failures] == [(broken, DataImportError)]
+
+
+def test_import_csv_files_rolls_back_only_failing_file(sample_csv, temp_db, tmp_path):
+    """Test: Ein Konflikt mitten in einer Datei verwirft nur diese Datei."""
+    other = tmp_path / "other.csv"
+    other.write_text(sample_csv.read_text().replace(".2024", ".2025"))
+
+    real_insert = data_loader._insert_readings
+    calls = []
+
+    def failing_insert(conn, df):
+        inserted = real_insert(conn, df)  # Zeilen sind schon geschrieben ...
+        calls.append(df)
+        if len(calls) == 2:  # ... bevor die zweite Datei scheitert
+            raise sqlite3.IntegrityError("kaputt")
+        return inserted
+
+    with patch.object(data_loader, "_insert_readings", side_effect=failing_insert):
+        count, failures = import_csv_files_with_errors([sample_csv, other], temp_db)
+
+    assert count == 15
+    assert temp_db.get_pv_count() == 15
+    assert [(path, str(e)) for path, e in failures] == [(other, "kaputt")]
+
+
+def test_import_csv_files_aborts_on_other_db_errors(sample_csv, temp_db, tmp_path):
+    """Test: Andere DB-Fehler (z.B. gesperrte DB) brechen den ganzen Import ab."""
+    other = tmp_path / "other.csv"
+    other.write_text(sample_csv.read_text().replace(".2024", ".2025"))
+
+    real_insert = data_loader._insert_readings
+    calls = []
+
+    def locked_insert(conn, df):
+        calls.append(df)
+        if len(calls) == 2:
+            raise sqlite3.OperationalError("database is locked")
+        return real_insert(conn, df)
+
+    with patch.object(data_loader, "_insert_readings", side_effect=locked_insert):
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            import_csv_files([sample_csv, other], temp_db)
+
+    # Nichts committet, auch nicht die erste Datei
+    assert temp_db.get_pv_count() == 0
@@ -39,6 +39,21 @@ class TestDatabase:
 
         assert db.get_pv_count() == 2
 
+    def test_counts_are_exact_despite_gaps(self, tmp_path):
+        """Test: Lücken in den Daten zählen nicht mit (keine Spannen-Schätzung)."""
+        db = Database(tmp_path / "test.db")
+        assert db.get_counts() == (0, 0)
+
+        with db.connect() as conn:
+            # Zwei Messwerte ein Jahr auseinander
+            conn.executemany(
+                "INSERT INTO pv_readings (timestamp, production_w) VALUES (?, ?)",
+                [(1704067200, 1000), (1704067200 + 365 * 24 * 3600, 2000)],
+            )
+
+        assert db.get_pv_count() == 2
+        assert db.get_counts() == (2, 0)
+
     def test_insert_and_count_weather(self, tmp_path):
         """Test: Wetterdaten einfügen und zählen."""
         db = Database(tmp_path / "test.db")
@@ -53,6 +68,21 @@ class TestDatabase:
 
         assert db.get_weather_count() == 1
 
+    def test_has_weather_records(self, tmp_path):
+        """Test: Mindestanzahl Wetterdaten ohne vollständiges Zählen prüfen."""
+        db = Database(tmp_path / "test.db")
+        assert db.has_weather_records() is False
+
+        with db.connect() as conn:
+            conn.executemany(
+                "INSERT INTO weather_history (timestamp, ghi_wm2) VALUES (?, ?)",
+                [(1704067200 + i * 3600, 100.0) for i in range(3)],
+            )
+
+        assert db.has_weather_records() is True
+        assert db.has_weather_records(3) is True
+        assert db.has_weather_records(4) is False
+
     def test_get_pv_date_range(self, tmp_path):
         """Test: PV-Datumsbereich abfragen."""
         db = Database(tmp_path / "test.db")
@@ -82,6 +82,17 @@ class TestXGBoostDependencyCheck:
                 assert pipeline is not None
                 assert "RandomForestRegressor" in str(type(pipeline.named_steps["model"]))
 
+    def test_xgb_device_falls_back_to_cpu_without_xgboost(self):
+        """Test: GPU-Erkennung liefert 'cpu' wenn XGBoost nicht verfügbar ist."""
+        from pvforecast import model
+
+        model._xgb_device.cache_clear()
+        try:
+            with patch.object(model, "XGBOOST_AVAILABLE", False):
+                assert model._xgb_device() == "cpu"
+        finally:
+            model._xgb_device.cache_clear()
+
 
 class TestDependencyErrorInCLI:
     """Tests für DependencyError Behandlung in CLI."""
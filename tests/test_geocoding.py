@@ -156,6 +156,69 @@ class TestGeocode:
         assert result.city == "Bochum"
         assert result.country_code == "DE"
 
+    @patch("pvforecast.geocoding.httpx.Client")
+    @patch("pvforecast.geocoding._enforce_rate_limit")
+    def test_repeated_query_served_from_cache(self, mock_rate_limit, mock_client_class):
+        """Test: Wiederholte Abfrage (auch in neuem Prozess) ohne HTTP-Request."""
+        from pvforecast import geocoding
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = [
+            {"lat": "51.4833", "lon": "7.2233", "display_name": "Bochum", "address": {}}
+        ]
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+        mock_client.__enter__ = MagicMock(return_value=mock_client)
+        mock_client.__exit__ = MagicMock(return_value=False)
+        mock_client_class.return_value = mock_client
+
+        first = geocode("44787 Bochum")
+        second = geocode("  44787   BOCHUM ")
+        assert mock_client.get.call_count == 1
+        assert second == first
+        assert geocoding.GEOCODE_CACHE_PATH.exists()
+
+        # Neuer Prozess: Cache wird von Platte gelesen
+        geocoding._load_cache.cache_clear()
+        assert geocode("44787 bochum") == first
+        assert mock_client.get.call_count == 1
+
+        # Andere Länder-Einschränkung ist ein eigener Eintrag
+        geocode("44787 Bochum", country_codes=None)
+        assert mock_client.get.call_count == 2
+
+    @patch("pvforecast.geocoding.httpx.Client")
+    @patch("pvforecast.geocoding._enforce_rate_limit")
+    def test_malformed_cache_entry_is_requeried(self, mock_rate_limit, mock_client_class):
+        """Test: Veralteter/defekter Cache-Eintrag gilt als Miss und wird ersetzt."""
+        import json
+
+        from pvforecast import geocoding
+
+        geocoding.GEOCODE_CACHE_PATH.write_text(
+            json.dumps({"44787 bochum|de,at,ch": {"lat": 51.0, "old_field": 1}})
+        )
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = [
+            {"lat": "51.4833", "lon": "7.2233", "display_name": "Bochum", "address": {}}
+        ]
+        mock_response.raise_for_status = MagicMock()
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        result = geocode("44787 Bochum")
+
+        assert result is not None and result.latitude == 51.4833
+        assert mock_client.get.call_count == 1
+        # Cache ist geheilt: neuer Prozess liest den gültigen Eintrag
+        geocoding._load_cache.cache_clear()
+        assert geocode("44787 Bochum") == result
+        assert mock_client.get.call_count == 1
+
     @patch("pvforecast.geocoding.httpx.Client")
     @patch("pvforecast.geocoding._enforce_rate_limit")
     def test_no_results(self, mock_rate_limit, mock_client_class):
@@ -198,6 +261,46 @@ class TestGeocode:
 
         assert "fehlgeschlagen nach 3 Versuchen" in str(exc_info.value)
         assert mock_client.get.call_count == 3  # 3 Retries
+        mock_client_class.assert_called_once()  # ein Client für alle Retries
+
+    def test_prewarm_prepares_client_without_request(self):
+        """Test: prewarm erstellt den Client und löst den Host auf, ohne Request."""
+        from pvforecast import geocoding
+
+        with (
+            patch("pvforecast.geocoding.httpx.Client") as mock_client_class,
+            patch("pvforecast.geocoding.socket.getaddrinfo") as mock_getaddrinfo,
+        ):
+            geocoding.prewarm()
+            geocoding.prewarm()
+
+        mock_client_class.assert_called_once()
+        mock_client_class.return_value.get.assert_not_called()
+        assert mock_getaddrinfo.call_args[0][:2] == ("nominatim.openstreetmap.org", 443)
+
+    def test_prewarm_ignores_network_errors(self):
+        """Test: Fehler bei der Namensauflösung werden verschluckt."""
+        from pvforecast import geocoding
+
+        with (
+            patch("pvforecast.geocoding.httpx.Client"),
+            patch("pvforecast.geocoding.socket.getaddrinfo", side_effect=OSError("offline")),
+        ):
+            geocoding.prewarm()
+
+    @patch("pvforecast.geocoding._enforce_rate_limit")
+    def test_explicit_client_is_used(self, mock_rate_limit):
+        """Test: Übergebener Client wird statt des Modul-Clients genutzt."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = []
+        client = MagicMock()
+        client.get.return_value = mock_response
+
+        with patch("pvforecast.geocoding.httpx.Client") as mock_client_class:
+            assert geocode("Nirgendwo", client=client) is None
+
+        client.get.assert_called_once()
+        mock_client_class.assert_not_called()
 
     @patch("pvforecast.geocoding.httpx.Client")
     @patch("pvforecast.geocoding._enforce_rate_limit")
@@ -3,10 +3,12 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from pvforecast.model import (
+    FEATURE_SCHEMA_VERSION,
     HourlyForecast,
     ModelNotFoundError,
     calculate_sun_elevation,
@@ -72,6 +74,61 @@ class TestSunElevation:
         # Erwarteter Wert: ~66.5° (90 - 23.44 Ekliptik)
         assert 64.0 < elev < 69.0, f"Erwartete ~66.5°, bekam {elev:.1f}°"
 
+    def test_vectorized_matches_scalar(self):
+        """Test: Vektorisierte Berechnung liefert dieselben Werte wie die Skalar-Variante."""
+        import numpy as np
+
+        from pvforecast.model import _solar_elevation_j2000
+
+        ts = np.arange(1704067200, 1704067200 + 366 * 86400, 3600 * 7 + 60 * 13, dtype=np.int64)
+        expected = [calculate_sun_elevation(int(t), 51.48, 7.22) for t in ts]
+
+        np.testing.assert_allclose(_solar_elevation_j2000(ts, 51.48, 7.22), expected, atol=1e-9)
+
+    def test_matches_pvlib_solar_position(self):
+        """Test: J2000-Näherung weicht weniger als 0.1° von pvlib (SPA) ab."""
+        import numpy as np
+        import pandas as pd
+
+        pvlib = pytest.importorskip("pvlib")
+        from pvforecast.model import _solar_elevation_j2000
+
+        ts = np.arange(1704067200, 1704067200 + 366 * 86400, 3600 * 5 + 60 * 17, dtype=np.int64)
+        times = pd.DatetimeIndex(pd.to_datetime(ts, unit="s", utc=True))
+        reference = pvlib.solarposition.get_solarposition(times, 51.48, 7.22, method="nrel_numpy")
+
+        np.testing.assert_allclose(
+            _solar_elevation_j2000(ts, 51.48, 7.22),
+            reference["elevation"].to_numpy(),
+            atol=0.1,
+        )
+
+
+class TestTimeComponents:
+    """Tests für die int64-Zerlegung der Timestamps."""
+
+    def test_matches_pandas_datetime_accessors(self):
+        """Test: Stunde/Monat/Tag des Jahres stimmen mit pandas .dt überein."""
+        import numpy as np
+
+        from pvforecast.model import _time_components
+
+        ts = np.array(
+            [
+                1704067200,  # 2024-01-01 00:00 UTC
+                1709208000,  # 2024-02-29 12:00 UTC (Schaltjahr)
+                1735689599,  # 2024-12-31 23:59:59 UTC
+                1719000000,
+            ],
+            dtype=np.int64,
+        )
+        hours, months, day_of_year = _time_components(ts)
+        expected = pd.to_datetime(ts, unit="s", utc=True)
+
+        assert list(hours) == list(expected.hour)
+        assert list(months) == list(expected.month)
+        assert list(day_of_year) == list(expected.dayofyear)
+
 
 class TestPrepareFeatures:
     """Tests für Feature-Erstellung."""
@@ -111,6 +168,7 @@ class TestPrepareFeatures:
         # cloud_cover und effective_irradiance entfernt (#168)
 
         assert len(features) == 2
+        assert (features.dtypes == "float32").all()
 
     def test_hour_feature_cyclic(self):
         """Test: Stunden-Feature ist zyklisch kodiert."""
@@ -386,6 +444,96 @@ class TestSaveLoadModel:
 
         assert list(pred_original) == list(pred_loaded)
 
+    def test_save_writes_meta_sidecar(self, tmp_path):
+        """Test: save_model legt Metadaten-JSON passend zum Dateistand ab."""
+        import json
+
+        from sklearn.dummy import DummyRegressor
+
+        model_path = tmp_path / "model.pkl"
+        save_model(DummyRegressor(), model_path, {"model_type": "hgb", "mape": np.float64(12.5)})
+
+        meta = json.loads((tmp_path / "model.meta.json").read_text())
+        stat = model_path.stat()
+        assert meta["model_type"] == "hgb"
+        assert meta["mape"] == 12.5
+        assert (meta["model_mtime_ns"], meta["model_size"]) == (stat.st_mtime_ns, stat.st_size)
+
+    def test_load_compressed_legacy_model(self, tmp_path, recwarn):
+        """Test: Komprimiert gespeicherte (ältere) Modelle laden ohne mmap-Warnung."""
+        import joblib
+        from sklearn.linear_model import LinearRegression
+
+        model = LinearRegression().fit([[1], [2], [3]], [1, 2, 3])
+        model_path = tmp_path / "model.pkl"
+        joblib.dump({"model": model, "metrics": {"mae": 1}}, model_path, compress=3)
+
+        loaded_model, loaded_metrics = load_model(model_path)
+
+        assert loaded_metrics == {"mae": 1}
+        assert loaded_model.predict([[4]])[0] == pytest.approx(4)
+        assert not [w for w in recwarn if "mmap" in str(w.message)]
+
+    def test_save_records_feature_schema(self, tmp_path, caplog):
+        """Test: Feature-Schema-Version landet in Metriken und Sidecar, Laden warnt nicht."""
+        import json
+        import logging
+
+        from sklearn.dummy import DummyRegressor
+
+        model_path = tmp_path / "model.pkl"
+        metrics = {"mape": 10.0}
+        save_model(DummyRegressor(), model_path, metrics)
+
+        assert "feature_schema" not in metrics
+        meta = json.loads((tmp_path / "model.meta.json").read_text())
+        assert meta["feature_schema"] == FEATURE_SCHEMA_VERSION
+        with caplog.at_level(logging.WARNING, logger="pvforecast.model"):
+            _, loaded_metrics = load_model(model_path)
+        assert loaded_metrics["feature_schema"] == FEATURE_SCHEMA_VERSION
+        assert not [r for r in caplog.records if "Feature-Schema" in r.message]
+
+    @pytest.mark.parametrize("schema", [None, FEATURE_SCHEMA_VERSION - 1])
+    def test_load_warns_on_feature_schema_mismatch(self, tmp_path, caplog, schema):
+        """Test: Modelle mit altem oder fehlendem Feature-Schema lösen eine Warnung aus."""
+        import logging
+
+        import joblib
+        from sklearn.dummy import DummyRegressor
+
+        data = {"model": DummyRegressor(), "metrics": {"mape": 10.0}}
+        if schema is not None:
+            data["feature_schema"] = schema
+        model_path = tmp_path / "model.pkl"
+        joblib.dump(data, model_path)
+
+        with caplog.at_level(logging.WARNING, logger="pvforecast.model"):
+            load_model(model_path)
+
+        assert any("neu trainieren" in r.message for r in caplog.records)
+
+    def test_save_replaces_file_of_loaded_model(self, tmp_path):
+        """Test: Neu speichern ersetzt die Datei atomar, geladene Modelle bleiben nutzbar."""
+        from sklearn.dummy import DummyRegressor
+        from sklearn.linear_model import LinearRegression
+
+        rng = np.random.default_rng(0)
+        X = rng.random((20, 5000))
+        model_path = tmp_path / "model.pkl"
+
+        # coef_ (5000 Werte) bleibt nach dem Laden aus der Datei gemappt
+        save_model(LinearRegression().fit(X, rng.random(20)), model_path, {"mape": 1.0})
+        loaded, _ = load_model(model_path)
+        expected = np.array(loaded.coef_)
+
+        # Deutlich kleinere Datei: ein Überschreiben in place würde die Mapping-Seiten
+        # abschneiden (SIGBUS) bzw. mit fremden Bytes füllen
+        save_model(DummyRegressor().fit(X, rng.random(20)), model_path, {"mape": 2.0})
+
+        np.testing.assert_array_equal(loaded.coef_, expected)
+        assert load_model(model_path)[1]["mape"] == 2.0
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["model.meta.json", "model.pkl"]
+
     def test_load_nonexistent_raises(self, tmp_path):
         """Test: Laden von nicht-existentem Modell wirft Fehler."""
         with pytest.raises(ModelNotFoundError):
@@ -450,6 +598,22 @@ class TestXGBoostIntegration:
         assert "scaler" in pipeline.named_steps
         assert "model" in pipeline.named_steps
 
+    def test_create_hgb_pipeline(self):
+        """Test: HistGradientBoosting Pipeline kann erstellt und trainiert werden."""
+        import numpy as np
+        from sklearn.ensemble import HistGradientBoostingRegressor
+
+        from pvforecast.model import _create_pipeline
+
+        pipeline = _create_pipeline("hgb")
+        assert isinstance(pipeline.named_steps["model"], HistGradientBoostingRegressor)
+
+        rng = np.random.default_rng(0)
+        X = rng.random((200, 4), dtype=np.float32)
+        y = X[:, 0] * 1000
+        pipeline.fit(X, y)
+        assert pipeline.predict(X).shape == (200,)
+
     def test_create_xgb_pipeline_without_xgboost(self):
         """Test: XGBoost Pipeline wirft DependencyError wenn nicht installiert."""
         from pvforecast.model import XGBOOST_AVAILABLE, _create_pipeline
@@ -490,6 +654,28 @@ class TestXGBoostIntegration:
             assert model.XGBOOST_AVAILABLE is True
             assert model.XGBOOST_ERROR is None
 
+    def test_reload_xgboost_invalidates_import_caches(self, monkeypatch):
+        """Test: Vor dem Import werden die Finder-Caches invalidiert."""
+        from unittest.mock import MagicMock
+
+        from pvforecast import model
+
+        calls = []
+        monkeypatch.setattr(model, "XGBOOST_AVAILABLE", False)
+        monkeypatch.setattr(model, "XGBOOST_ERROR", "not_installed")
+        monkeypatch.setattr(model, "XGBRegressor", None)
+        monkeypatch.setattr(
+            "importlib.invalidate_caches", lambda: calls.append("invalidate")
+        )
+        fake_xgb = MagicMock()
+        monkeypatch.setattr(
+            "importlib.import_module", lambda name: calls.append(name) or fake_xgb
+        )
+
+        assert model.reload_xgboost() is True
+        assert calls == ["invalidate", "xgboost"]
+        assert model.XGBRegressor is fake_xgb.XGBRegressor
+
 
 class TestLoadTrainingData:
     """Tests für load_training_data()."""
@@ -610,6 +796,73 @@ class TestLoadTrainingData:
         )
         assert len(X_2024) == 15
 
+    def test_load_training_data_cached_until_db_changes(self, tmp_path):
+        """Test: Wiederholtes Laden nutzt Cache, Schreibzugriff invalidiert ihn."""
+        from pvforecast.db import Database
+
+        db = Database(tmp_path / "test.db")
+
+        def insert(start: int, count: int) -> None:
+            with db.connect() as conn:
+                for i in range(start, start + count):
+                    ts = 1704067200 + i * 3600
+                    conn.execute(
+                        "INSERT INTO pv_readings (timestamp, production_w, curtailed) "
+                        "VALUES (?, ?, 0)",
+                        (ts, 500),
+                    )
+                    conn.execute(
+                        "INSERT INTO weather_history "
+                        "(timestamp, ghi_wm2, cloud_cover_pct, temperature_c) "
+                        "VALUES (?, ?, ?, ?)",
+                        (ts, 400, 20, 15),
+                    )
+
+        insert(0, 20)
+        X1, _ = load_training_data(db, lat=51.48, lon=7.22, min_samples=10)
+        X2, _ = load_training_data(db, lat=51.48, lon=7.22, min_samples=10)
+        assert X1 is X2
+        assert (X1.dtypes == "float32").all()
+
+        insert(20, 5)
+        X3, _ = load_training_data(db, lat=51.48, lon=7.22, min_samples=10)
+        assert len(X3) == 25
+
+    def test_load_training_data_uses_feature_cache(self, tmp_path):
+        """Test: Neuer Prozess (leerer lru_cache) lädt Features aus dem Datei-Cache."""
+        from unittest.mock import patch
+
+        import pandas as pd
+
+        from pvforecast import model
+        from pvforecast.db import Database
+
+        db = Database(tmp_path / "test.db")
+        with db.connect() as conn:
+            for i in range(20):
+                ts = 1704067200 + i * 3600
+                conn.execute(
+                    "INSERT INTO pv_readings (timestamp, production_w, curtailed) "
+                    "VALUES (?, ?, 0)",
+                    (ts, 100 * i),
+                )
+                conn.execute(
+                    "INSERT INTO weather_history "
+                    "(timestamp, ghi_wm2, cloud_cover_pct, temperature_c) "
+                    "VALUES (?, ?, ?, ?)",
+                    (ts, 400, 20, 15),
+                )
+
+        X1, y1 = load_training_data(db, lat=51.48, lon=7.22, min_samples=10)
+        assert len(list(model.FEATURE_CACHE_DIR.glob("*.npz"))) == 1
+
+        model._load_and_prepare.cache_clear()
+        with patch.object(model.pd, "read_sql_query", side_effect=AssertionError):
+            X2, y2 = load_training_data(db, lat=51.48, lon=7.22, min_samples=10)
+
+        pd.testing.assert_frame_equal(X1, X2)
+        pd.testing.assert_series_equal(y1, y2)
+
 
 class TestTune:
     """Tests für Hyperparameter-Tuning."""
@@ -790,6 +1043,39 @@ class TestOptunaIntegration:
         assert "xgboost" in str(exc_info.value).lower()
 
 
+class TestPredictDaylight:
+    """Tests für die Vorhersage nur der Tagstunden."""
+
+    def test_night_rows_skipped_and_zero(self):
+        """Test: Modell sieht nur Tagstunden, Nacht und negative Werte sind 0."""
+        from unittest.mock import MagicMock
+
+        import numpy as np
+
+        from pvforecast.model import _predict_daylight
+
+        X = pd.DataFrame({"sun_elevation": [-10.0, 5.0, 30.0, -1.0], "ghi": [0, 1, 2, 3]})
+        mock_model = MagicMock(spec=["predict"])
+        mock_model.predict.side_effect = lambda rows: np.array([-20.0, 800.0][: len(rows)])
+
+        y_pred = _predict_daylight(mock_model, X)
+
+        X_day = mock_model.predict.call_args[0][0]
+        assert X_day.shape == (2, 2)
+        assert X_day.dtype == np.float32 and X_day.flags["C_CONTIGUOUS"]
+        assert list(y_pred) == [0.0, 0.0, 800.0, 0.0]
+
+    def test_feature_mismatch_raises(self):
+        """Test: Abweichende Spaltenreihenfolge wird trotz ndarray-Input erkannt."""
+        from pvforecast.model import _create_pipeline, _predict_daylight
+
+        X = pd.DataFrame({"sun_elevation": [10.0, 20.0, 30.0], "ghi": [100.0, 200.0, 300.0]})
+        pipeline = _create_pipeline("rf").fit(X, [1.0, 2.0, 3.0])
+
+        with pytest.raises(ValueError, match="Features passen nicht"):
+            _predict_daylight(pipeline, X[["ghi", "sun_elevation"]])
+
+
 class TestEvaluate:
     """Tests für evaluate() Funktion."""
 
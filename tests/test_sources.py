@@ -1,6 +1,7 @@
 """Tests für DWD weather sources (MOSMIX, HOSTRADA)."""
 
 from datetime import date, datetime
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -406,6 +407,35 @@ class TestHOSTRADASource:
         # Night: DHI should be 0
         assert dhi[1] == 0.0
 
+    def test_estimate_dhi_matches_per_hour_formula(self, hostrada_source):
+        """Per-day lookup tables give the same solar geometry as per-hour evaluation."""
+        times = pd.date_range("2024-01-01", "2024-12-31 23:00", freq="h")
+        ghi = np.linspace(0.0, 900.0, len(times))
+
+        doy = times.dayofyear.values
+        hour = times.hour.values + times.minute.values / 60.0
+        decl = np.radians(23.45 * np.sin(np.radians(360 * (284 + doy) / 365)))
+        lat = np.radians(hostrada_source.latitude)
+        sin_alt = np.sin(lat) * np.sin(decl) + np.cos(lat) * np.cos(decl) * np.cos(
+            np.radians(15 * (hour - 12))
+        )
+        ghi_extra = 1361 * (1 + 0.033 * np.cos(2 * np.pi * doy / 365)) * np.clip(sin_alt, 0, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kt = np.clip(np.where(ghi_extra > 0, ghi / ghi_extra, 0), 0, 1)
+        ratio = np.where(
+            kt <= 0.22,
+            1.0 - 0.09 * kt,
+            np.where(
+                kt <= 0.80,
+                0.9511 - 0.1604 * kt + 4.388 * kt**2 - 16.638 * kt**3 + 12.336 * kt**4,
+                0.165,
+            ),
+        )
+
+        dhi = hostrada_source._estimate_dhi(ghi, times)
+
+        np.testing.assert_allclose(dhi, ghi * ratio, rtol=1e-9, atol=1e-9)
+
     def test_cloud_cover_oktas_conversion(self, hostrada_source):
         """Test that cloud cover is converted from oktas to percent."""
         # This tests the conversion logic in fetch_historical
@@ -420,6 +450,267 @@ class TestHOSTRADASource:
         np.testing.assert_array_equal(percent, expected_percent)
 
 
+def _write_hostrada_file(
+    directory, source, param, year, month, hours=48, value=1.0, units=None
+):
+    """Schreibt eine kleine HOSTRADA-NetCDF-Datei (3x3-Gitter) mit Original-Dateinamen."""
+    import xarray as xr
+
+    from pvforecast.sources.hostrada import HOSTRADA_PARAMS
+
+    param_dir, var_name = HOSTRADA_PARAMS[param]
+    filename = source._get_file_url(param_dir, var_name, year, month).rsplit("/", 1)[-1]
+    lat, lon = np.meshgrid([51.7, 51.8, 51.9], [7.1, 7.2, 7.3], indexing="ij")
+    times = pd.date_range(datetime(year, month, 1), periods=hours, freq="h")
+    data = np.full((hours, 3, 3), value)
+    ds = xr.Dataset(
+        {var_name: (("time", "y", "x"), data, {"units": units} if units else {})},
+        coords={"time": times, "lat": (("y", "x"), lat), "lon": (("y", "x"), lon)},
+    )
+    path = directory / filename
+    ds.to_netcdf(path)
+    return path
+
+
+class TestHOSTRADAFetch:
+    """Tests for fetch_historical with local and (mocked) downloaded files."""
+
+    PARAMS = ["ghi", "temperature", "cloud_cover", "humidity", "wind_speed"]
+
+    def test_fetch_from_local_files(self, tmp_path):
+        """Local files are used without any download."""
+        source = HOSTRADASource(
+            latitude=51.83, longitude=7.28, show_progress=False, local_dir=tmp_path
+        )
+        for param in self.PARAMS:
+            _write_hostrada_file(tmp_path, source, param, 2024, 1, value=4.0)
+
+        with patch.object(HOSTRADASource, "_download") as mock_download:
+            df = source.fetch_historical(date(2024, 1, 1), date(2024, 1, 1))
+
+        mock_download.assert_not_called()
+        assert len(df) == 24
+        assert (df["ghi_wm2"] == 4.0).all()
+        assert (df["cloud_cover_pct"] == 50).all()  # 4 Oktas
+        assert source._grid_point.y_idx == 1 and source._grid_point.x_idx == 2
+
+    def test_fetch_output_schema(self, tmp_path):
+        """Result has interval-start Unix timestamps, the datetime index and zero-filled gaps."""
+        source = HOSTRADASource(
+            latitude=51.83, longitude=7.28, show_progress=False, local_dir=tmp_path
+        )
+        _write_hostrada_file(tmp_path, source, "ghi", 2024, 1, value=0.0)
+
+        df = source.fetch_historical(date(2024, 1, 1), date(2024, 1, 1))
+
+        expected = pd.date_range("2024-01-01", periods=24, freq="h")
+        assert (df.index == expected).all()
+        np.testing.assert_array_equal(df["timestamp"], 1704067200 + np.arange(24) * 3600 - 3600)
+        assert list(df.columns) == [
+            "timestamp",
+            "ghi_wm2",
+            "temperature_c",
+            "cloud_cover_pct",
+            "humidity_pct",
+            "wind_speed_ms",
+            "dhi_wm2",
+            "dni_wm2",
+        ]
+        assert (df["temperature_c"] == 0.0).all()
+        assert (df["humidity_pct"] == 0).all()
+        assert (df["dni_wm2"] == 0.0).all()
+        # Percentages 0-100 fit in one byte
+        assert df["cloud_cover_pct"].dtype == np.int8
+        assert df["humidity_pct"].dtype == np.int8
+
+    def test_units_attribute_selects_conversion(self, tmp_path):
+        """Units from the NetCDF metadata win over the value-range heuristics."""
+        source = HOSTRADASource(
+            latitude=51.83, longitude=7.28, show_progress=False, local_dir=tmp_path
+        )
+        # Values the heuristics would misjudge: 150 K (mean < 200), 6 % (max <= 8)
+        _write_hostrada_file(tmp_path, source, "temperature", 2024, 1, value=150.0, units="K")
+        _write_hostrada_file(tmp_path, source, "cloud_cover", 2024, 1, value=6.0, units="%")
+
+        with patch.object(HOSTRADASource, "_download", side_effect=DownloadError("offline")):
+            df = source.fetch_historical(date(2024, 1, 1), date(2024, 1, 1))
+
+        assert df["temperature_c"].iloc[0] == pytest.approx(-123.15)
+        assert (df["cloud_cover_pct"] == 6).all()
+
+    def test_location_outside_germany_rejected(self):
+        """Coordinates outside the HOSTRADA grid fail before any download."""
+        from pvforecast.sources.base import WeatherSourceError
+
+        source = HOSTRADASource(latitude=48.85, longitude=2.35, show_progress=False)  # Paris
+
+        with patch.object(HOSTRADASource, "_download") as mock_download:
+            with pytest.raises(WeatherSourceError, match="outside HOSTRADA coverage"):
+                source.fetch_historical(date(2024, 1, 1), date(2024, 1, 1))
+
+        mock_download.assert_not_called()
+
+    def test_find_grid_point_non_square_grid(self):
+        """Nearest point on a non-square grid maps back to the right (y, x)."""
+        import xarray as xr
+
+        lat, lon = np.meshgrid([50.0, 51.0], [6.0, 7.0, 8.0], indexing="ij")
+        ds = xr.Dataset(coords={"lat": (("y", "x"), lat), "lon": (("y", "x"), lon)})
+        source = HOSTRADASource(latitude=50.9, longitude=7.9, show_progress=False)
+
+        point = source._find_grid_point(ds)
+
+        assert (point.y_idx, point.x_idx) == (1, 2)
+        assert (point.lat, point.lon) == (51.0, 8.0)
+        assert point.distance_km == pytest.approx(np.hypot(0.1, 0.1) * 111)
+
+    def test_grid_point_cached_in_local_dir(self, tmp_path):
+        """A second source for the same location reuses the on-disk grid point."""
+        import xarray as xr
+
+        first = HOSTRADASource(
+            latitude=51.83, longitude=7.28, show_progress=False, local_dir=tmp_path
+        )
+        path = _write_hostrada_file(tmp_path, first, "ghi", 2024, 1, hours=2)
+        first._extract_from_file(path, "rsds")
+        assert len(list(tmp_path.glob(".grid_*.json"))) == 1
+
+        second = HOSTRADASource(
+            latitude=51.83, longitude=7.28, show_progress=False, local_dir=tmp_path
+        )
+        with patch.object(HOSTRADASource, "_scan_grid") as mock_scan:
+            with xr.open_dataset(path) as ds:
+                point = second._find_grid_point(ds)
+
+        mock_scan.assert_not_called()
+        assert point == first._grid_point
+
+    def test_stale_grid_cache_is_ignored(self, tmp_path):
+        """A cache entry that does not match the grid triggers a fresh scan."""
+        import json
+
+        import xarray as xr
+
+        source = HOSTRADASource(
+            latitude=51.83, longitude=7.28, show_progress=False, local_dir=tmp_path
+        )
+        path = _write_hostrada_file(tmp_path, source, "ghi", 2024, 1, hours=2)
+        source._grid_cache_path().write_text(
+            json.dumps(
+                {"y": 0, "x": 0, "shape": [9, 9], "lat": 0.0, "lon": 0.0, "distance_km": 0.0}
+            )
+        )
+
+        with xr.open_dataset(path) as ds:
+            point = source._find_grid_point(ds)
+
+        assert (point.y_idx, point.x_idx) == (1, 2)
+        assert json.loads(source._grid_cache_path().read_text())["shape"] == [3, 3]
+
+    def test_concurrent_downloads_are_ordered_and_cleaned_up(self, tmp_path):
+        """Downloads share one client, months stay in order, temp files are removed."""
+        import shutil
+        import tempfile
+
+        from pvforecast.sources.base import WeatherSourceError
+
+        source = HOSTRADASource(latitude=51.83, longitude=7.28, show_progress=False)
+        originals = {}
+        for month in (1, 2):
+            for param in self.PARAMS:
+                path = _write_hostrada_file(
+                    tmp_path, source, param, 2024, month, hours=24, value=float(month)
+                )
+                originals[path.name] = path
+
+        temp_files = []
+        clients = set()
+
+        def fake_download(self, url, client):
+            clients.add(id(client))
+            name = url.rsplit("/", 1)[-1]
+            if name.startswith("sfcWind") and "202402" in name:
+                raise WeatherSourceError(f"HOSTRADA file not found: {url}")
+            with tempfile.NamedTemporaryFile(suffix=".nc", delete=False) as tmp:
+                temp_path = tmp.name
+            shutil.copy(originals[name], temp_path)
+            temp_files.append(Path(temp_path))
+            return Path(temp_path)
+
+        with patch.object(HOSTRADASource, "_download", fake_download):
+            df = source.fetch_historical(date(2024, 1, 1), date(2024, 2, 1))
+
+        assert len(clients) == 1
+        assert len(temp_files) == 9
+        assert not any(p.exists() for p in temp_files)
+        assert df["timestamp"].is_monotonic_increasing
+        assert list(df["ghi_wm2"]) == [1.0] * 24 + [2.0] * 24
+        # Fehlende Windgeschwindigkeit im Februar → NaN statt Abbruch
+        assert df["wind_speed_ms"].iloc[-24:].isna().all()
+
+    def test_pending_temp_files_are_bounded(self):
+        """Slow parsing does not let finished downloads pile up on disk."""
+        import tempfile
+        import threading
+        import time
+
+        from pvforecast.sources.hostrada import HOSTRADA_MAX_PENDING_FILES, _MonthlyData
+
+        source = HOSTRADASource(latitude=51.83, longitude=7.28, show_progress=False)
+        lock = threading.Lock()
+        temp_files = []
+        peak = 0
+
+        def fake_download(self, url, client):
+            nonlocal peak
+            with tempfile.NamedTemporaryFile(suffix=".nc", delete=False) as tmp:
+                path = Path(tmp.name)
+            with lock:
+                temp_files.append(path)
+                peak = max(peak, sum(p.exists() for p in temp_files))
+            return path
+
+        def slow_extract(self, file_path, var_name):
+            time.sleep(0.005)  # parsing slower than (instant) downloads
+            return _MonthlyData(
+                values=np.ones(1), times=np.array(["2024-01-01"], "datetime64[ns]"), units=""
+            )
+
+        with (
+            patch.object(HOSTRADASource, "_download", fake_download),
+            patch.object(HOSTRADASource, "_extract_from_file", slow_extract),
+        ):
+            source.fetch_historical(date(2024, 1, 1), date(2024, 12, 31))
+
+        assert len(temp_files) == 60  # 12 months x 5 parameters
+        assert peak <= HOSTRADA_MAX_PENDING_FILES
+        assert not any(p.exists() for p in temp_files)
+
+    def test_download_streams_to_temp_file(self, tmp_path):
+        """_download writes the body to a temp file; HTTP errors leave nothing behind."""
+        import httpx
+
+        from pvforecast.sources.base import WeatherSourceError
+
+        def handler(request):
+            if request.url.path.endswith("missing.nc"):
+                return httpx.Response(404)
+            return httpx.Response(200, content=b"netcdf-bytes")
+
+        source = HOSTRADASource(latitude=51.83, longitude=7.28, show_progress=False)
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            path = source._download("https://example.invalid/ok.nc", client)
+            try:
+                assert path.read_bytes() == b"netcdf-bytes"
+            finally:
+                path.unlink()
+
+            with patch("tempfile.tempdir", str(tmp_path)):
+                with pytest.raises(WeatherSourceError, match="not found"):
+                    source._download("https://example.invalid/missing.nc", client)
+        assert list(tmp_path.iterdir()) == []
+
+
 # =============================================================================
 # Integration Tests (require network, skip in CI)
 # =============================================================================